@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+
+import numpy as np
+
+from shapleypy._dtypes import missing_mask
+from shapleypy._typing import Player
+from shapleypy.coalition import coalition_sizes
+from shapleypy.constants import CHUNK_SIZE
+
+# Function from a chunk and its slice of the values array to prepared chunk
+Prepare = Callable[[np.ndarray, slice], np.ndarray]
+
+
+def number_of_players_of(values: np.ndarray) -> int:
+    """
+    Returns the number of players of a game from the array of its values.
+
+    Args:
+        values (np.ndarray): The values of all coalitions (last axis).
+
+    Returns:
+        int: The number of players.
+    """
+    return int(values.shape[-1]).bit_length() - 1
+
+
+def chunk_length(values: np.ndarray, chunk_size: int | None = None) -> int:
+    """
+    Returns the length of chunks in which the values are processed (power of
+    two no longer than the array). The chunks of arrays with leading axes
+    (e.g. batches of games) are shorter, so a chunk of all rows holds about
+    the requested number of values.
+
+    Args:
+        values (np.ndarray): The values of all coalitions (last axis).
+        chunk_size (int | None): The requested number of values in a chunk of
+            all rows (if None CHUNK_SIZE from constants will be used).
+
+    Returns:
+        int: The length of chunks.
+    """
+    if chunk_size is None:
+        chunk_size = CHUNK_SIZE
+    rows = max(1, values.size // values.shape[-1])
+    length = max(1, chunk_size // rows)
+    return min(1 << (length.bit_length() - 1), values.shape[-1])
+
+
+def number_of_blocks(values: np.ndarray, chunk_size: int | None = None) -> int:
+    """
+    Returns the number of chunks of the values of all coalitions.
+
+    Args:
+        values (np.ndarray): The values of all coalitions (last axis).
+        chunk_size (int | None): The requested length of chunks (if None
+            CHUNK_SIZE from constants will be used).
+
+    Returns:
+        int: The number of chunks.
+    """
+    return values.shape[-1] // chunk_length(values, chunk_size)
+
+
+def subcube_axes(sizes: np.ndarray) -> tuple[int, ...]:
+    """
+    Returns the axes of the views of iterate_subcubes indexed by coalitions
+    (the other axes are the leading axes of the values, e.g. the games of a
+    batch).
+
+    Args:
+        sizes (np.ndarray): The sizes of coalitions yielded with the views.
+
+    Returns:
+        tuple[int, ...]: The (negative) trailing axes of the views.
+    """
+    return tuple(range(-sizes.ndim, 0))
+
+
+def chunk_slices(
+    values: np.ndarray, chunk_size: int | None = None
+) -> Iterable[slice]:
+    """
+    Returns slices splitting the values of all coalitions into chunks.
+
+    Args:
+        values (np.ndarray): The values of all coalitions (last axis).
+        chunk_size (int | None): The requested length of chunks (if None
+            CHUNK_SIZE from constants will be used).
+
+    Yields:
+        slice: The slice of one chunk (chunks are aligned to their length).
+    """
+    length = chunk_length(values, chunk_size)
+    for start in range(0, values.shape[-1], length):
+        yield slice(start, start + length)
+
+
+def chunked_missing_mask(values: np.ndarray) -> tuple[np.ndarray, int]:
+    """
+    Computes the mask of missing values of all coalitions chunk by chunk (see
+    missing_mask) and the number of missing values.
+
+    Args:
+        values (np.ndarray): The values of all coalitions (last axis).
+
+    Returns:
+        tuple[np.ndarray, int]: The boolean array of the shape of the values,
+            True where the value is missing, and the number of missing values.
+    """
+    mask = np.empty(values.shape, dtype=bool)
+    for chunk in chunk_slices(values):
+        mask[..., chunk] = missing_mask(values[..., chunk])
+    return mask, int(np.count_nonzero(mask))
+
+
+def sizes_of_chunk(chunk_slice: slice) -> np.ndarray:
+    """
+    Returns the sizes of coalitions of a chunk of the values of all coalitions
+    (see chunk_slices), so the table of sizes of all coalitions is not needed.
+
+    Args:
+        chunk_slice (slice): The slice of the chunk (aligned to its length).
+
+    Returns:
+        np.ndarray: The sizes of the coalitions of the chunk (by position).
+    """
+    chunk_bits = (chunk_slice.stop - chunk_slice.start).bit_length() - 1
+    return coalition_sizes(chunk_bits) + bin(chunk_slice.start).count("1")
+
+
+def _subcube_shape(chunk_bits: int, players: Sequence[Player]) -> list[int]:
+    """
+    Returns the shape to which a chunk is reshaped so that each of given
+    players (all lower than chunk_bits) has its own axis of length two.
+
+    Args:
+        chunk_bits (int): The number of bits indexing the chunk.
+        players (Sequence[Player]): The players sorted in ascending order.
+
+    Returns:
+        list[int]: The shape of the reshaped chunk.
+    """
+    shape = []
+    previous = chunk_bits
+    for player in reversed(players):
+        shape += [1 << (previous - player - 1), 2]
+        previous = player
+    shape.append(1 << previous)
+    return shape
+
+
+def _subcube_view(
+    chunk: np.ndarray,
+    chunk_bits: int,
+    low_players: Sequence[Player],
+    low_subset: Iterable[Player],
+) -> np.ndarray:
+    """
+    Returns the view of a chunk with the values of coalitions S + T where S
+    does not contain any of the low players and T is the given subset of them.
+
+    Args:
+        chunk (np.ndarray): The chunk (last axis).
+        chunk_bits (int): The number of bits indexing the chunk.
+        low_players (Sequence[Player]): The players lower than chunk_bits
+            sorted in ascending order.
+        low_subset (Iterable[Player]): The subset T of the low players.
+
+    Returns:
+        np.ndarray: The view of the chunk.
+    """
+    shape = _subcube_shape(chunk_bits, low_players)
+    low_subset = set(low_subset)
+    index = tuple(
+        axis
+        for player in reversed(low_players)
+        for axis in (slice(None), int(player in low_subset))
+    )
+    return chunk.reshape(chunk.shape[:-1] + tuple(shape))[
+        (..., *index, slice(None))
+    ]
+
+
+def iterate_subcubes(
+    values: np.ndarray,
+    player_sets: Sequence[Sequence[Player]],
+    prepare: Prepare | None = None,
+    chunk_size: int | None = None,
+    blocks: Iterable[int] | None = None,
+) -> Iterable[tuple[int, np.ndarray, list[np.ndarray]]]:
+    """
+    Iterates over the values of a game in chunks and for each set of players
+    returns the values of coalitions S + T for all subsets T of the set (S not
+    containing any of the players from the set) as views of the chunks.
+
+    The array is processed chunk by chunk, so only a few chunks are in memory
+    at once (chunks with players above the chunk length are paired with the
+    chunks where these players are added). This is the way the values of games
+    stored in memory mapped files are processed.
+
+    Args:
+        values (np.ndarray): The values of all coalitions (last axis, other axes
+            are kept in the views).
+        player_sets (Sequence[Sequence[Player]]): The sets of players.
+        prepare (Prepare | None): The function applied to each chunk (with the
+            slice of the chunk) before it is used (e.g. setting default
+            values), if None chunks are used as they are.
+        chunk_size (int | None): The requested length of chunks (if None
+            CHUNK_SIZE from constants will be used).
+        blocks (Iterable[int] | None): The indices of chunks to process (if
+            None all chunks are processed).
+
+    Yields:
+        tuple[int, np.ndarray, list[np.ndarray]]: The index of the set of
+            players, the sizes of coalitions S and the views of the values of
+            coalitions S + T indexed by the bitmap of T (bit k of the index
+            stands for k-th player of the set).
+    """
+    length = chunk_length(values, chunk_size)
+    chunk_bits = length.bit_length() - 1
+    sizes_of_chunk = coalition_sizes(chunk_bits)
+    if blocks is None:
+        blocks = range(number_of_blocks(values, chunk_size))
+
+    for block in blocks:
+        start = block * length
+        loaded = {}
+        for index, players in enumerate(player_sets):
+            low_players = sorted(p for p in players if p < chunk_bits)
+            if any(start & (1 << p) for p in players if p >= chunk_bits):
+                continue
+
+            views = []
+            for subset in range(1 << len(players)):
+                members = [p for k, p in enumerate(players) if subset >> k & 1]
+                chunk_start = start + sum(
+                    1 << p for p in members if p >= chunk_bits
+                )
+                if chunk_start not in loaded:
+                    chunk_slice = slice(chunk_start, chunk_start + length)
+                    chunk = values[..., chunk_slice]
+                    loaded[chunk_start] = (
+                        chunk
+                        if prepare is None
+                        else prepare(chunk, chunk_slice)
+                    )
+                views.append(
+                    _subcube_view(
+                        loaded[chunk_start], chunk_bits, low_players, members
+                    )
+                )
+            sizes = _subcube_view(sizes_of_chunk, chunk_bits, low_players, [])
+            yield index, sizes + bin(start).count("1"), views
+            # Keep just the chunk of the block, the others are rarely reused
+            loaded = {start: loaded[start]} if start in loaded else {}
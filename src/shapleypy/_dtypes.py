@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Any
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from shapleypy._typing import Value
+from shapleypy.constants import (
+    INTEGER_DTYPE_VALUE_ERROR,
+    RATIONAL_DTYPE,
+    RATIONAL_GMPY2_ERROR,
+)
+
+try:
+    import gmpy2
+except ModuleNotFoundError:
+    gmpy2 = None
+
+
+def is_rational(dtype: DTypeLike) -> bool:
+    """
+    Checks if the dtype stands for exact rational values (gmpy2.mpq objects).
+
+    Args:
+        dtype (DTypeLike): The dtype to check.
+
+    Returns:
+        bool: True if the values are exact rationals, False otherwise.
+    """
+    return np.dtype(dtype) == RATIONAL_DTYPE
+
+
+def is_missing(value: Any) -> bool:
+    """
+    Checks if the value is missing (NaN is the only value not equal to itself,
+    so this works for floats as well as for rationals).
+
+    Args:
+        value (Any): The value to check.
+
+    Returns:
+        bool: True if the value is missing, False otherwise.
+    """
+    return bool(value != value)  # noqa: PLR0124
+
+
+def missing_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Returns the mask of missing values of an array (of any dtype).
+
+    Args:
+        values (np.ndarray): The values to check.
+
+    Returns:
+        np.ndarray: The boolean array, True where the value is missing.
+    """
+    if np.issubdtype(values.dtype, np.integer):
+        return np.zeros(values.shape, dtype=bool)
+    if np.issubdtype(values.dtype, np.floating):
+        return np.isnan(values)
+    return np.asarray(values != values, dtype=bool)  # noqa: PLR0124
+
+
+def convert_value(value: Any, dtype: DTypeLike) -> Any:
+    """
+    Converts the value (number or string) to be stored in an array of given
+    dtype.
+
+    Args:
+        value (Any): The value to convert (strings can be also fractions like
+            "1/3").
+        dtype (DTypeLike): The dtype of the array.
+
+    Returns:
+        Any: The converted value (gmpy2.mpq for rational dtype, missing values
+            are kept as NaN).
+
+    Raises:
+        ImportError: If the dtype is rational and gmpy2 is not available.
+        ValueError: If the dtype is integer and the value is missing or not
+            an integer.
+    """
+    if is_rational(dtype):
+        if gmpy2 is None:
+            raise ImportError(RATIONAL_GMPY2_ERROR)
+        if isinstance(value, np.integer):
+            value = int(value)
+        elif isinstance(value, np.floating):
+            value = float(value)
+        if is_missing(value):
+            return np.nan
+        return gmpy2.mpq(value)
+    if isinstance(value, str):
+        value = float(Fraction(value)) if "/" in value else float(value)
+    if np.issubdtype(dtype, np.integer) and (
+        is_missing(value) or value % 1 != 0
+    ):
+        raise ValueError(INTEGER_DTYPE_VALUE_ERROR)
+    return np.dtype(dtype).type(value)
+
+
+def convert_values(values: Any, dtype: DTypeLike) -> np.ndarray:
+    """
+    Converts the values (array or sequence of numbers or strings) to an array
+    of given dtype.
+
+    Args:
+        values (Any): The values to convert (see convert_value).
+        dtype (DTypeLike): The dtype of the array.
+
+    Returns:
+        np.ndarray: The converted values.
+
+    Raises:
+        ImportError: If the dtype is rational and gmpy2 is not available.
+        ValueError: If the dtype is integer and some value is missing or not
+            an integer.
+    """
+    array = np.asarray(values)
+    if not is_rational(dtype) and array.dtype.kind in "US":
+        try:
+            # Plain numbers are parsed by numpy at once
+            return array.astype(dtype)
+        except ValueError:
+            pass
+    if is_rational(dtype) or array.dtype.kind in "OUS":
+        converted = np.empty(array.shape, dtype=dtype)
+        for index, value in np.ndenumerate(array):
+            converted[index] = convert_value(value, dtype)
+        return converted
+    if (
+        np.issubdtype(dtype, np.integer)
+        and array.dtype.kind == "f"
+        and np.any(np.isnan(array) | (np.mod(array, 1) != 0))
+    ):
+        raise ValueError(INTEGER_DTYPE_VALUE_ERROR)
+    return array.astype(dtype, copy=False)
+
+
+def computation_dtype(dtype: DTypeLike) -> np.dtype:
+    """
+    Returns the dtype in which solution concepts are computed for games with
+    values of given dtype (rationals stay exact, everything else is computed in
+    Value).
+
+    Args:
+        dtype (DTypeLike): The dtype of values of the game.
+
+    Returns:
+        np.dtype: The dtype of the computation.
+    """
+    return RATIONAL_DTYPE if is_rational(dtype) else np.dtype(Value)
+
+
+def result_dtype(dtype: DTypeLike) -> np.dtype:
+    """
+    Returns the dtype of results of solution concepts for games with values of
+    given dtype (floats and rationals are kept, integers give Value).
+
+    Args:
+        dtype (DTypeLike): The dtype of values of the game.
+
+    Returns:
+        np.dtype: The dtype of the results.
+    """
+    if np.issubdtype(dtype, np.floating):
+        return np.dtype(dtype)
+    return computation_dtype(dtype)
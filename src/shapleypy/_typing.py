@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 from typing import Union
 
 import numpy as np
@@ -11,3 +11,12 @@ Players = Iterable[Player]
 
 Value = np.float64
 ValueInput = Union[Value, float]
+# Values set to games can be also strings of numbers or fractions (e.g. "1/3",
+# exact for rational games)
+GameValueInput = Union[ValueInput, str]
+
+# Function from the ID (bitmap) of a coalition to its value
+ValueOracle = Callable[[int], ValueInput]
+
+# Function from an array of IDs (bitmaps) of coalitions to their values
+ValueBatchOracle = Callable[[np.ndarray], np.ndarray]
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from shapleypy._chunked import iterate_subcubes, subcube_axes
+from shapleypy._dtypes import computation_dtype, convert_values, result_dtype
+from shapleypy._typing import ValueInput
+from shapleypy.classes_checkers import _as_result
+from shapleypy.coalition import player_memberships
+from shapleypy.constants import (
+    ANALYSIS_OUTPUT_ERROR,
+    ANALYSIS_PAYOFF_VECTORS_ERROR,
+)
+from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+from shapleypy.solution_concept._default_value import default_value_preparer
+from shapleypy.solution_concept.semivalue import (
+    BANZHAF,
+    SHAPLEY,
+    semivalue_weights,
+)
+from shapleypy.transforms import _transform_across_chunks, _transform_chunk
+
+# Outputs of analyze, the semivalues, the Harsanyi dividends, the core
+# membership of given payoff vectors and the class flags
+SEMIVALUES = {"shapley": SHAPLEY, "banzhaf": BANZHAF}
+OUTPUTS = (
+    *SEMIVALUES,
+    "dividends",
+    "core",
+    "monotone",
+    "weakly_superadditive",
+    "convex",
+    "positive",
+)
+
+
+def _payoffs_of_coalitions(
+    payoff_vectors: np.ndarray,
+    coalition_ids: np.ndarray,
+    number_of_players: int,
+) -> np.ndarray:
+    """
+    Get the payoffs x(S) of coalitions S for all payoff vectors (the sums of
+    the payoffs of the members of S).
+
+    Args:
+        payoff_vectors (np.ndarray): The payoff vectors (a row per vector).
+        coalition_ids (np.ndarray): The IDs (bitmaps) of the coalitions (1-D).
+        number_of_players (int): The number of players.
+
+    Returns:
+        np.ndarray: The payoffs of shape (number of vectors, number of IDs).
+    """
+    memberships = player_memberships(coalition_ids, number_of_players)
+    # One product instead of a (vectors, coalitions, players) temporary
+    return payoff_vectors @ memberships.T.astype(payoff_vectors.dtype)
+
+
+def analyze(
+    game: Game | GamesBatch,
+    outputs: Iterable[str],
+    payoff_vectors: ArrayLike | None = None,
+    default_value: ValueInput | None = None,
+    tolerance: float = 1e-5,
+) -> dict[str, Any]:
+    """
+    Compute several solution concepts and class flags of a game in one
+    streaming pass over its values (instead of a pass per function).
+
+    Each chunk of values is read and prepared (missing values set to the
+    default value) once per pass, the Shapley and Banzhaf values and the
+    monotonicity and weak superadditivity flags are computed from the same
+    views of marginal contributions (see iterate_subcubes), the convexity
+    flag from the views of pairs of players, the core membership from the
+    payoffs of coalitions of each chunk. The Harsanyi dividends are
+    transformed chunk by chunk into a new array while it is read, just the
+    players above the chunk length are transformed afterwards (positivity is
+    given by the dividends). As in classes_checkers and harsanyi_dividends,
+    the class flags and the dividends are given by the values as they are
+    (the missing values are not set to the default value), the raw chunks
+    are stacked to the prepared ones if they differ.
+
+    Args:
+        game (Game | GamesBatch): The game (or batch of games, the results
+            have a row or an item per game).
+        outputs (Iterable[str]): The requested outputs (see OUTPUTS):
+            "shapley", "banzhaf" (values of all players), "dividends" (of all
+            coalitions), "core" (whether the payoff vectors are in the core,
+            see solution_in_core), "monotone", "weakly_superadditive",
+            "convex" and "positive" (see classes_checkers).
+        payoff_vectors (ArrayLike | None): The payoff vectors whose core
+            membership is checked (a row per vector, needed for "core").
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        tolerance (float): The tolerance for the convexity check (floating
+            arithmetric).
+
+    Returns:
+        dict[str, Any]: The requested outputs by their names, the values and
+            the dividends as arrays, the core membership as a boolean array
+            (an item per vector) and the flags as booleans (boolean arrays
+            for a batch).
+
+    Raises:
+        ValueError: If an output is unknown or "core" is requested without
+            payoff vectors.
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    requested = list(outputs)
+    if not set(requested) <= set(OUTPUTS):
+        raise ValueError(ANALYSIS_OUTPUT_ERROR)
+    if "core" in requested and payoff_vectors is None:
+        raise ValueError(ANALYSIS_PAYOFF_VECTORS_ERROR)
+
+    n = game.number_of_players
+    dtype = computation_dtype(game.dtype)
+    values = game._all_values()
+    leading = values.shape[:-1]
+    semivalues = [name for name in requested if name in SEMIVALUES]
+    core = "core" in requested
+    monotone = "monotone" in requested
+    weakly_superadditive = "weakly_superadditive" in requested
+    convex = "convex" in requested
+    # The default value is used just by the semivalues and the core, the
+    # flags need the raw chunks too if some values are missing
+    prepare = None
+    if semivalues or core:
+        prepare = default_value_preparer(game, dtype, default_value, values)
+    stack_raw = (
+        prepare is not None
+        and (monotone or weakly_superadditive or convex)
+        and game._missing_values(values)[1] > 0
+    )
+
+    weights = [
+        semivalue_weights(SEMIVALUES[name], n, dtype) for name in semivalues
+    ]
+    payoffs = np.zeros((*leading, len(semivalues), n), dtype=dtype)
+    if weakly_superadditive:
+        values_of_singletons = game._evaluate(1 << np.arange(n))
+    player_sets: list[tuple[int, ...]] = (
+        [(i,) for i in range(n)]
+        if semivalues or monotone or weakly_superadditive
+        else [()]
+    )
+    singles = len(player_sets)
+    if convex:
+        player_sets += [(i, j) for i in range(n - 1) for j in range(i + 1, n)]
+    violated = {
+        flag: np.zeros(leading, dtype=bool)
+        for flag in ("monotone", "weakly_superadditive", "convex")
+    }
+
+    if core:
+        vectors = np.atleast_2d(convert_values(payoff_vectors, dtype))
+        outside_core = np.zeros((*leading, len(vectors)), dtype=bool)
+    dividends = None
+    if "dividends" in requested or "positive" in requested:
+        dividends = np.empty(values.shape, dtype=result_dtype(game.dtype))
+    seen: set[int] = set()
+
+    def prepare_chunk(chunk: np.ndarray, chunk_slice: slice) -> np.ndarray:
+        prepared = chunk if prepare is None else prepare(chunk, chunk_slice)
+        # The raw chunk (first) and the prepared chunk (second) for the flags
+        result = (
+            np.stack((np.array(chunk, dtype=dtype), prepared))
+            if stack_raw
+            else prepared
+        )
+        start = chunk_slice.start
+        if start in seen:
+            return result
+        seen.add(start)
+        if core:
+            chunk_payoffs = _payoffs_of_coalitions(
+                vectors,
+                np.arange(start, chunk_slice.stop, dtype=np.uint32),
+                n,
+            )
+            outside_core[...] |= np.any(
+                chunk_payoffs < prepared[..., None, :], axis=-1
+            )
+            if chunk_slice.stop == values.shape[-1]:
+                outside_core[...] |= (
+                    vectors.sum(axis=-1) != prepared[..., None, -1]
+                )
+        if dividends is not None:
+            dividends[..., chunk_slice] = _transform_chunk(
+                np.array(chunk, dtype=dividends.dtype), np.subtract
+            )
+        return result
+
+    for index, sizes, chunk_views in iterate_subcubes(
+        values, player_sets, prepare_chunk
+    ):
+        axes = subcube_axes(sizes)
+        views = raw_views = chunk_views
+        if stack_raw:
+            raw_views = [view[0] for view in chunk_views]
+            views = [view[1] for view in chunk_views]
+        if index >= singles:
+            without_i_j, with_i, with_j, with_i_j = raw_views
+            violated["convex"] |= np.any(
+                tolerance + with_i_j - with_i < with_j - without_i_j,
+                axis=axes,
+            )
+            continue
+        if len(views) == 1:
+            continue
+        without_i, with_i = views
+        differences = with_i - without_i
+        for row, (row_weights, _) in enumerate(weights):
+            payoffs[..., row, index] += np.sum(
+                differences * row_weights[sizes], axis=axes
+            )
+        without_i, with_i = raw_views
+        if monotone:
+            violated["monotone"] |= np.any(with_i < without_i, axis=axes)
+        if weakly_superadditive:
+            value_of_i = values_of_singletons[
+                (..., index) + (None,) * sizes.ndim
+            ]
+            violated["weakly_superadditive"] |= np.any(
+                without_i + value_of_i > with_i, axis=axes
+            )
+
+    results: dict[str, Any] = {}
+    for row, (name, (_, divisor)) in enumerate(zip(semivalues, weights)):
+        results[name] = (payoffs[..., row, :] / divisor).astype(
+            result_dtype(game.dtype), copy=False
+        )
+    if dividends is not None:
+        _transform_across_chunks(dividends, np.subtract, None)
+        if "dividends" in requested:
+            results["dividends"] = dividends
+        if "positive" in requested:
+            results["positive"] = _as_result(
+                game, ~np.any(dividends < 0, axis=-1)
+            )
+    if core:
+        results["core"] = ~outside_core
+    for flag, flag_violated in violated.items():
+        if flag in requested:
+            results[flag] = _as_result(game, ~flag_violated)
+    return results
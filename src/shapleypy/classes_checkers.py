@@ -2,224 +2,307 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from typing import Any
 
-from shapleypy.coalition import (
-    EMPTY_COALITION,
-    Coalition,
-    all_one_player_missing_subcoalitions,
+import numpy as np
+
+from shapleypy._chunked import (
+    chunk_slices,
+    iterate_subcubes,
+    sizes_of_chunk,
+    subcube_axes,
 )
+from shapleypy.coalition import Coalition
 from shapleypy.constants import K_GAMES_PARAMETER
 from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+from shapleypy.transforms import harsanyi_dividends
 
 
-def _determine_k_for_k_game(game: Game) -> int:
+def _as_result(game: Game | GamesBatch, results: np.ndarray) -> Any:
     """
-    Determines the k parameter for a k-game.
+    Converts the results of a check of all games to the result of the check
+    function (the item for a game, the array for a batch).
 
     Args:
-        game (Game): The game to determine the k parameter for.
+        game (Game | GamesBatch): The checked game or batch of games.
+        results (np.ndarray): The results (one per game of a batch).
 
     Returns:
-        int: The determined k parameter.
-    """
-    for k in range(1, game.number_of_players + 1):
-        if not all(
-            game.get_value(S) == 0
-            for S in filter(lambda s: len(s) == k, game.all_coalitions)
-        ):
-            return k
-    # In case of zero game return number_of_players
-    return k
+        Any: The item of the results for a game, the results for a batch.
+    """
+    if isinstance(game, GamesBatch):
+        return results
+    return results.item()
 
 
-def check_monotonicity(game: Game) -> bool:
+def _determine_k_for_k_game(game: Game | GamesBatch) -> np.ndarray:
     """
-    Check if the game is monotone.
+    Determines the k parameter for a k-game.
 
     Args:
-        game (Game): The game to check.
+        game (Game | GamesBatch): The game (or batch of games) to determine
+            the k parameter for.
 
     Returns:
-        bool: True if the game is monotone, False otherwise.
+        np.ndarray: The determined k parameter (one per game of a batch).
     """
-    for S in game.all_coalitions:
-        # Check the values of all subcoalitions of size |S| - 1
-        value_of_S = game.get_value(S)
-        for S_minus_one in all_one_player_missing_subcoalitions(S):
-            if value_of_S < game.get_value(S_minus_one):
-                return False
-    return True
+    values_shape = game._all_values().shape[:-1]
+    k = np.full(values_shape, game.number_of_players)
+    undetermined = np.ones(values_shape, dtype=bool)
+    for size in range(1, game.number_of_players + 1):
+        ids = Coalition.all_coalition_ids_of_size(game.number_of_players, size)
+        nonzero = np.any(game._evaluate(ids) != 0, axis=-1)
+        k[undetermined & nonzero] = size
+        undetermined &= ~nonzero
+        if not undetermined.any():
+            break
+    # In case of zero game number_of_players stays
+    return k
 
 
-def check_weakly_superadditivity(game: Game) -> bool:
+def check_monotonicity(game: Game | GamesBatch) -> bool | np.ndarray:
     """
-    Check if the game is weakly superadditive.
+    Check if the game is monotone.
 
     Args:
-        game (Game): The game to check.
+        game (Game | GamesBatch): The game (or batch of games) to check.
 
     Returns:
-        bool: True if the game is weakly superadditive, False otherwise.
+        bool | np.ndarray: True if the game is monotone, False otherwise (the
+            boolean array with a result per game for a batch).
     """
-    grand_coalition = Coalition.grand_coalition(game.number_of_players)
-    for i in range(game.number_of_players):
-        value_of_i = game.get_value([i])
-        for S in (grand_coalition - i).all_subcoalitions():
-            if game.get_value(S) + value_of_i > game.get_value(S + i):
-                return False
-    return True
+    values = game._all_values()
+    violated = np.zeros(values.shape[:-1], dtype=bool)
+    # Compare the values of S and S + i for all players i not in S
+    for _, sizes, (without_i, with_i) in iterate_subcubes(
+        values, [(i,) for i in range(game.number_of_players)]
+    ):
+        violated |= np.any(with_i < without_i, axis=subcube_axes(sizes))
+        if violated.all():
+            break
+    return _as_result(game, ~violated)
+
+
+def check_weakly_superadditivity(game: Game | GamesBatch) -> bool | np.ndarray:
+    """
+    Check if the game is weakly superadditive.
 
+    Args:
+        game (Game | GamesBatch): The game (or batch of games) to check.
 
-def check_superadditivity(game: Game) -> bool:
+    Returns:
+        bool | np.ndarray: True if the game is weakly superadditive, False
+            otherwise (the boolean array with a result per game for a batch).
+    """
+    values = game._all_values()
+    values_of_singletons = game._evaluate(
+        1 << np.arange(game.number_of_players)
+    )
+    violated = np.zeros(values.shape[:-1], dtype=bool)
+    for i, sizes, (without_i, with_i) in iterate_subcubes(
+        values, [(i,) for i in range(game.number_of_players)]
+    ):
+        value_of_i = values_of_singletons[(..., i) + (None,) * sizes.ndim]
+        violated |= np.any(
+            without_i + value_of_i > with_i, axis=subcube_axes(sizes)
+        )
+        if violated.all():
+            break
+    return _as_result(game, ~violated)
+
+
+def check_superadditivity(game: Game | GamesBatch) -> bool | np.ndarray:
     """
     Check if the game is superadditive.
 
     Args:
-        game (Game): The game to check.
+        game (Game | GamesBatch): The game (or batch of games) to check.
 
     Returns:
-        bool: True if the game is superadditive, False otherwise.
+        bool | np.ndarray: True if the game is superadditive, False otherwise
+            (the boolean array with a result per game for a batch).
     """
-    for T in game.all_coalitions:
-        value_of_T = game.get_value(T)
-        for S in filter(
-            lambda s: T * s == EMPTY_COALITION, game.all_coalitions
-        ):
-            if value_of_T + game.get_value(S) > game.get_value(T + S):
-                return False
-    return True
-
-
-def check_convexity(game: Game, tolerance: float = 1e-5) -> bool:
+    values = game._all_values()
+    violated = np.zeros(values.shape[:-1], dtype=bool)
+    grand_coalition = Coalition.grand_coalition(game.number_of_players)
+    for T in Coalition.all_coalitions(game.number_of_players):
+        # The coalitions disjoint with T are the subcoalitions of N - T
+        S = (grand_coalition - T).all_subcoalition_ids()
+        violated |= np.any(
+            values[..., [T.id]] + values[..., S] > values[..., S | T.id],
+            axis=-1,
+        )
+        if violated.all():
+            break
+    return _as_result(game, ~violated)
+
+
+def check_convexity(
+    game: Game | GamesBatch, tolerance: float = 1e-5
+) -> bool | np.ndarray:
     """
     Check if the game is convex (supermodular).
 
     Args:
-        game (Game): The game to check.
+        game (Game | GamesBatch): The game (or batch of games) to check.
         tolerance (float): The tolerance for the check (floating arithmetric).
 
     Returns:
-        bool: True if the game is convex, False otherwise.
+        bool | np.ndarray: True if the game is convex, False otherwise (the
+            boolean array with a result per game for a batch).
     """
-    grand_coalition = Coalition.grand_coalition(game.number_of_players)
     # We can use just i < j, because it the condition is symmetric
     # (if we exchange i and j, we get the same condition)
-    for i in range(game.number_of_players - 1):
-        grand_coalition_without_i = grand_coalition - i
-        for j in range(i + 1, game.number_of_players):
-            for S in (grand_coalition_without_i - j).all_subcoalitions():
-                if tolerance + game.get_value((S + i) + j) - game.get_value(
-                    S + i
-                ) < game.get_value(S + j) - game.get_value(S):
-                    return False
-    return True
-
-
-def check_supermodularity(game: Game) -> bool:
+    pairs = [
+        (i, j)
+        for i in range(game.number_of_players - 1)
+        for j in range(i + 1, game.number_of_players)
+    ]
+    values = game._all_values()
+    violated = np.zeros(values.shape[:-1], dtype=bool)
+    for _, sizes, (without_i_j, with_i, with_j, with_i_j) in iterate_subcubes(
+        values, pairs
+    ):
+        violated |= np.any(
+            tolerance + with_i_j - with_i < with_j - without_i_j,
+            axis=subcube_axes(sizes),
+        )
+        if violated.all():
+            break
+    return _as_result(game, ~violated)
+
+
+def check_supermodularity(game: Game | GamesBatch) -> bool | np.ndarray:
     """
     Check if the game is convex (supermodular).
 
     Args:
-        game (Game): The game to check.
+        game (Game | GamesBatch): The game (or batch of games) to check.
 
     Returns:
-        bool: True if the game is convex, False otherwise.
+        bool | np.ndarray: True if the game is convex, False otherwise (the
+            boolean array with a result per game for a batch).
     """
     return check_convexity(game)
 
 
-def check_positivity(game: Game) -> bool:
+def check_positivity(game: Game | GamesBatch) -> bool | np.ndarray:
     """
-    Check if the game is positive.
+    Check if the game is positive (all Harsanyi dividends are non-negative).
 
     Args:
-        game (Game): The game to check.
+        game (Game | GamesBatch): The game (or batch of games) to check.
 
     Returns:
-        bool: True if the game is positive, False otherwise.
+        bool | np.ndarray: True if the game is positive, False otherwise (the
+            boolean array with a result per game for a batch).
     """
-    for S in game.all_coalitions:
-        m_S = 0
-        size_of_S = len(S)
-        for T in S.all_subcoalitions():
-            m_S += (-1) ** (size_of_S - len(T)) * game.get_value(T)
-        if m_S < 0:
-            return False
-    return True
+    dividends = harsanyi_dividends(game)
+    negative = np.zeros(dividends.shape[:-1], dtype=bool)
+    for chunk in chunk_slices(dividends):
+        negative |= np.any(dividends[..., chunk] < 0, axis=-1)
+    return _as_result(game, ~negative)
 
 
-def check_k_game(
-    game: Game, k: int | None = None, epsilon: float = 1e-10
-) -> bool:
+def _dividends_vanish_above(
+    game: Game | GamesBatch, k: int | np.ndarray, epsilon: float
+) -> np.ndarray:
     """
-    Check if the game is a k-game.
+    Checks that the Harsanyi dividends of coalitions larger than k are zero.
 
     Args:
-        game (Game): The game to check.
-        k (int): The parameter k for the k-game. If None, it will be determined,
-            but takes some computation time.
+        game (Game | GamesBatch): The game (or batch of games) to check.
+        k (int | np.ndarray): The parameter k (one per game of a batch).
+        epsilon (float): The tolerance for the check (floating arithmetric).
 
     Returns:
-        bool: True if the game is a k-game, False otherwise.
+        np.ndarray: The results (one per game of a batch).
     """
-    if k is None:
-        k = _determine_k_for_k_game(game)
+    dividends = harsanyi_dividends(game)
+    vanish = np.ones(dividends.shape[:-1], dtype=bool)
+    for chunk in chunk_slices(dividends):
+        larger = sizes_of_chunk(chunk) > np.expand_dims(k, -1)
+        chunk_dividends = dividends[..., chunk]
+        vanish &= np.all(
+            ((-epsilon <= chunk_dividends) & (chunk_dividends <= epsilon))
+            | ~larger,
+            axis=-1,
+        )
+    return vanish
 
-    if not 0 < k <= game.number_of_players:
-        raise ValueError(K_GAMES_PARAMETER)
 
-    for S in filter(lambda s: len(s) != k, game.all_coalitions):
-        if len(S) < k:
-            if game.get_value(S) != 0:
-                return False
-        else:
-            d_S = 0
-            size_of_S = len(S)
-            for T in S.all_subcoalitions():
-                d_S += (-1) ** (size_of_S - len(T)) * game.get_value(T)
-            if not 0 - epsilon <= d_S <= 0 + epsilon:
-                return False
-    return True
+def check_k_game(
+    game: Game | GamesBatch, k: int | None = None, epsilon: float = 1e-10
+) -> bool | np.ndarray:
+    """
+    Check if the game is a k-game.
 
+    Args:
+        game (Game | GamesBatch): The game (or batch of games) to check.
+        k (int): The parameter k for the k-game. If None, it will be determined
+            (for each game of a batch), but takes some computation time.
 
-def check_k_additivity(game: Game, k: int, epsilon: float = 1e-10) -> bool:
+    Returns:
+        bool | np.ndarray: True if the game is a k-game, False otherwise (the
+            boolean array with a result per game for a batch).
+    """
+    if k is not None and not 0 < k <= game.number_of_players:
+        raise ValueError(K_GAMES_PARAMETER)
+    ks = _determine_k_for_k_game(game) if k is None else np.asarray(k)
+
+    # Coalitions smaller than k have zero value, larger zero dividend
+    values = game._all_values()
+    values_of_smaller = np.zeros(values.shape[:-1], dtype=bool)
+    for chunk in chunk_slices(values):
+        smaller = sizes_of_chunk(chunk) < np.expand_dims(ks, -1)
+        values_of_smaller |= np.any(
+            (values[..., chunk] != 0) & smaller, axis=-1
+        )
+    return _as_result(
+        game, ~values_of_smaller & _dividends_vanish_above(game, ks, epsilon)
+    )
+
+
+def check_k_additivity(
+    game: Game | GamesBatch, k: int, epsilon: float = 1e-10
+) -> bool | np.ndarray:
     """
     Check if the game is k-additive.
 
     Args:
-        game (Game): The game to check.
+        game (Game | GamesBatch): The game (or batch of games) to check.
         k (int): The parameter k for the k-additive game.
         epsilon (float): The tolerance for the check (floating arithmetric).
 
     Returns:
-        bool: True if the game is k-additive, False otherwise.
+        bool | np.ndarray: True if the game is k-additive, False otherwise (the
+            boolean array with a result per game for a batch).
     """
     if not 0 < k <= game.number_of_players:
         raise ValueError(K_GAMES_PARAMETER)
 
-    for S in filter(lambda s: len(s) > k, game.all_coalitions):
-        d_S = 0
-        size_of_S = len(S)
-        for T in S.all_subcoalitions():
-            d_S += (-1) ** (size_of_S - len(T)) * game.get_value(T)
-        if not 0 - epsilon <= d_S <= 0 + epsilon:
-            return False
-    return True
+    # Coalitions larger than k have zero dividend
+    return _as_result(game, _dividends_vanish_above(game, k, epsilon))
 
 
-def determine_class(game: Game) -> str:
+def determine_class(game: Game | GamesBatch) -> str | np.ndarray:
     """
     Determine the class of the game from standart hierarchy.
 
     Args:
-        game (Game): The game to determine the class for.
+        game (Game | GamesBatch): The game (or batch of games) to determine
+            the class for.
 
     Returns:
-        str: The class of the game (just the highest the game belongs to).
+        str | np.ndarray: The class of the game (just the highest the game
+            belongs to, the array of classes of games for a batch).
             (Positive, convex, superadditive, weakly superadditive, monotone,
             none)
     """
-    checks: list[tuple[str, Callable[[Game], bool]]] = [
+    checks: list[
+        tuple[str, Callable[[Game | GamesBatch], bool | np.ndarray]]
+    ] = [
         ("Positive", check_positivity),
         ("Convex", check_convexity),
         ("Superadditive", check_superadditivity),
@@ -227,8 +310,13 @@ def determine_class(game: Game) -> str:
         ("Monotone", check_monotonicity),
     ]
 
+    shape = game._all_values().shape[:-1]
+    classes = np.full(shape, "None", dtype=object)
+    undetermined = np.ones(shape, dtype=bool)
     for cls, check_func in checks:
-        if check_func(game):
-            return cls
-
-    return "None"
+        belongs = undetermined & check_func(game)
+        classes[belongs] = cls
+        undetermined &= ~belongs
+        if not undetermined.any():
+            break
+    return _as_result(game, classes)
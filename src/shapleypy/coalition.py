@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Any
 
 import numpy as np
 
 from shapleypy._typing import Player, Players
 from shapleypy.constants import (
+    COALITION_INTERNING_LIMIT,
     COALITION_NUMBER_OF_PLAYERS_ERROR,
     MAX_PLAYER,
     MAXIMUM_NUMBER_OF_PLAYERS,
@@ -18,8 +21,12 @@ class Coalition:
     """
     Represents a coalition of players in a game.
 
+    Coalitions with IDs below COALITION_INTERNING_LIMIT from constants are
+    interned (the same object is returned for the same ID), so coalitions
+    must not be modified.
+
     Attributes:
-        id (np.uint32): The ID of the coalition.
+        id (int): The ID (bitmap) of the coalition.
 
     Methods:
         from_players: Creates a coalition from a list of players.
@@ -28,24 +35,49 @@ class Coalition:
             players.
         all_subcoalitions: Returns an iterator of all subcoalitions of the
             coalition.
+        all_subcoalition_ids: Returns the array of IDs of all subcoalitions of
+            the coalition.
         all_coalitions: Returns an iterator of all coalitions with a specified
             number of players.
+        all_coalitions_of_size: Returns an iterator of all coalitions of
+            a given size (or of at most the given size).
+        all_coalition_ids_of_size: Returns the array of IDs of all coalitions
+            of a given size (or of at most the given size).
     """
 
-    def __init__(self, id: int | np.uint32) -> None:
+    __slots__ = ("id",)
+
+    id: int
+
+    def __new__(cls, id: int | np.integer) -> Coalition:
         """
-        Initialize a Coalition object with the given ID.
+        Creates a Coalition object with the given ID (or returns the interned
+        one).
 
         Args:
-            id (int | np.uint32): The ID (bitmap) of the coalition.
+            id (int | np.integer): The ID (bitmap) of the coalition.
 
         Returns:
-            None
+            Coalition: The coalition with the ID.
         """
-        if isinstance(id, int):
-            self.id = np.uint32(id)
-        elif isinstance(id, np.uint32):
-            self.id = id
+        id = int(id)
+        coalition = _interned_coalitions.get(id)
+        if coalition is None:
+            coalition = object.__new__(cls)
+            coalition.id = id
+            if id < COALITION_INTERNING_LIMIT:
+                _interned_coalitions[id] = coalition
+        return coalition
+
+    def __reduce__(self) -> tuple[type[Coalition], tuple[int]]:
+        """
+        Returns the data to pickle the coalition (unpickled coalitions are
+        interned as well).
+
+        Returns:
+            tuple[type[Coalition], tuple[int]]: The class and its argument.
+        """
+        return (Coalition, (self.id,))
 
     def __repr__(self) -> str:
         """
@@ -68,12 +100,15 @@ class Coalition:
 
     def __len__(self) -> int:
         """
-        Returns the number of players in the coalition.
+        Returns the number of players in the coalition (by the table of sizes
+        of 16-bit halves of the ID).
 
         Returns:
             int: The number of players in the coalition.
         """
-        return bin(self.id).count("1")
+        return (
+            _SIZES_OF_HALVES[self.id & 0xFFFF] + _SIZES_OF_HALVES[self.id >> 16]
+        )
 
     def __eq__(self, other: object) -> bool:
         """
@@ -256,14 +291,12 @@ class Coalition:
         Yields:
             int: The player numbers in the coalition.
         """
-        bit_map = int(self.id)
-        index = 0
+        bit_map = self.id
 
         while bit_map:
-            if bit_map & 1:
-                yield index
-            bit_map >>= 1
-            index += 1
+            lowest_bit = bit_map & -bit_map
+            yield lowest_bit.bit_length() - 1
+            bit_map ^= lowest_bit
 
     @staticmethod
     def grand_coalition(n_players: int) -> Coalition:
@@ -286,16 +319,50 @@ class Coalition:
             raise ValueError(COALITION_NUMBER_OF_PLAYERS_ERROR)
         return Coalition((1 << n_players) - 1)
 
-    def all_subcoalitions(self) -> Iterable[Coalition]:
+    def all_subcoalitions(
+        self, *, include_empty: bool = False
+    ) -> Iterable[Coalition]:
         """
-        Returns an iterator of all subcoalitions of the coalition.
+        Returns an iterator of all subcoalitions of the coalition in ascending
+        order of IDs (O(2^len(coalition)), just the submasks are visited).
+
+        Args:
+            include_empty (bool): If True, the empty coalition is the first
+                subcoalition.
 
         Yields:
             Coalition: The subcoalitions of the coalition.
         """
-        for i in range(1, self.id + 1):
-            if self.id & i == i:
-                yield Coalition(i)
+        coalition_id = self.id
+        if include_empty:
+            yield Coalition(0)
+        # (s - S) & S is the next submask of S after s in ascending order
+        subcoalition_id = -coalition_id & coalition_id
+        while subcoalition_id:
+            yield Coalition(subcoalition_id)
+            subcoalition_id = (subcoalition_id - coalition_id) & coalition_id
+
+    def all_subcoalition_ids(
+        self, *, include_empty: bool = False
+    ) -> np.ndarray:
+        """
+        Returns the IDs (bitmaps) of all subcoalitions of the coalition at once
+        (in ascending order as all_subcoalitions).
+
+        Args:
+            include_empty (bool): If True, the empty coalition is the first
+                subcoalition.
+
+        Returns:
+            np.ndarray: The IDs of the subcoalitions (np.uint32).
+        """
+        players = list(self.get_players)
+        subsets = np.arange(0 if include_empty else 1, 1 << len(players))
+        ids = np.zeros(len(subsets), dtype=np.uint32)
+        # Bit k of the subset is moved to the bit of k-th player
+        for k, player in enumerate(players):
+            ids |= ((subsets >> k & 1) << player).astype(np.uint32)
+        return ids
 
     @staticmethod
     def all_coalitions(n_players: int) -> Iterable[Coalition]:
@@ -314,6 +381,85 @@ class Coalition:
         """
         return Coalition.grand_coalition(n_players).all_subcoalitions()
 
+    @staticmethod
+    def all_coalitions_of_size(
+        n_players: int, size: int, *, at_most: bool = False
+    ) -> Iterable[Coalition]:
+        """
+        Returns an iterator of all coalitions of the given size with
+        a specified number of players (just these coalitions are visited, in
+        ascending order of IDs by Gosper's hack).
+
+        Args:
+            n_players (int): The number of players.
+            size (int): The number of players in the coalitions.
+            at_most (bool): If True, the coalitions of sizes 1 to size are
+                returned (size by size), as in all_coalitions the empty
+                coalition is not included then.
+
+        Yields:
+            Coalition: The coalitions of the given size.
+
+        Raises:
+            ValueError: If the number of players is invalid (too high or low).
+        """
+        limit = Coalition.grand_coalition(n_players).id + 1
+        for k in range(1, size + 1) if at_most else [size]:
+            if k < 0 or k > n_players:
+                continue
+            coalition_id = (1 << k) - 1
+            if coalition_id == 0:
+                yield Coalition(0)
+                continue
+            while coalition_id < limit:
+                yield Coalition(coalition_id)
+                # Next larger ID with the same number of players
+                lowest = coalition_id & -coalition_id
+                ripple = coalition_id + lowest
+                coalition_id = (
+                    ((ripple ^ coalition_id) >> 2) // lowest
+                ) | ripple
+
+    @staticmethod
+    def all_coalition_ids_of_size(
+        n_players: int, size: int, *, at_most: bool = False
+    ) -> np.ndarray:
+        """
+        Returns the IDs (bitmaps) of all coalitions of the given size with
+        a specified number of players at once (in the order of
+        all_coalitions_of_size).
+
+        Args:
+            n_players (int): The number of players.
+            size (int): The number of players in the coalitions.
+            at_most (bool): If True, the IDs of the coalitions of sizes 1 to
+                size are returned (size by size).
+
+        Returns:
+            np.ndarray: The IDs of the coalitions (np.uint32).
+
+        Raises:
+            ValueError: If the number of players is invalid (too high or low).
+        """
+        Coalition.grand_coalition(n_players)
+        if size < 0:
+            return np.zeros(0, dtype=np.uint32)
+        # ids_of_size[j] are the IDs of coalitions of j of the first players
+        ids_of_size = [np.zeros(1, dtype=np.uint32)] + [
+            np.zeros(0, dtype=np.uint32) for _ in range(size)
+        ]
+        for player in range(n_players):
+            bit = np.uint32(1 << player)
+            for j in range(min(player + 1, size), 0, -1):
+                ids_of_size[j] = np.concatenate(
+                    (ids_of_size[j], ids_of_size[j - 1] | bit)
+                )
+        if at_most:
+            return np.concatenate(
+                [np.zeros(0, dtype=np.uint32), *ids_of_size[1:]]
+            )
+        return ids_of_size[size]
+
 
 def all_one_player_missing_subcoalitions(
     coalition: Coalition,
@@ -333,4 +479,309 @@ def all_one_player_missing_subcoalitions(
         yield coalition - i
 
 
+@lru_cache(maxsize=4)
+def coalition_sizes(n_players: int) -> np.ndarray:
+    """
+    Returns the table of sizes (number of players) of all coalitions with a
+    specified number of players indexed by the ID (bitmap) of the coalition.
+
+    The table is built by doubling (coalitions containing the player with the
+    highest number are one player larger than the same coalitions without
+    them), it is cached and read-only.
+
+    Args:
+        n_players (int): The number of players.
+
+    Returns:
+        np.ndarray: The sizes of all 2^n_players coalitions (popcount table).
+    """
+    sizes = np.zeros(1, dtype=np.uint8)
+    for _ in range(n_players):
+        sizes = np.concatenate((sizes, sizes + 1))
+    sizes.flags.writeable = False
+    return sizes
+
+
+def player_memberships(
+    coalition_ids: np.ndarray, number_of_players: int
+) -> np.ndarray:
+    """
+    Returns for each coalition which players are its members.
+
+    Args:
+        coalition_ids (np.ndarray): The IDs (bitmaps) of the coalitions (1-D).
+        number_of_players (int): The number of players.
+
+    Returns:
+        np.ndarray: The boolean array of shape (len(coalition_ids),
+            number_of_players), True where the player is in the coalition.
+    """
+    players = np.arange(number_of_players, dtype=np.uint32)
+    return (coalition_ids[:, None] >> players & 1).astype(bool)
+
+
+class CoalitionArray:
+    """
+    Represents a vector of coalitions stored as an array of their IDs
+    (bitmaps), the set operations work on all coalitions at once.
+
+    The other operand of the set operations is either another CoalitionArray
+    (coalition by coalition) or a single coalition (Coalition, Player or
+    Iterable of Players) used with every coalition of the array.
+
+    Attributes:
+        ids (np.ndarray): The IDs of the coalitions (np.uint32).
+
+    Methods:
+        from_coalitions: Creates the array from coalitions or lists of players.
+        all_coalitions: Returns the array of all coalitions with a specified
+            number of players.
+        contains: Checks for every coalition if it contains a player or
+            a coalition.
+        sizes: Returns the numbers of players in the coalitions.
+        memberships: Returns for each coalition which players are its members.
+    """
+
+    def __init__(self, ids: np.ndarray | Iterable[int]) -> None:
+        """
+        Initialize a CoalitionArray object with the given IDs.
+
+        Args:
+            ids (np.ndarray | Iterable[int]): The IDs (bitmaps) of the
+                coalitions (an np.uint32 array is used without copying).
+
+        Returns:
+            None
+        """
+        self.ids = np.asarray(ids, dtype=np.uint32)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the CoalitionArray object.
+
+        Returns:
+            str: The string representation of the CoalitionArray object
+                (IDs of the coalitions).
+        """
+        return f"CoalitionArray(ids={self.ids.tolist()})"
+
+    def __len__(self) -> int:
+        """
+        Returns the number of coalitions in the array.
+
+        Returns:
+            int: The number of coalitions.
+        """
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Coalition]:
+        """
+        Returns an iterator of the coalitions in the array.
+
+        Yields:
+            Coalition: The coalitions of the array.
+        """
+        for coalition_id in self.ids:
+            yield Coalition(coalition_id)
+
+    def __getitem__(self, index: int | slice | np.ndarray) -> Any:
+        """
+        Returns the coalition at the index or the array of coalitions at the
+        indices (slice, array of indices or boolean mask).
+
+        Args:
+            index (int | slice | np.ndarray): The index or indices.
+
+        Returns:
+            Coalition | CoalitionArray: The selected coalition(s).
+        """
+        if isinstance(index, (int, np.integer)):
+            return Coalition(self.ids[index])
+        return CoalitionArray(self.ids[index])
+
+    def _other_ids(self, other: object) -> np.ndarray | np.uint32:
+        """
+        Returns the ID(s) of the other operand of a set operation.
+
+        Args:
+            other (object): The other operand.
+
+        Returns:
+            np.ndarray | np.uint32: The IDs of the coalitions of the other
+                array or the ID of the single coalition.
+
+        Raises:
+            TypeError: If the object is not of a supported type
+                (CoalitionArray, Coalition, Player, or Iterable of Players).
+        """
+        if isinstance(other, CoalitionArray):
+            return other.ids
+        if isinstance(other, Coalition):
+            return np.uint32(other.id)
+        if isinstance(other, Player):
+            return np.uint32(Coalition.from_players([other]).id)
+        if isinstance(other, Iterable) and all(
+            isinstance(i, Player) for i in other
+        ):
+            return np.uint32(Coalition.from_players(other).id)
+        raise TypeError
+
+    def __add__(self, other: object) -> CoalitionArray:
+        """
+        Unites the coalitions with the other object (union).
+
+        Args:
+            other (object): The object to be united with.
+
+        Returns:
+            CoalitionArray: The unions of the coalitions.
+
+        Raises:
+            TypeError: If the object is not of a supported type.
+        """
+        return CoalitionArray(self.ids | self._other_ids(other))
+
+    def __sub__(self, other: object) -> CoalitionArray:
+        """
+        Subtracts the other object from the coalitions (set subtraction).
+
+        Args:
+            other (object): The object to subtract.
+
+        Returns:
+            CoalitionArray: The differences of the coalitions.
+
+        Raises:
+            TypeError: If the object is not of a supported type.
+        """
+        return CoalitionArray(self.ids & ~self._other_ids(other))
+
+    def __mul__(self, other: object) -> CoalitionArray:
+        """
+        Intersects the coalitions with the other object.
+
+        Args:
+            other (object): The object to intersect with.
+
+        Returns:
+            CoalitionArray: The intersections of the coalitions.
+
+        Raises:
+            TypeError: If the object is not of a supported type.
+        """
+        return CoalitionArray(self.ids & self._other_ids(other))
+
+    def __truediv__(self, other: object) -> CoalitionArray:
+        """
+        Symmetric difference of the coalitions and the other object.
+
+        Args:
+            other (object): The object to be symmetrically differenced with.
+
+        Returns:
+            CoalitionArray: The symmetric differences of the coalitions.
+
+        Raises:
+            TypeError: If the object is not of a supported type.
+        """
+        return CoalitionArray(self.ids ^ self._other_ids(other))
+
+    def contains(self, other: object) -> np.ndarray:
+        """
+        Checks for every coalition if it contains the player or the coalition
+        (the coalitions of the other array coalition by coalition).
+
+        Args:
+            other (object): The player(s), coalition or CoalitionArray.
+
+        Returns:
+            np.ndarray: The boolean array, True where the coalition contains
+                the other object.
+
+        Raises:
+            TypeError: If the object is not of a supported type.
+        """
+        other_ids = self._other_ids(other)
+        return (self.ids & other_ids) == other_ids
+
+    def sizes(self) -> np.ndarray:
+        """
+        Returns the numbers of players in the coalitions (popcount by a table
+        of sizes of 16-bit halves of the IDs).
+
+        Returns:
+            np.ndarray: The sizes of the coalitions (np.uint8).
+        """
+        table = coalition_sizes(16)
+        return table[self.ids & 0xFFFF] + table[self.ids >> 16]
+
+    def memberships(self, number_of_players: int) -> np.ndarray:
+        """
+        Returns for each coalition which players are its members.
+
+        Args:
+            number_of_players (int): The number of players.
+
+        Returns:
+            np.ndarray: The boolean array of shape (len(self),
+                number_of_players), True where the player is in the coalition.
+        """
+        return player_memberships(self.ids, number_of_players)
+
+    @staticmethod
+    def from_coalitions(
+        coalitions: Iterable[Coalition | Players],
+    ) -> CoalitionArray:
+        """
+        Creates the array from coalitions or lists of players.
+
+        Args:
+            coalitions (Iterable[Coalition | Players]): The coalitions.
+
+        Returns:
+            CoalitionArray: The array of the coalitions.
+
+        Raises:
+            TypeError: If a coalition is not a Coalition or an Iterable of
+                Players.
+        """
+        ids = []
+        for coalition in coalitions:
+            if isinstance(coalition, Coalition):
+                ids.append(coalition.id)
+            elif isinstance(coalition, Iterable) and all(
+                isinstance(i, Player) for i in coalition
+            ):
+                ids.append(Coalition.from_players(coalition).id)
+            else:
+                raise TypeError
+        return CoalitionArray(np.array(ids, dtype=np.uint32))
+
+    @staticmethod
+    def all_coalitions(n_players: int) -> CoalitionArray:
+        """
+        Returns the array of all coalitions with a specified number of players
+        (in the order of Coalition.all_coalitions, without the empty one).
+
+        Args:
+            n_players (int): The number of players.
+
+        Returns:
+            CoalitionArray: The array of the coalitions.
+
+        Raises:
+            ValueError: If the number of players is invalid (too high or low).
+        """
+        grand_coalition_id = Coalition.grand_coalition(n_players).id
+        return CoalitionArray(
+            np.arange(1, grand_coalition_id + 1, dtype=np.uint32)
+        )
+
+
+# Interned coalitions by their IDs
+_interned_coalitions: dict[int, Coalition] = {}
+
+# Sizes of coalitions of 16 players for the sizes of the halves of IDs
+_SIZES_OF_HALVES = coalition_sizes(16).tolist()
+
 EMPTY_COALITION = Coalition(0)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from shapleypy._typing import Value
 
 # Allowed number of players in a game.
@@ -8,6 +10,25 @@ MINIMUM_NUMBER_OF_PLAYERS = 1
 MAX_PLAYER = 31
 MIN_PLAYER = 0
 
+# Coalitions with smaller IDs are interned (one shared object per ID, zero
+# disables the interning)
+COALITION_INTERNING_LIMIT = 2**12
+
+# Number of values processed at once by the chunked algorithms (the values of
+# large games, e.g. stored in memory mapped files, are never loaded at once)
+CHUNK_SIZE = 2**16
+
+# Default number of values cached by an oracle game
+ORACLE_GAME_CACHE_CAPACITY = 2**16
+# Default number of coalitions evaluated by a batch oracle in one call
+ORACLE_GAME_BATCH_SIZE = 2**10
+# Maximum number of players of the regression estimate of Shapley values
+# (IDs of sampled coalitions are int64 bitmaps)
+KERNEL_SHAP_MAXIMUM_NUMBER_OF_PLAYERS = 63
+
+# Dtype of games with exact rational values (gmpy2.mpq objects)
+RATIONAL_DTYPE = np.dtype(object)
+
 # Default value for a coalition for solution concepts
 DEFAULT_VALUE = Value(0.0)
 
@@ -19,6 +40,9 @@ GAME_COALITION_INPUT_ERROR = (
 LOADERS_MISSING_NUMBER_OF_PLAYERS_ERROR = (
     "The file does not contain the number of players."
 )
+LOADERS_MEMMAP_SIZE_ERROR = (
+    "The file does not contain values of all coalitions of a game."
+)
 CSV_SEPARATOR_ERROR = "csv_separator and coalition_separator cannot be the same"
 CORE_POINT_ERROR = """
     The generator is not a point. If you managed to get this error, please
@@ -30,6 +54,63 @@ CORE_WINDOWS_ERROR = """
     """
 POSITIVE_GAME_GENERATOR_LOWER_BOUND_ERROR = "lower_bound must be non-negative"
 K_GAMES_PARAMETER = "k must be between 1 and the number of players"
+SAMPLING_NUMBER_OF_PLAYERS_ERROR = (
+    "number_of_players must be given when sampling a value oracle"
+)
+ORACLE_GAME_SET_VALUE_ERROR = (
+    "values of an OracleGame are given by its oracle and cannot be set"
+)
+ORACLE_GAME_MISSING_ORACLE_ERROR = "oracle or batch_oracle must be given"
+ORACLE_GAME_BATCH_SIZE_ERROR = "batch_size must be positive"
+WEIGHTED_VOTING_GAME_QUOTA_ERROR = "quota must be a positive integer"
+WEIGHTED_VOTING_GAME_WEIGHTS_ERROR = (
+    "weights must be given as non-negative integers"
+)
+PARALLEL_N_JOBS_ERROR = "n_jobs must be positive or -1 (all processors)"
+SAMPLING_NUMBER_OF_SAMPLES_ERROR = "number of samples must be positive"
+KERNEL_SHAP_NUMBER_OF_PLAYERS_ERROR = (
+    "kernel_shap supports games of at most 63 players"
+)
+RATIONAL_GMPY2_ERROR = (
+    "The 'gmpy2' package is required for games with exact rational values."
+)
+INTEGER_DTYPE_VALUE_ERROR = (
+    "values of games with integer values must be whole numbers (not missing)"
+)
+GAME_VALUES_LENGTH_ERROR = (
+    "values must have the same length as the coalitions they are set to"
+)
+GAME_VALUES_ARRAY_SIZE_ERROR = (
+    "values must be given for all coalitions (length 2^n for n >= 1 players)"
+)
+ANALYSIS_OUTPUT_ERROR = (
+    "outputs must be shapley, banzhaf, dividends, core, monotone, "
+    "weakly_superadditive, convex or positive"
+)
+ANALYSIS_PAYOFF_VECTORS_ERROR = "payoff vectors must be given for core"
+SEMIVALUE_BETA_PARAMETERS_ERROR = "alpha and beta must be positive"
+SEMIVALUE_WEIGHTS_LENGTH_ERROR = (
+    "semivalue weights must be given for coalition sizes 0 to n-1"
+)
+GAMES_BATCH_ARRAY_SHAPE_ERROR = (
+    "values must be of shape (number of games, 2^n) for n >= 1 players"
+)
+GAMES_BATCH_NUMBER_OF_PLAYERS_ERROR = (
+    "games of a batch must be given and have the same number of players"
+)
+GAME_MEMMAP_DTYPE_ERROR = (
+    "games with exact rational values cannot be stored in a file"
+)
+NORMALIZATION_INTEGER_DTYPE_ERROR = (
+    "games with integer values cannot be normalized in place"
+)
+NORMALIZATION_ORACLE_GAME_ERROR = (
+    "values of an OracleGame are given by its oracle and cannot be normalized"
+)
+NORMALIZATION_SPARSE_DEFAULT_VALUE_ERROR = (
+    "SparseGame with a default value and nonzero values of singletons cannot "
+    "be zero-one normalized (the undefined coalitions would differ)"
+)
 
 # Warnings
 DEFAULT_VALUE_WARNING = "Warning: Unchanged default value is used in the game"
@@ -1,46 +1,274 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from typing import Protocol, cast, overload
+from weakref import WeakSet
 
 import numpy as np
-
-from shapleypy._typing import Player, Players, Value, ValueInput
-from shapleypy.coalition import Coalition
-from shapleypy.constants import GAME_COALITION_INPUT_ERROR
+from numpy.typing import ArrayLike, DTypeLike
+
+from shapleypy._chunked import chunked_missing_mask
+from shapleypy._dtypes import (
+    convert_value,
+    convert_values,
+    is_missing,
+    is_rational,
+)
+from shapleypy._typing import GameValueInput, Player, Players, Value
+from shapleypy.coalition import Coalition, CoalitionArray
+from shapleypy.constants import (
+    GAME_COALITION_INPUT_ERROR,
+    GAME_MEMMAP_DTYPE_ERROR,
+    GAME_VALUES_ARRAY_SIZE_ERROR,
+    GAME_VALUES_LENGTH_ERROR,
+    MINIMUM_NUMBER_OF_PLAYERS,
+)
 
 Coalitions = Iterable[Coalition]
 
 
+class ValuesObserver(Protocol):
+    """
+    Object notified about the values of coalitions set in a game (e.g. the
+    maintained solution concepts updating their values incrementally).
+    """
+
+    def _values_set(
+        self,
+        coalition_ids: np.ndarray,
+        old_values: np.ndarray,
+        new_values: np.ndarray,
+    ) -> None:
+        """
+        Receives the values set in the game.
+
+        Args:
+            coalition_ids (np.ndarray): The unique IDs (bitmaps) of the
+                coalitions whose values were set.
+            old_values (np.ndarray): The values before (in the dtype of the
+                game).
+            new_values (np.ndarray): The values set (in the dtype of the
+                game).
+
+        Returns:
+            None
+        """
+
+
+def _as_coalition(coalition: Coalition | Players | Player) -> Coalition:
+    """
+    Converts the coalition input of a game to a Coalition.
+
+    Args:
+        coalition (Coalition | Players | Player): The coalition or player(s).
+
+    Raises:
+        TypeError: If the coalition input is not of the correct type
+            (listed above).
+
+    Returns:
+        Coalition: The converted coalition.
+    """
+    if isinstance(coalition, Player):
+        return Coalition.from_players([coalition])
+    if isinstance(coalition, Iterable) and all(
+        isinstance(i, Player) for i in coalition
+    ):
+        return Coalition.from_players(coalition)
+    if not isinstance(coalition, Coalition):
+        raise TypeError(GAME_COALITION_INPUT_ERROR)
+    return coalition
+
+
+def _check_ids(coalition_ids: np.ndarray, number_of_players: int) -> None:
+    """
+    Checks that the coalitions given by their IDs (bitmaps) contain just the
+    players of a game.
+
+    Args:
+        coalition_ids (np.ndarray): The IDs of the coalitions.
+        number_of_players (int): The number of players in the game.
+
+    Raises:
+        IndexError: If a coalition contains players not in the game.
+
+    Returns:
+        None
+    """
+    outside = coalition_ids >> number_of_players > 0
+    if np.any(outside):
+        raise IndexError(int(coalition_ids[outside].flat[0]))
+
+
+def _last_values(
+    coalition_ids: np.ndarray, values: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Removes the repeated coalitions keeping their last values (the values
+    which stay set).
+
+    Args:
+        coalition_ids (np.ndarray): The IDs (bitmaps) of the coalitions.
+        values (np.ndarray): The values of the coalitions.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The sorted unique IDs and their values.
+    """
+    # Unique keeps the first occurrence, so the later values go first
+    unique_ids, positions = np.unique(coalition_ids[::-1], return_index=True)
+    return unique_ids, values[::-1][positions]
+
+
 class Game:
     """
     Represents a game with a specified number of players.
 
     Attributes:
         number_of_players (int): The number of players in the game.
-        _values (np.ndarray): An array to store the values of coalitions.
+        dtype (np.dtype): The dtype of the values of coalitions.
+        _values (np.ndarray): An array to store the values of coalitions (in
+            memory or memory mapped file).
 
     Methods:
         set_value: Sets the value of a coalition.
         set_values: Sets the values of multiple coalitions.
         get_value: Retrieves the value of a coalition.
         get_values: Retrieves the values of specified coalitions.
-        _init_values: Initializes the values of the coalitions to np.nan for all
-            coalitions without empty coalition which is set to zero.
+        set_values_by_ids: Sets the values of coalitions given by array of
+            IDs at once.
+        get_values_by_ids: Retrieves the values of coalitions given by array
+            of IDs at once.
+        from_array: Creates a game from the values of all coalitions.
+        _init_values: Initializes the values of the coalitions to np.nan (zero
+            for integer dtypes) for all coalitions without empty coalition which
+            is set to zero.
+        _evaluate: Retrieves the values of coalitions given by array of IDs.
+        _set_values_of_ids: Sets the values of coalitions given by array of
+            IDs.
+        _drop_caches: Drops the cached data derived from the values.
+        _all_values: Retrieves the values of all coalitions as an array
+            indexed by the IDs of coalitions.
+        _missing_values: Retrieves the mask and the number of missing values
+            (computed once per version of the values, updated by set_value).
+        _values_changed: Marks the values as modified outside of set_value
+            and set_values (a new version of the values).
+        _set_dividends: Attaches the Harsanyi dividends of the game given by
+            the coalitions with nonzero dividends.
+        _known_dividends: Retrieves the attached dividends (if the values
+            were not modified since).
+        _attach_observer: Attaches an object notified about the values set
+            by set_value and set_values.
+        _detach_observer: Detaches the observer.
     """
 
-    def __init__(self, number_of_players: int) -> None:
+    # Version of the values and the mask of missing values computed for it
+    # (with the number of missing values), the mask is computed when needed
+    _version: int = 0
+    _missing_cache: tuple[int, np.ndarray, int] | None = None
+    # Version of the values and the IDs and Harsanyi dividends of coalitions
+    # with nonzero dividends (attached by the creator of the game)
+    _dividends_cache: tuple[int, np.ndarray, np.ndarray] | None = None
+    # Objects notified about the values set (weak references, so forgotten
+    # observers do not slow down the setting of values)
+    _observers: WeakSet[ValuesObserver] | None = None
+
+    def __init__(
+        self,
+        number_of_players: int,
+        filename: str | None = None,
+        dtype: DTypeLike = Value,
+    ) -> None:
         """
         Initializes a new instance of the Game class.
 
         Args:
             number_of_players (int): The number of players in the game.
+            filename (str | None): The file in which the values are stored
+                (memory mapped, so games larger than memory can be used). If
+                None the values are stored in memory. The file is overwritten.
+            dtype (DTypeLike): The dtype of the values (e.g. np.float32 or
+                np.int64 to save memory, RATIONAL_DTYPE from constants for exact
+                rational values stored as gmpy2.mpq). Integer games have no
+                missing values, the unset values are zero.
+
+        Raises:
+            ValueError: If the values are exact rationals and filename is given.
         """
         self.number_of_players: int = number_of_players
-        self._values: np.ndarray = np.zeros(2**number_of_players, dtype=Value)
+        self._values: np.ndarray
+        if filename is None:
+            self._values = np.zeros(2**number_of_players, dtype=dtype)
+        elif is_rational(dtype):
+            raise ValueError(GAME_MEMMAP_DTYPE_ERROR)
+        else:
+            self._values = np.memmap(
+                filename,
+                dtype=dtype,
+                mode="w+",
+                shape=(2**number_of_players,),
+            )
         self._init_values()
 
+    @classmethod
+    def _from_values_array(cls, values: np.ndarray) -> Game:
+        """
+        Creates a game using the given array as the values of its coalitions
+        (the array is not copied).
+
+        Args:
+            values (np.ndarray): The values of all coalitions indexed by their
+                IDs (bitmaps), the length must be a power of two.
+
+        Returns:
+            Game: The created game.
+        """
+        game = cls.__new__(cls)
+        game.number_of_players = len(values).bit_length() - 1
+        game._values = values
+        return game
+
+    @staticmethod
+    def from_array(values: ArrayLike, dtype: DTypeLike = Value) -> Game:
+        """
+        Creates a game from the values of all coalitions at once (the values are
+        copied into a new array of the dtype).
+
+        Args:
+            values (ArrayLike): The values of all coalitions indexed by their
+                IDs (bitmaps), the first value is the value of the empty
+                coalition (should be zero), np.nan means missing value.
+            dtype (DTypeLike): The dtype of the values of the game (see Game).
+
+        Returns:
+            Game: The created game.
+
+        Raises:
+            ValueError: If the number of values is not 2^n for n >= 1.
+        """
+        converted = convert_values(values, dtype)
+        length = len(converted) if converted.ndim == 1 else 0
+        number_of_players = length.bit_length() - 1
+        if (
+            length != 1 << number_of_players
+            or number_of_players < MINIMUM_NUMBER_OF_PLAYERS
+        ):
+            raise ValueError(GAME_VALUES_ARRAY_SIZE_ERROR)
+        if converted is values:
+            converted = converted.copy()
+        return Game._from_values_array(converted)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Returns the dtype of the values of coalitions.
+
+        Returns:
+            np.dtype: The dtype of the values.
+        """
+        return self._values.dtype
+
     def set_value(
-        self, coalition: Coalition | Players | Player, value: ValueInput
+        self, coalition: Coalition | Players | Player, value: GameValueInput
     ) -> None:
         """
         Sets the value of a coalition.
@@ -48,7 +276,8 @@ class Game:
         Args:
             coalition (Coalition | Players | Player): The coalition or player(s)
                 for which to set the value.
-            value (ValueInput): The value to set.
+            value (GameValueInput): The value to set (converted to the dtype of
+                the game).
 
         Raises:
             TypeError: If the coalition input is not of the correct type
@@ -57,32 +286,122 @@ class Game:
         Returns:
             None
         """
-        final_coalition = coalition
-        if isinstance(coalition, Player):
-            final_coalition = Coalition.from_players([coalition])
-        elif isinstance(coalition, Iterable) and all(
-            isinstance(i, Player) for i in coalition
-        ):
-            final_coalition = Coalition.from_players(coalition)
-        if not isinstance(final_coalition, Coalition):
-            raise TypeError(GAME_COALITION_INPUT_ERROR)
-        self._values[final_coalition.id] = value
+        coalition_id = _as_coalition(coalition).id
+        value = convert_value(value, self.dtype)
+        old_value = self._values[coalition_id]
+        self._values[coalition_id] = value
+        self._dividends_cache = None
+        if self._missing_cache is not None:
+            # Keep the mask up to date instead of computing it again
+            version, mask, number_of_missing = self._missing_cache
+            number_of_missing += int(is_missing(value)) - int(
+                mask[coalition_id]
+            )
+            mask[coalition_id] = is_missing(value)
+            self._missing_cache = (version, mask, number_of_missing)
+        if self._observers:
+            self._notify_observers(
+                np.array([coalition_id], dtype=np.uint32),
+                np.array([old_value], dtype=self.dtype),
+                np.array([value], dtype=self.dtype),
+            )
+
+    @overload
+    def set_values(
+        self, values: Iterable[tuple[Coalition | Players, GameValueInput]]
+    ) -> None: ...
+
+    @overload
+    def set_values(
+        self,
+        values: Sequence[GameValueInput] | np.ndarray,
+        coalitions: CoalitionArray,
+    ) -> None: ...
 
     def set_values(
-        self, values: Iterable[tuple[Coalition | Players, ValueInput]]
+        self,
+        values: (
+            Iterable[tuple[Coalition | Players, GameValueInput]]
+            | Sequence[GameValueInput]
+            | np.ndarray
+        ),
+        coalitions: CoalitionArray | None = None,
     ) -> None:
         """
         Sets the values of multiple coalitions.
 
         Args:
-            values (Iterable[tuple[Coalition | Players, ValueInput]]):
-                The coalitions and values to set.
+            values (Iterable[tuple[Coalition | Players, GameValueInput]] |
+                Sequence[GameValueInput] | np.ndarray): The coalitions and
+                values to set, or just the values if the coalitions are given
+                as CoalitionArray.
+            coalitions (CoalitionArray | None): The coalitions whose values
+                are set at once (values[i] is the value of coalitions[i]).
+
+        Raises:
+            ValueError: If the number of values differs from the number of
+                coalitions.
+            IndexError: If a coalition contains players not in the game.
 
         Returns:
             None
         """
-        for coalition, value in values:
-            self.set_value(coalition, value)
+        if coalitions is None:
+            for coalition, value in cast(
+                "Iterable[tuple[Coalition | Players, GameValueInput]]", values
+            ):
+                self.set_value(coalition, value)
+            return
+        self.set_values_by_ids(coalitions.ids, np.asarray(values))
+
+    def set_values_by_ids(
+        self, coalition_ids: ArrayLike, values: ArrayLike
+    ) -> None:
+        """
+        Sets the values of coalitions given by their IDs (bitmaps) at once
+        (one conversion of the values and one assignment).
+
+        Args:
+            coalition_ids (ArrayLike): The IDs of the coalitions (1-D).
+            values (ArrayLike): The values of the coalitions (values[i] is the
+                value of coalition_ids[i], converted to the dtype of the
+                game, the last value of a repeated coalition is used).
+
+        Raises:
+            ValueError: If the number of values differs from the number of
+                coalitions.
+            IndexError: If a coalition contains players not in the game.
+
+        Returns:
+            None
+        """
+        ids = np.asarray(coalition_ids, dtype=np.uint32)
+        converted = convert_values(values, self.dtype)
+        if converted.shape != ids.shape:
+            raise ValueError(GAME_VALUES_LENGTH_ERROR)
+        _check_ids(ids, self.number_of_players)
+        self._set_values_of_ids(ids, converted)
+
+    def _set_values_of_ids(
+        self, coalition_ids: np.ndarray, values: np.ndarray
+    ) -> None:
+        """
+        Sets the values of coalitions given by their IDs (bitmaps) at once.
+
+        Args:
+            coalition_ids (np.ndarray): The IDs of the coalitions.
+            values (np.ndarray): The values (in the dtype of the game).
+
+        Returns:
+            None
+        """
+        if self._observers:
+            coalition_ids, values = _last_values(coalition_ids, values)
+            old_values = self._evaluate(coalition_ids)
+        self._values[coalition_ids] = values
+        self._drop_caches()
+        if self._observers:
+            self._notify_observers(coalition_ids, old_values, values)
 
     def get_value(self, coalition: Coalition | Players | Player) -> Value:
         """
@@ -98,24 +417,69 @@ class Game:
         Returns:
             Value: The value of the coalition.
         """
-        final_coalition = coalition
-        if isinstance(coalition, Player):
-            final_coalition = Coalition.from_players([coalition])
-        elif isinstance(coalition, Iterable) and all(
-            isinstance(i, Player) for i in coalition
-        ):
-            final_coalition = Coalition.from_players(coalition)
-        if not isinstance(final_coalition, Coalition):
-            raise TypeError(GAME_COALITION_INPUT_ERROR)
-        return self._values[final_coalition.id]
+        return self._values[_as_coalition(coalition).id]
+
+    @overload
+    def get_values(self, coalitions: CoalitionArray) -> np.ndarray: ...
+
+    @overload
+    def get_values(
+        self, coalitions: Iterable[Coalition | Players] | None = None
+    ) -> Iterable[tuple[Coalition, Value]]: ...
 
     def get_values(
         self,
-        coalitions: Iterable[Coalition | Players] | None = None,
-    ) -> Iterable[tuple[Coalition, Value]]:
+        coalitions: (
+            Iterable[Coalition | Players] | CoalitionArray | None
+        ) = None,
+    ) -> Iterable[tuple[Coalition, Value]] | np.ndarray:
         """
         Retrieves the values of specified coalitions.
 
+        Args:
+            coalitions (Iterable[Coalition | Players] | CoalitionArray | None):
+                The coalitions or player(s) for which to retrieve the values.
+                If None, retrieves the values of all possible coalitions.
+
+        Raises:
+            TypeError: If the coalition input is not of the correct type.
+            IndexError: If a coalition of CoalitionArray contains players not
+                in the game.
+
+        Returns:
+            Iterable[tuple[Coalition, Value]] | np.ndarray: The coalitions and
+                their corresponding values, for CoalitionArray the array of
+                values of its coalitions (looked up at once).
+        """
+        if isinstance(coalitions, CoalitionArray):
+            return self.get_values_by_ids(coalitions.ids)
+        return self._get_values(coalitions)
+
+    def get_values_by_ids(self, coalition_ids: ArrayLike) -> np.ndarray:
+        """
+        Retrieves the values of coalitions given by their IDs (bitmaps) at
+        once.
+
+        Args:
+            coalition_ids (ArrayLike): The IDs of the coalitions (any shape).
+
+        Raises:
+            IndexError: If a coalition contains players not in the game.
+
+        Returns:
+            np.ndarray: The values of the coalitions (same shape as the IDs).
+        """
+        ids = np.asarray(coalition_ids, dtype=np.uint32)
+        _check_ids(ids, self.number_of_players)
+        return self._evaluate(ids)
+
+    def _get_values(
+        self,
+        coalitions: Iterable[Coalition | Players] | None,
+    ) -> Iterable[tuple[Coalition, Value]]:
+        """
+        Retrieves the values of specified coalitions one by one.
+
         Args:
             coalitions (Iterable[Coalition | Players] | None): The coalitions or
                 player(s) for which to retrieve the values.
@@ -149,6 +513,166 @@ class Game:
             for coalition in converted_coalitions
         )
 
+    def _evaluate(self, coalition_ids: np.ndarray) -> np.ndarray:
+        """
+        Retrieves the values of coalitions given by their IDs (bitmaps).
+
+        Args:
+            coalition_ids (np.ndarray): The IDs of the coalitions (any shape).
+
+        Returns:
+            np.ndarray: The values of the coalitions (same shape as the IDs).
+        """
+        return self._values[coalition_ids]
+
+    def _all_values(self) -> np.ndarray:
+        """
+        Retrieves the values of all coalitions of the game.
+
+        Returns:
+            np.ndarray: The values of all coalitions indexed by the IDs
+                (bitmaps) of the coalitions (must not be modified).
+        """
+        return self._values
+
+    def _drop_caches(self) -> None:
+        """
+        Drops the mask of missing values and the attached dividends after the
+        values are set by IDs (the version of the values is kept, so the
+        observers notified about the values set stay up to date).
+
+        Returns:
+            None
+        """
+        self._missing_cache = None
+        self._dividends_cache = None
+
+    def _values_changed(self) -> None:
+        """
+        Marks the values as modified (must be called after the values array is
+        modified directly, not by set_value), so the mask of missing values is
+        computed again when needed.
+
+        Returns:
+            None
+        """
+        self._version += 1
+
+    def _set_dividends(
+        self, coalition_ids: np.ndarray, dividends: np.ndarray
+    ) -> None:
+        """
+        Attaches the Harsanyi dividends of the game (valid until the values
+        are modified), the solution concepts use them instead of the values.
+
+        Args:
+            coalition_ids (np.ndarray): The unique IDs (bitmaps) of nonempty
+                coalitions with nonzero dividends (the dividends of all other
+                coalitions are zero).
+            dividends (np.ndarray): The dividends of the coalitions (in the
+                dtype of the game).
+
+        Returns:
+            None
+        """
+        self._dividends_cache = (self._version, coalition_ids, dividends)
+
+    def _attach_observer(self, observer: ValuesObserver) -> None:
+        """
+        Attaches an object notified about the values set by set_value and
+        set_values (until it is detached or garbage collected). Values
+        modified directly are not notified, the observers detect them by the
+        version of the values.
+
+        Args:
+            observer (ValuesObserver): The observer.
+
+        Returns:
+            None
+        """
+        if self._observers is None:
+            self._observers = WeakSet()
+        self._observers.add(observer)
+
+    def _detach_observer(self, observer: ValuesObserver) -> None:
+        """
+        Detaches an observer attached by _attach_observer.
+
+        Args:
+            observer (ValuesObserver): The observer.
+
+        Returns:
+            None
+        """
+        if self._observers is not None:
+            self._observers.discard(observer)
+
+    def _notify_observers(
+        self,
+        coalition_ids: np.ndarray,
+        old_values: np.ndarray,
+        new_values: np.ndarray,
+    ) -> None:
+        """
+        Notifies the attached observers about the values set.
+
+        Args:
+            coalition_ids (np.ndarray): The unique IDs (bitmaps) of the
+                coalitions whose values were set.
+            old_values (np.ndarray): The values before.
+            new_values (np.ndarray): The values set.
+
+        Returns:
+            None
+        """
+        for observer in list(self._observers or ()):
+            observer._values_set(coalition_ids, old_values, new_values)
+
+    def _known_dividends(self) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Retrieves the attached Harsanyi dividends of the game.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray] | None: The IDs (bitmaps) of
+                coalitions with nonzero dividends and their dividends or None
+                if no dividends are attached or the values were modified.
+        """
+        if (
+            self._dividends_cache is None
+            or self._dividends_cache[0] != self._version
+        ):
+            return None
+        return self._dividends_cache[1], self._dividends_cache[2]
+
+    def _missing_values(
+        self, values: np.ndarray | None = None
+    ) -> tuple[np.ndarray, int]:
+        """
+        Retrieves the mask of missing values of all coalitions and the number
+        of missing values. The mask is computed (in chunks) once per version of
+        the values and then kept up to date by set_value.
+
+        Args:
+            values (np.ndarray | None): The values of all coalitions already
+                retrieved by the caller (if None they are retrieved here).
+
+        Returns:
+            tuple[np.ndarray, int]: The boolean array indexed by the IDs
+                (bitmaps) of the coalitions, True where the value is missing
+                (must not be modified), and the number of missing values.
+        """
+        if (
+            self._missing_cache is None
+            or self._missing_cache[0] != self._version
+        ):
+            if values is None:
+                values = self._all_values()
+            self._missing_cache = (
+                self._version,
+                *chunked_missing_mask(values),
+            )
+        return self._missing_cache[1], self._missing_cache[2]
+
     def _init_values(self) -> None:
         """
         Initializes the values of the coalitions.
@@ -156,9 +680,12 @@ class Game:
         Returns:
             None
         """
-        self._values.fill(np.nan)
+        if np.issubdtype(self.dtype, np.integer):
+            self._values.fill(0)
+        else:
+            self._values.fill(np.nan)
         empty_coalition = Coalition.from_players([])
-        self.set_value(empty_coalition, Value(0.0))
+        self.set_value(empty_coalition, 0)
 
     def __str__(self) -> str:
         """
@@ -167,11 +694,14 @@ class Game:
         Returns:
             str: The string representation of the Game object.
         """
-        to_return = f"Game(number_of_players={self.number_of_players},"
-        for i in range(len(self._values)):
-            to_return += f"\n\t{Coalition(i)}: {self._values[i]},"
-        to_return += "\n)"
-        return to_return
+        name = type(self).__name__
+        values = self._all_values()
+        lines = [f"{name}(number_of_players={self.number_of_players},"]
+        lines.extend(
+            f"\t{Coalition(i)}: {value}," for i, value in enumerate(values)
+        )
+        lines.append(")")
+        return "\n".join(lines)
 
     def __repr__(self) -> str:
         """
@@ -180,9 +710,11 @@ class Game:
         Returns:
             str: The string representation of the Game object.
         """
-        to_return = f"Game(number_of_players={self.number_of_players},"
-        for i in range(len(self._values)):
-            to_return += f"\n\t{Coalition(i)!r}: {self._values[i]},"
+        name = type(self).__name__
+        to_return = f"{name}(number_of_players={self.number_of_players},"
+        values = self._all_values()
+        for i in range(len(values)):
+            to_return += f"\n\t{Coalition(i)!r}: {values[i]},"
         to_return += "\n)"
         return to_return
 
@@ -203,8 +735,8 @@ class Game:
             return False
 
         return all(
-            a == b or (np.isnan(a) and np.isnan(b))
-            for a, b in zip(self._values, other._values)
+            a == b or (is_missing(a) and is_missing(b))
+            for a, b in zip(self._all_values(), other._all_values())
         )
 
     @property
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+from shapleypy._chunked import chunked_missing_mask
+from shapleypy._dtypes import convert_value, convert_values
+from shapleypy._typing import Value
+from shapleypy.constants import (
+    GAME_VALUES_LENGTH_ERROR,
+    GAMES_BATCH_ARRAY_SHAPE_ERROR,
+    GAMES_BATCH_NUMBER_OF_PLAYERS_ERROR,
+    MINIMUM_NUMBER_OF_PLAYERS,
+)
+from shapleypy.game import Game, _check_ids
+
+
+class GamesBatch:
+    """
+    Represents a batch of games with the same number of players stored in one
+    2-D array (one row of the values of all coalitions per game). Solution
+    concepts (Shapley and Banzhaf values), normalizations and class checkers
+    process all games of the batch at once and return one row (or one item)
+    per game.
+
+    Attributes:
+        number_of_players (int): The number of players in the games.
+        dtype (np.dtype): The dtype of the values of coalitions.
+        _values (np.ndarray): An array of shape (number_of_games, 2^n) to
+            store the values of coalitions of the games.
+
+    Methods:
+        from_array: Creates a batch from the values of all coalitions of the
+            games.
+        from_games: Creates a batch from the values of games.
+        get_values_by_ids: Retrieves the values of coalitions given by array
+            of IDs in all games at once.
+        set_values_by_ids: Sets the values of coalitions given by array of
+            IDs in all games at once.
+        _evaluate: Retrieves the values of coalitions given by array of IDs.
+        _all_values: Retrieves the values of all coalitions of all games.
+        _missing_values: Retrieves the mask and the number of missing values
+            (computed once per version of the values).
+        _values_changed: Marks the values as modified.
+    """
+
+    # Version of the values and the mask of missing values computed for it
+    # (with the number of missing values), the mask is computed when needed
+    _version: int = 0
+    _missing_cache: tuple[int, np.ndarray, int] | None = None
+
+    def __init__(
+        self,
+        number_of_games: int,
+        number_of_players: int,
+        dtype: DTypeLike = Value,
+    ) -> None:
+        """
+        Initializes a new instance of the GamesBatch class with all values
+        missing (zero for integer dtypes) but the values of the empty
+        coalition which are zero.
+
+        Args:
+            number_of_games (int): The number of games in the batch.
+            number_of_players (int): The number of players in the games.
+            dtype (DTypeLike): The dtype of the values (see Game).
+        """
+        self.number_of_players: int = number_of_players
+        self._values: np.ndarray = np.zeros(
+            (number_of_games, 2**number_of_players), dtype=dtype
+        )
+        if not np.issubdtype(self.dtype, np.integer):
+            self._values.fill(np.nan)
+        self._values[:, 0] = convert_value(0, self.dtype)
+
+    @classmethod
+    def _from_values_array(cls, values: np.ndarray) -> GamesBatch:
+        """
+        Creates a batch using the given array as the values of coalitions of
+        its games (the array is not copied).
+
+        Args:
+            values (np.ndarray): The values of all coalitions of the games
+                (rows indexed by the IDs of coalitions), the length of rows
+                must be a power of two.
+
+        Returns:
+            GamesBatch: The created batch.
+        """
+        batch = cls.__new__(cls)
+        batch.number_of_players = values.shape[-1].bit_length() - 1
+        batch._values = values
+        return batch
+
+    @staticmethod
+    def from_array(values: ArrayLike, dtype: DTypeLike = Value) -> GamesBatch:
+        """
+        Creates a batch from the values of all coalitions of its games at once
+        (the values are copied into a new array of the dtype).
+
+        Args:
+            values (ArrayLike): The values of all coalitions of the games of
+                shape (number_of_games, 2^n), rows are indexed by the IDs
+                (bitmaps) of coalitions, np.nan means missing value.
+            dtype (DTypeLike): The dtype of the values of the games (see Game).
+
+        Returns:
+            GamesBatch: The created batch.
+
+        Raises:
+            ValueError: If the values are not 2-D with rows of length 2^n for
+                n >= 1.
+        """
+        converted = convert_values(values, dtype)
+        if converted.ndim != 2:  # noqa: PLR2004
+            raise ValueError(GAMES_BATCH_ARRAY_SHAPE_ERROR)
+        length = converted.shape[-1]
+        number_of_players = length.bit_length() - 1
+        if (
+            length != 1 << number_of_players
+            or number_of_players < MINIMUM_NUMBER_OF_PLAYERS
+        ):
+            raise ValueError(GAMES_BATCH_ARRAY_SHAPE_ERROR)
+        if converted is values:
+            converted = converted.copy()
+        return GamesBatch._from_values_array(converted)
+
+    @staticmethod
+    def from_games(games: Iterable[Game]) -> GamesBatch:
+        """
+        Creates a batch from the values of games (copied, e.g. the games
+        returned by the generators).
+
+        Args:
+            games (Iterable[Game]): The games with the same number of players.
+
+        Returns:
+            GamesBatch: The created batch (the dtype of the values of all the
+                games).
+
+        Raises:
+            ValueError: If no game is given or the games differ in the number
+                of players.
+        """
+        rows = [game._all_values() for game in games]
+        if not rows or len({len(row) for row in rows}) != 1:
+            raise ValueError(GAMES_BATCH_NUMBER_OF_PLAYERS_ERROR)
+        return GamesBatch._from_values_array(np.stack(rows))
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Returns the dtype of the values of coalitions.
+
+        Returns:
+            np.dtype: The dtype of the values.
+        """
+        return self._values.dtype
+
+    @property
+    def number_of_games(self) -> int:
+        """
+        Returns the number of games in the batch.
+
+        Returns:
+            int: The number of games.
+        """
+        return len(self._values)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of games in the batch.
+
+        Returns:
+            int: The number of games.
+        """
+        return self.number_of_games
+
+    def __getitem__(self, index: int) -> Game:
+        """
+        Returns a game of the batch (the values are copied, modifications of
+        the game do not change the batch).
+
+        Args:
+            index (int): The index of the game.
+
+        Returns:
+            Game: The game.
+        """
+        return Game._from_values_array(np.array(self._values[index]))
+
+    def __iter__(self) -> Iterator[Game]:
+        """
+        Iterates over (copies of) the games of the batch.
+
+        Yields:
+            Game: The games in the order of the batch.
+        """
+        for index in range(self.number_of_games):
+            yield self[index]
+
+    def get_values_by_ids(self, coalition_ids: ArrayLike) -> np.ndarray:
+        """
+        Retrieves the values of coalitions given by their IDs (bitmaps) in all
+        games at once.
+
+        Args:
+            coalition_ids (ArrayLike): The IDs of the coalitions (any shape).
+
+        Raises:
+            IndexError: If a coalition contains players not in the games.
+
+        Returns:
+            np.ndarray: The values of the coalitions, of shape
+                (number_of_games, *shape of the IDs).
+        """
+        ids = np.asarray(coalition_ids, dtype=np.uint32)
+        _check_ids(ids, self.number_of_players)
+        return self._evaluate(ids)
+
+    def set_values_by_ids(
+        self, coalition_ids: ArrayLike, values: ArrayLike
+    ) -> None:
+        """
+        Sets the values of coalitions given by their IDs (bitmaps) in all games
+        at once.
+
+        Args:
+            coalition_ids (ArrayLike): The IDs of the coalitions (1-D).
+            values (ArrayLike): The values of the coalitions of shape
+                (number_of_games, number of IDs), or (number of IDs) for the
+                same values in all games (converted to the dtype of the batch).
+
+        Raises:
+            ValueError: If the number of values differs from the number of
+                coalitions.
+            IndexError: If a coalition contains players not in the games.
+
+        Returns:
+            None
+        """
+        ids = np.asarray(coalition_ids, dtype=np.uint32)
+        converted = convert_values(values, self.dtype)
+        shape = converted.shape
+        if shape[-1:] != ids.shape or len(shape) > 2:  # noqa: PLR2004
+            raise ValueError(GAME_VALUES_LENGTH_ERROR)
+        _check_ids(ids, self.number_of_players)
+        self._values[:, ids] = converted
+        self._values_changed()
+
+    def _evaluate(self, coalition_ids: np.ndarray) -> np.ndarray:
+        """
+        Retrieves the values of coalitions given by their IDs (bitmaps) in all
+        games.
+
+        Args:
+            coalition_ids (np.ndarray): The IDs of the coalitions (any shape).
+
+        Returns:
+            np.ndarray: The values of the coalitions, of shape
+                (number_of_games, *shape of the IDs).
+        """
+        return self._values[:, coalition_ids]
+
+    def _all_values(self) -> np.ndarray:
+        """
+        Retrieves the values of all coalitions of all games.
+
+        Returns:
+            np.ndarray: The values of shape (number_of_games, 2^n), rows are
+                indexed by the IDs (bitmaps) of the coalitions (must not be
+                modified).
+        """
+        return self._values
+
+    def _values_changed(self) -> None:
+        """
+        Marks the values as modified (must be called after the values array is
+        modified directly), so the mask of missing values is computed again
+        when needed.
+
+        Returns:
+            None
+        """
+        self._version += 1
+
+    def _missing_values(
+        self, values: np.ndarray | None = None
+    ) -> tuple[np.ndarray, int]:
+        """
+        Retrieves the mask of missing values of all coalitions of all games and
+        the number of missing values (computed in chunks once per version of
+        the values).
+
+        Args:
+            values (np.ndarray | None): The values of all coalitions already
+                retrieved by the caller (if None they are retrieved here).
+
+        Returns:
+            tuple[np.ndarray, int]: The boolean array of the shape of the
+                values, True where the value is missing (must not be
+                modified), and the number of missing values.
+        """
+        if (
+            self._missing_cache is None
+            or self._missing_cache[0] != self._version
+        ):
+            if values is None:
+                values = self._all_values()
+            self._missing_cache = (
+                self._version,
+                *chunked_missing_mask(values),
+            )
+        return self._missing_cache[1], self._missing_cache[2]
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the GamesBatch object.
+
+        Returns:
+            str: The string representation of the GamesBatch object.
+        """
+        return (
+            f"{type(self).__name__}(number_of_games={self.number_of_games}, "
+            f"number_of_players={self.number_of_players})"
+        )
@@ -1,15 +1,19 @@
-# ruff: noqa: N806, B008
+# ruff: noqa: B008
 from __future__ import annotations
 
 from enum import Enum
 
 import numpy as np
+from numpy.typing import DTypeLike
 
+from shapleypy._typing import Value
+from shapleypy.coalition import Coalition
 from shapleypy.constants import (
     K_GAMES_PARAMETER,
     POSITIVE_GAME_GENERATOR_LOWER_BOUND_ERROR,
 )
 from shapleypy.game import Game
+from shapleypy.transforms import game_from_dividends, zeta_transform
 
 
 class ReturnType(Enum):
@@ -44,20 +48,52 @@ def _generate_random(
     )
 
 
+def _generate_randoms(
+    generator: np.random.Generator,
+    count: int,
+    return_type: ReturnType = ReturnType.FLOAT,
+    lower_bound: int = 0,
+    upper_bound: int = 1,
+) -> list[float]:
+    """
+    Generates the given number of random numbers (one by one by
+    _generate_random, so the same random numbers are generated as before).
+
+    Args:
+        generator (np.random.Generator): Random generator to use.
+        count (int): The number of random numbers.
+        return_type (ReturnType): Type of the return value.
+            Either FLOAT or INTEGER.
+        lower_bound (int): Lower bound for the random number (included).
+        upper_bound (int): Upper bound for the random number (excluded).
+
+    Returns:
+        list[float]: The random numbers.
+    """
+    return [
+        _generate_random(generator, return_type, lower_bound, upper_bound)
+        for _ in range(count)
+    ]
+
+
 def _compute_game_from_unanimity_game(unanimity_game: Game) -> Game:
     """
-    Computes the game from the given unanimity game.
+    Computes the game from the given unanimity game (the values of the
+    unanimity game are the Harsanyi dividends of the game, so the game is their
+    zeta transform).
 
     Args:
         unanimity_game (Game): The unanimity game to compute the game from.
 
     Returns:
-        Game: The computed game.
+        Game: The computed game (with the dtype of the unanimity game).
     """
-    game = Game(unanimity_game.number_of_players)
-    for S in game.all_coalitions:
-        v_S = sum(unanimity_game.get_value(T) for T in S.all_subcoalitions())
-        game.set_value(S, v_S)
+    game = Game(unanimity_game.number_of_players, dtype=unanimity_game.dtype)
+    game._values[:] = unanimity_game._all_values()
+    # The dividend of the empty coalition is not used (v of it is zero)
+    game._values[0] = 0
+    zeta_transform(game._values)
+    game._values_changed()
     return game
 
 
@@ -67,6 +103,8 @@ def random_game_generator(
     return_type: ReturnType = ReturnType.FLOAT,
     lower_bound: int = 0,
     upper_bound: int = 1,
+    *,
+    dtype: DTypeLike = Value,
 ) -> Game:
     """
     Generates a random game (=each coalition value is random) with values
@@ -79,17 +117,20 @@ def random_game_generator(
             Either FLOAT or INTEGER.
         lower_bound (int): Lower bound for the random number (included).
         upper_bound (int): Upper bound for the random number (excluded).
+        dtype (DTypeLike): The dtype of the values of the game (see Game).
 
     Returns:
         Game: The generated game.
     """
-    game = Game(number_of_players)
-
-    for S in game.all_coalitions:
-        random_number = _generate_random(
-            generator, return_type, lower_bound, upper_bound
-        )
-        game.set_value(S, random_number)
+    game = Game(number_of_players, dtype=dtype)
+
+    ids = np.arange(1, 2**number_of_players, dtype=np.uint32)
+    game.set_values_by_ids(
+        ids,
+        _generate_randoms(
+            generator, len(ids), return_type, lower_bound, upper_bound
+        ),
+    )
 
     return game
 
@@ -100,6 +141,8 @@ def positive_game_generator(
     return_type: ReturnType = ReturnType.FLOAT,
     lower_bound: int = 0,
     upper_bound: int = 1,
+    *,
+    dtype: DTypeLike = Value,
 ) -> Game:
     """
     Generates a random positive game.
@@ -111,6 +154,7 @@ def positive_game_generator(
             Either FLOAT or INTEGER.
         lower_bound (int): Lower bound for the random number (included).
         upper_bound (int): Upper bound for the random number (excluded).
+        dtype (DTypeLike): The dtype of the values of the game (see Game).
 
     Returns:
         Game: The generated positive game.
@@ -125,6 +169,7 @@ def positive_game_generator(
         return_type=return_type,
         lower_bound=lower_bound,
         upper_bound=upper_bound,
+        dtype=dtype,
     )
 
     return _compute_game_from_unanimity_game(m_v_game)
@@ -137,6 +182,8 @@ def k_game_generator(
     lower_bound: int = 0,
     upper_bound: int = 1,
     k: int = 1,
+    *,
+    dtype: DTypeLike = Value,
 ) -> Game:
     """
     Generates a random k-game.
@@ -149,6 +196,7 @@ def k_game_generator(
         lower_bound (int): Lower bound for the random number (included).
         upper_bound (int): Upper bound for the random number (excluded).
         k (int): The parameter k for the k-game.
+        dtype (DTypeLike): The dtype of the values of the game (see Game).
 
     Returns:
         Game: The generated k-game.
@@ -159,19 +207,13 @@ def k_game_generator(
     if not 0 < k <= number_of_players:
         raise ValueError(K_GAMES_PARAMETER)
 
-    # Generate m^v(S) for each S in 2^N
-    m_v_game = Game(number_of_players)
-
-    for S in m_v_game.all_coalitions:
-        if len(S) == k:
-            random_number = _generate_random(
-                generator, return_type, lower_bound, upper_bound
-            )
-        else:
-            random_number = 0
-        m_v_game.set_value(S, random_number)
+    # Generate m^v(S) for each S of size k (the others are zero)
+    ids = Coalition.all_coalition_ids_of_size(number_of_players, k)
+    dividends = _generate_randoms(
+        generator, len(ids), return_type, lower_bound, upper_bound
+    )
 
-    return _compute_game_from_unanimity_game(m_v_game)
+    return game_from_dividends(number_of_players, ids, dividends, dtype)
 
 
 def k_additive_game_generator(
@@ -181,6 +223,8 @@ def k_additive_game_generator(
     lower_bound: int = 0,
     upper_bound: int = 1,
     k: int = 1,
+    *,
+    dtype: DTypeLike = Value,
 ) -> Game:
     """
     Generates a random k-additive game.
@@ -193,6 +237,7 @@ def k_additive_game_generator(
         lower_bound (int): Lower bound for the random number (included).
         upper_bound (int): Upper bound for the random number (excluded).
         k (int): The parameter k for the k-additive game.
+        dtype (DTypeLike): The dtype of the values of the game (see Game).
 
     Returns:
         Game: The generated k-additive game.
@@ -203,16 +248,13 @@ def k_additive_game_generator(
     if not 0 < k <= number_of_players:
         raise ValueError(K_GAMES_PARAMETER)
 
-    # Generate m^v(S) for each S in 2^N
-    m_v_game = Game(number_of_players)
-
-    for S in m_v_game.all_coalitions:
-        if len(S) <= k:
-            random_number = _generate_random(
-                generator, return_type, lower_bound, upper_bound
-            )
-        else:
-            random_number = 0
-        m_v_game.set_value(S, random_number)
+    # Generate m^v(S) for each S of size at most k (the others are zero), the
+    # values are drawn in ascending order of IDs as for all coalitions
+    ids = np.sort(
+        Coalition.all_coalition_ids_of_size(number_of_players, k, at_most=True)
+    )
+    dividends = _generate_randoms(
+        generator, len(ids), return_type, lower_bound, upper_bound
+    )
 
-    return _compute_game_from_unanimity_game(m_v_game)
+    return game_from_dividends(number_of_players, ids, dividends, dtype)
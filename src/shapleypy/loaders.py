@@ -2,14 +2,25 @@ import ast
 import csv
 import json
 
+import numpy as np
+from numpy.typing import DTypeLike
+
+from shapleypy._dtypes import is_rational
+from shapleypy._typing import Value
+from shapleypy.coalition import Coalition
 from shapleypy.constants import (
     CSV_SEPARATOR_ERROR,
+    LOADERS_MEMMAP_SIZE_ERROR,
     LOADERS_MISSING_NUMBER_OF_PLAYERS_ERROR,
+    MINIMUM_NUMBER_OF_PLAYERS,
 )
 from shapleypy.game import Game
+from shapleypy.sparse_game import SparseGame
 
 
-def load_game_from_json(file: str) -> Game:
+def load_game_from_json(
+    file: str, dtype: DTypeLike = Value, *, sparse: bool = False
+) -> Game:
     """
     Loads a game from a JSON file.
     To see how the file should be structured, try to save a game using the
@@ -17,30 +28,40 @@ def load_game_from_json(file: str) -> Game:
 
     Args:
         file (str): The path to the JSON file.
+        dtype (DTypeLike): The dtype of the values of the game (see Game). The
+            values of games with exact rational values are parsed from their
+            decimal representation exactly (e.g. 0.1 is 1/10).
+        sparse (bool): If True, the game is loaded as SparseGame (just the
+            coalitions in the file are stored, the others are missing).
 
     Returns:
         Game: The loaded game.
     """
     n = None
+    ids = []
     values = []
     with open(file) as f:
-        data = json.load(f)
+        # Decimal numbers are kept as strings to be parsed exactly
+        data = json.load(f, parse_float=str if is_rational(dtype) else None)
         if "n" not in data:
             raise ValueError(LOADERS_MISSING_NUMBER_OF_PLAYERS_ERROR)
         n = data["n"]
-        if "values" in data:
-            values_from_json = data["values"]
-            values = [
-                (ast.literal_eval(key), value)
-                for key, value in values_from_json.items()
-            ]
-    game = Game(n)
-    game.set_values(values)
+        for key, value in data.get("values", {}).items():
+            ids.append(Coalition.from_players(ast.literal_eval(key)).id)
+            values.append(value)
+    game = SparseGame(n, dtype=dtype) if sparse else Game(n, dtype=dtype)
+    # All values are converted and set at once
+    game.set_values_by_ids(np.array(ids, dtype=np.uint32), values)
     return game
 
 
 def load_game_from_csv(
-    file: str, csv_separator: str = ":", coalition_separator: str = ","
+    file: str,
+    csv_separator: str = ":",
+    coalition_separator: str = ",",
+    dtype: DTypeLike = Value,
+    *,
+    sparse: bool = False,
 ) -> Game:
     """
     Loads a game from a CSV file.
@@ -53,6 +74,10 @@ def load_game_from_csv(
             compatible with savers).
         coalition_separator (str): The separator used for the coalitions
             (default is compatible with savers).
+        dtype (DTypeLike): The dtype of the values of the game (see Game). The
+            values of games with exact rational values are parsed exactly.
+        sparse (bool): If True, the game is loaded as SparseGame (just the
+            coalitions in the file are stored, the others are missing).
 
     Returns:
         Game: The loaded game.
@@ -61,6 +86,7 @@ def load_game_from_csv(
         raise ValueError(CSV_SEPARATOR_ERROR)
 
     n = None
+    ids = []
     values = []
     with open(file, newline="") as f:
         reader = csv.reader(f, delimiter=csv_separator)
@@ -70,10 +96,46 @@ def load_game_from_csv(
                     n = int(row[1])
                 else:
                     key_list = list(map(int, row[0].split(coalition_separator)))
-                    value = float(row[1])
-                    values.append((key_list, value))
+                    ids.append(Coalition.from_players(key_list).id)
+                    # The value is converted to the dtype by the game
+                    values.append(row[1])
     if n is None:
         raise ValueError(LOADERS_MISSING_NUMBER_OF_PLAYERS_ERROR)
-    game = Game(n)
-    game.set_values(values)
+    game = SparseGame(n, dtype=dtype) if sparse else Game(n, dtype=dtype)
+    # All values are converted and set at once
+    game.set_values_by_ids(np.array(ids, dtype=np.uint32), values)
     return game
+
+
+def load_game_from_memmap(
+    file: str, mode: str = "r+", dtype: DTypeLike = Value
+) -> Game:
+    """
+    Loads a game from a binary file of values of all coalitions (as created by
+    the savers or by Game with filename). The file is memory mapped, so the
+    values are not loaded into memory at once.
+
+    Args:
+        file (str): The path to the binary file.
+        mode (str): The mode of the memory map ("r+" allows to modify the game
+            and the file, "r" is read only and "c" is copy on write).
+        dtype (DTypeLike): The dtype of the values stored in the file (the
+            dtype the game was saved with).
+
+    Returns:
+        Game: The loaded game.
+
+    Raises:
+        ValueError: If the file does not contain values of all coalitions of
+            a game of at least MINIMUM_NUMBER_OF_PLAYERS players.
+    """
+    values = np.memmap(  # type: ignore[call-overload]
+        file, dtype=dtype, mode=mode
+    )
+    number_of_players = len(values).bit_length() - 1
+    if (
+        len(values) != 1 << number_of_players
+        or number_of_players < MINIMUM_NUMBER_OF_PLAYERS
+    ):
+        raise ValueError(LOADERS_MEMMAP_SIZE_ERROR)
+    return Game._from_values_array(values)
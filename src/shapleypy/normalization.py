@@ -1,48 +1,165 @@
 from __future__ import annotations
 
+from typing import Any
+
 import numpy as np
 
-from shapleypy.coalition import Coalition
+from shapleypy._chunked import chunk_slices
+from shapleypy._dtypes import is_missing
+from shapleypy._typing import Value
+from shapleypy.coalition import player_memberships
+from shapleypy.constants import (
+    NORMALIZATION_INTEGER_DTYPE_ERROR,
+    NORMALIZATION_ORACLE_GAME_ERROR,
+    NORMALIZATION_SPARSE_DEFAULT_VALUE_ERROR,
+)
 from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+from shapleypy.oracle_game import OracleGame
+from shapleypy.sparse_game import SparseGame
 
 
-def standart_normalization(game: Game) -> None:
+def _additive_values(
+    values_of_singletons: np.ndarray[Any, np.dtype[Value]], chunk: slice
+) -> np.ndarray[Any, np.dtype[Value]]:
     """
-    Normalizes the game values by dividing them by the value of the grand
-    coalition.
+    Computes the values of the additive game given by the values of singletons
+    for coalitions in a chunk (in the dtype of the values of singletons).
 
     Args:
-        game (Game): The game to normalize.
+        values_of_singletons (np.ndarray): The values of singletons (last
+            axis, other axes are kept, e.g. the games of a batch).
+        chunk (slice): The aligned chunk of IDs (bitmaps) of coalitions with
+            length which is a power of two.
 
     Returns:
-        None: The game is normalized in place.
+        np.ndarray: The sums of values of singletons of the coalitions (last
+            axis).
     """
-    value_of_grand_coalition = game.get_value(
-        Coalition(2**game.number_of_players - 1)
+    length = chunk.stop - chunk.start
+    chunk_bits = length.bit_length() - 1
+    additive_values = np.zeros(
+        (*values_of_singletons.shape[:-1], 1), dtype=values_of_singletons.dtype
     )
-    game._values /= value_of_grand_coalition
+    # The players above chunk_bits are the same for the whole chunk
+    for player in range(chunk_bits, values_of_singletons.shape[-1]):
+        if chunk.start >> player & 1:
+            additive_values += values_of_singletons[..., player, None]
+    for player in range(chunk_bits):
+        additive_values = np.concatenate(
+            (
+                additive_values,
+                additive_values + values_of_singletons[..., player, None],
+            ),
+            axis=-1,
+        )
+    return additive_values
 
 
-def zero_one_normalization(game: Game) -> None:
+def _check_game(game: Game | GamesBatch) -> None:
     """
-    Normalizes the game values to be between 0 and 1.
+    Checks that the values of the game can be normalized in place.
 
     Args:
-        game (Game): The game to normalize.
+        game (Game | GamesBatch): The game (or batch of games) to check.
+
+    Raises:
+        TypeError: If the game has integer values or is an oracle game.
 
     Returns:
-        None: The game is normalized in place.
+        None
+    """
+    if isinstance(game, OracleGame):
+        raise TypeError(NORMALIZATION_ORACLE_GAME_ERROR)
+    if np.issubdtype(game.dtype, np.integer):
+        raise TypeError(NORMALIZATION_INTEGER_DTYPE_ERROR)
+
+
+def _sparse_zero_one_shift(game: SparseGame) -> None:
     """
-    value_of_singletons = np.array(
-        [
-            game.get_value(Coalition.from_players([i]))
-            for i in range(game.number_of_players)
-        ]
+    Subtracts the values of singletons of a sparse game from the values of
+    the defined coalitions (the default value is kept, it is missing or the
+    values of singletons are zero).
+
+    Args:
+        game (SparseGame): The sparse game.
+
+    Raises:
+        ValueError: If the default value is not missing and some value of a
+            singleton is not zero.
+
+    Returns:
+        None
+    """
+    values_of_singletons = game._evaluate(
+        1 << np.arange(game.number_of_players)
     )
-    for coalition in game.all_coalitions:
-        game.set_value(
-            coalition,
-            game.get_value(coalition)
-            - np.sum(value_of_singletons[list(coalition.get_players)]),
+    if not is_missing(game.default_value) and np.any(values_of_singletons != 0):
+        raise ValueError(NORMALIZATION_SPARSE_DEFAULT_VALUE_ERROR)
+    for chunk in chunk_slices(game._sparse_values):
+        memberships = player_memberships(
+            game._ids[chunk], game.number_of_players
         )
+        game._sparse_values[chunk] -= np.where(
+            memberships, values_of_singletons, 0
+        ).sum(axis=-1)
+
+
+def standart_normalization(game: Game | GamesBatch) -> None:
+    """
+    Normalizes the game values by dividing them by the value of the grand
+    coalition (in chunks, so games stored in files are not loaded at once).
+
+    Args:
+        game (Game | GamesBatch): The game (or all games of a batch) to
+            normalize.
+
+    Raises:
+        TypeError: If the game has integer values or is an oracle game.
+
+    Returns:
+        None: The game is normalized in place.
+    """
+    _check_game(game)
+    if isinstance(game, SparseGame):
+        value_of_grand_coalition = game._evaluate(
+            np.array([2**game.number_of_players - 1])
+        )[0]
+        game._sparse_values /= value_of_grand_coalition
+        game.default_value /= value_of_grand_coalition
+        game._values_changed()
+        return
+    # Copied, so the value is not changed while the chunks are divided
+    value_of_grand_coalition = np.array(game._values[..., -1:])
+    for chunk in chunk_slices(game._values):
+        game._values[..., chunk] /= value_of_grand_coalition
+    game._values_changed()
+
+
+def zero_one_normalization(game: Game | GamesBatch) -> None:
+    """
+    Normalizes the game values to be between 0 and 1 (in chunks, so games
+    stored in files are not loaded at once).
+
+    Args:
+        game (Game | GamesBatch): The game (or all games of a batch) to
+            normalize.
+
+    Raises:
+        TypeError: If the game has integer values or is an oracle game.
+        ValueError: If the game is a sparse game whose undefined coalitions
+            would get different values (see SparseGame).
+
+    Returns:
+        None: The game is normalized in place.
+    """
+    _check_game(game)
+    if isinstance(game, SparseGame):
+        _sparse_zero_one_shift(game)
+        standart_normalization(game)
+        return
+    value_of_singletons = game._evaluate(1 << np.arange(game.number_of_players))
+    for chunk in chunk_slices(game._values):
+        game._values[..., chunk] -= _additive_values(value_of_singletons, chunk)
+    game._values_changed()
     standart_normalization(game)
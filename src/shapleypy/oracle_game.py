@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import NamedTuple, cast
+
+import numpy as np
+
+from shapleypy._typing import (
+    GameValueInput,
+    Player,
+    Players,
+    Value,
+    ValueBatchOracle,
+    ValueOracle,
+)
+from shapleypy.coalition import Coalition
+from shapleypy.constants import (
+    MAXIMUM_NUMBER_OF_PLAYERS,
+    ORACLE_GAME_BATCH_SIZE,
+    ORACLE_GAME_BATCH_SIZE_ERROR,
+    ORACLE_GAME_CACHE_CAPACITY,
+    ORACLE_GAME_MISSING_ORACLE_ERROR,
+    ORACLE_GAME_SET_VALUE_ERROR,
+)
+from shapleypy.game import Game, _as_coalition
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics of the cache of an oracle game.
+
+    Attributes:
+        hits (int): The number of values found in the cache.
+        misses (int): The number of values computed by the oracle.
+        evictions (int): The number of values removed from the full cache.
+        capacity (int | None): The maximum number of cached values (None for
+            unbounded cache).
+        size (int): The current number of cached values.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    capacity: int | None
+    size: int
+
+
+class OracleGame(Game):
+    """
+    Represents a game whose values are computed on demand by a value oracle
+    (function from the ID (bitmap) of a coalition to its value) or by a batch
+    oracle (function from an array of IDs to an array of values).
+
+    The computed values are memoized in a bounded least-recently-used cache,
+    so no array of all 2^n values is allocated up front. The game can be used
+    anywhere a Game is accepted, but its values cannot be set.
+
+    Attributes:
+        number_of_players (int): The number of players in the game.
+        cache_capacity (int | None): The maximum number of cached values (None
+            for unbounded cache).
+        batch_size (int): The maximum number of IDs passed to the batch oracle
+            in one call.
+
+    Methods:
+        get_value: Retrieves the value of a coalition.
+        cache_info: Returns the statistics of the cache.
+        cache_clear: Removes all values from the cache and resets the
+            statistics.
+    """
+
+    def __init__(
+        self,
+        number_of_players: int,
+        oracle: ValueOracle | None = None,
+        cache_capacity: int | None = ORACLE_GAME_CACHE_CAPACITY,
+        batch_oracle: ValueBatchOracle | None = None,
+        batch_size: int = ORACLE_GAME_BATCH_SIZE,
+    ) -> None:
+        """
+        Initializes a new instance of the OracleGame class.
+
+        Args:
+            number_of_players (int): The number of players in the game.
+            oracle (ValueOracle | None): The function computing the value of a
+                coalition from its ID (bitmap).
+            cache_capacity (int | None): The maximum number of cached values
+                (None for unbounded cache).
+            batch_oracle (ValueBatchOracle | None): The function computing the
+                values of coalitions from an array of their IDs (bitmaps). If
+                given, all values not in the cache are computed by it in
+                batches (the oracle is then optional).
+            batch_size (int): The maximum number of IDs passed to the batch
+                oracle in one call.
+
+        Raises:
+            ValueError: If neither oracle nor batch oracle is given or the
+                batch size is not positive.
+        """
+        if oracle is None and batch_oracle is None:
+            raise ValueError(ORACLE_GAME_MISSING_ORACLE_ERROR)
+        if batch_size < 1:
+            raise ValueError(ORACLE_GAME_BATCH_SIZE_ERROR)
+        self.number_of_players: int = number_of_players
+        self.cache_capacity: int | None = cache_capacity
+        self.batch_size: int = batch_size
+        self._oracle = oracle
+        self._batch_oracle = batch_oracle
+        self._cache: OrderedDict[int, Value] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Returns the dtype of the values computed by the oracle.
+
+        Returns:
+            np.dtype: The dtype of the values (always Value).
+        """
+        return np.dtype(Value)
+
+    def _lookup(self, coalition_id: int) -> Value | None:
+        """
+        Retrieves the value of a coalition from the cache (and marks it as
+        recently used).
+
+        Args:
+            coalition_id (int): The ID (bitmap) of the coalition.
+
+        Returns:
+            Value | None: The cached value of the coalition or None if it is
+                not cached.
+        """
+        value = self._cache.get(coalition_id)
+        if value is not None:
+            self._hits += 1
+            self._cache.move_to_end(coalition_id)
+        return value
+
+    def _store(self, coalition_ids: list[int], values: np.ndarray) -> None:
+        """
+        Stores the values of coalitions in the cache (evicting the least
+        recently used values if the cache is full).
+
+        Args:
+            coalition_ids (list[int]): The unique IDs (bitmaps) of the
+                coalitions.
+            values (np.ndarray): The values of the coalitions.
+
+        Returns:
+            None
+        """
+        if self.cache_capacity is not None and self.cache_capacity <= 0:
+            return
+        self._cache.update(zip(coalition_ids, values))
+        if self.cache_capacity is not None:
+            while len(self._cache) > self.cache_capacity:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+    def _compute(self, coalition_ids: np.ndarray) -> np.ndarray:
+        """
+        Computes the values of coalitions by the oracle (batch oracle is
+        preferred and called with at most batch_size IDs at once).
+
+        Args:
+            coalition_ids (np.ndarray): The IDs of the coalitions (1-D).
+
+        Returns:
+            np.ndarray: The values of the coalitions.
+        """
+        self._misses += len(coalition_ids)
+        if self._batch_oracle is None:
+            oracle = cast(ValueOracle, self._oracle)
+            return np.fromiter(
+                (oracle(id) for id in coalition_ids.tolist()),
+                dtype=Value,
+                count=len(coalition_ids),
+            )
+
+        dtype = (
+            np.uint32
+            if self.number_of_players <= MAXIMUM_NUMBER_OF_PLAYERS
+            else np.uint64
+        )
+        values = np.empty(len(coalition_ids), dtype=Value)
+        for start in range(0, len(coalition_ids), self.batch_size):
+            stop = start + self.batch_size
+            values[start:stop] = self._batch_oracle(
+                coalition_ids[start:stop].astype(dtype)
+            )
+        return values
+
+    def _value_of_id(self, coalition_id: int) -> Value:
+        """
+        Retrieves the value of a coalition from the cache or computes it by the
+        oracle (and caches it).
+
+        Args:
+            coalition_id (int): The ID (bitmap) of the coalition.
+
+        Returns:
+            Value: The value of the coalition.
+        """
+        value = self._lookup(coalition_id)
+        if value is None:
+            computed = self._compute(np.array([coalition_id]))
+            self._store([coalition_id], computed)
+            value = computed[0]
+        return value
+
+    def set_value(
+        self,
+        coalition: Coalition | Players | Player,  # noqa: ARG002
+        value: GameValueInput,  # noqa: ARG002
+    ) -> None:
+        """
+        Values of an oracle game are given by the oracle.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError(ORACLE_GAME_SET_VALUE_ERROR)
+
+    def _set_values_of_ids(
+        self,
+        coalition_ids: np.ndarray,  # noqa: ARG002
+        values: np.ndarray,  # noqa: ARG002
+    ) -> None:
+        """
+        Values of an oracle game are given by the oracle.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError(ORACLE_GAME_SET_VALUE_ERROR)
+
+    def get_value(self, coalition: Coalition | Players | Player) -> Value:
+        """
+        Retrieves the value of a coalition (computed by the oracle if it is not
+        cached).
+
+        Args:
+            coalition (Coalition | Players | Player): The coalition or player(s)
+                for which to retrieve the value.
+
+        Raises:
+            TypeError: If the coalition input is not of the correct type.
+            IndexError: If the coalition contains players not in the game.
+
+        Returns:
+            Value: The value of the coalition.
+        """
+        coalition_id = int(_as_coalition(coalition).id)
+        if coalition_id >> self.number_of_players:
+            raise IndexError(coalition_id)
+        return self._value_of_id(coalition_id)
+
+    def _evaluate(self, coalition_ids: np.ndarray) -> np.ndarray:
+        """
+        Retrieves the values of coalitions given by their IDs (bitmaps).
+
+        All values not in the cache are computed together (by the batch oracle
+        if the game has one) and then cached.
+
+        Args:
+            coalition_ids (np.ndarray): The IDs of the coalitions (any shape).
+
+        Returns:
+            np.ndarray: The values of the coalitions (same shape as the IDs).
+        """
+        ids = coalition_ids.ravel().tolist()
+        cache = self._cache
+        cached = [cache.get(coalition_id) for coalition_id in ids]
+        missing_positions = [
+            position for position, value in enumerate(cached) if value is None
+        ]
+        values = np.array(
+            [np.nan if value is None else value for value in cached],
+            dtype=Value,
+        )
+        # Mark the cached values as recently used
+        for coalition_id, value in zip(ids, cached):
+            if value is not None:
+                cache.move_to_end(coalition_id)
+        self._hits += len(ids) - len(missing_positions)
+
+        if missing_positions:
+            missing_ids, inverse = np.unique(
+                np.array(ids, dtype=np.int64)[missing_positions],
+                return_inverse=True,
+            )
+            computed = self._compute(missing_ids)
+            self._store(missing_ids.tolist(), computed)
+            values[missing_positions] = computed[inverse.ravel()]
+        return values.reshape(coalition_ids.shape)
+
+    def _all_values(self) -> np.ndarray:
+        """
+        Retrieves the values of all coalitions of the game (every value not in
+        the cache is computed by the oracle).
+
+        The values are cached only if all of them fit in the cache, otherwise
+        they would just evict each other, so all values are computed by the
+        oracle (in batches) straight into the array.
+
+        Returns:
+            np.ndarray: The values of all coalitions indexed by the IDs
+                (bitmaps) of the coalitions.
+        """
+        coalition_ids = np.arange(2**self.number_of_players)
+        if (
+            self.cache_capacity is not None
+            and len(coalition_ids) > self.cache_capacity
+        ):
+            return self._compute(coalition_ids)
+        return self._evaluate(coalition_ids)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the statistics of the cache.
+
+        Returns:
+            CacheInfo: The hits, misses, evictions, capacity and size of the
+                cache.
+        """
+        return CacheInfo(
+            self._hits,
+            self._misses,
+            self._evictions,
+            self.cache_capacity,
+            len(self._cache),
+        )
+
+    def cache_clear(self) -> None:
+        """
+        Removes all values from the cache (and the mask of missing values) and
+        resets the statistics.
+
+        Returns:
+            None
+        """
+        self._cache.clear()
+        self._missing_cache = None
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
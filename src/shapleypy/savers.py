@@ -2,13 +2,50 @@ from __future__ import annotations
 
 import csv
 import json
+from collections.abc import Iterable
+from typing import Any
 
 import numpy as np
 
-from shapleypy.constants import CSV_SEPARATOR_ERROR
+from shapleypy._chunked import chunk_slices
+from shapleypy._dtypes import is_missing, is_rational
+from shapleypy._typing import Value
+from shapleypy.coalition import Coalition
+from shapleypy.constants import CSV_SEPARATOR_ERROR, GAME_MEMMAP_DTYPE_ERROR
 from shapleypy.game import Game
 
 
+def _prepare_value(value: Value) -> Any:
+    """
+    Prepares the value of a coalition to be saved to a JSON file.
+
+    Args:
+        value (Value): The value to prepare.
+
+    Returns:
+        Any: The python number (numpy scalars) or the string of the fraction
+            (exact rational values, e.g. "1/3").
+    """
+    return value.item() if isinstance(value, np.generic) else str(value)
+
+
+def _all_values(game: Game) -> Iterable[tuple[Coalition, Value]]:
+    """
+    Returns all coalitions of the game (without the empty one) with their
+    values (retrieved at once).
+
+    Args:
+        game (Game): The game.
+
+    Returns:
+        Iterable[tuple[Coalition, Value]]: The coalitions and their values.
+    """
+    values = game.get_values_by_ids(
+        np.arange(1, 2**game.number_of_players, dtype=np.uint32)
+    )
+    return zip(game.all_coalitions, values)
+
+
 def _prepare_game_dict(game: Game) -> dict:
     """
     Prepares the game to be saved to a JSON file.
@@ -22,9 +59,9 @@ def _prepare_game_dict(game: Game) -> dict:
     return {
         "n": game.number_of_players,
         "values": {
-            str(list(coalition.get_players)): value
-            for coalition, value in game.get_values(game.all_coalitions)
-            if not np.isnan(value)
+            str(list(coalition.get_players)): _prepare_value(value)
+            for coalition, value in _all_values(game)
+            if not is_missing(value)
         },
     }
 
@@ -72,8 +109,8 @@ def save_game_to_csv(
     with open(filename, "w") as file:
         writer = csv.writer(file, delimiter=csv_separator)
         writer.writerow(["n", game.number_of_players])
-        for coalition, value in game.get_values(game.all_coalitions):
-            if not np.isnan(value):
+        for coalition, value in _all_values(game):
+            if not is_missing(value):
                 writer.writerow(
                     [
                         coalition_separator.join(
@@ -82,3 +119,29 @@ def save_game_to_csv(
                         value,
                     ]
                 )
+
+
+def save_game_to_memmap(game: Game, filename: str) -> None:
+    """
+    Saves the values of all coalitions of the game to a binary file (can be
+    loaded by the loaders as memory mapped game with the same dtype).
+
+    Args:
+        game (Game): The game to save.
+        filename (str): The path to the binary file.
+
+    Raises:
+        ValueError: If the game has exact rational values.
+
+    Returns:
+        None
+    """
+    if is_rational(game.dtype):
+        raise ValueError(GAME_MEMMAP_DTYPE_ERROR)
+    values = game._all_values()
+    file = np.memmap(
+        filename, dtype=values.dtype, mode="w+", shape=values.shape
+    )
+    for chunk in chunk_slices(values):
+        file[chunk] = values[chunk]
+    file.flush()
@@ -1,26 +1,81 @@
 from __future__ import annotations
 
+import os
+import sys
 import warnings
 from typing import Any
 
 import numpy as np
+from numpy.typing import DTypeLike
 
+from shapleypy._chunked import Prepare
+from shapleypy._dtypes import convert_value, missing_mask
 from shapleypy._typing import Value, ValueInput
 from shapleypy.constants import DEFAULT_VALUE, DEFAULT_VALUE_WARNING
+from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+
+# Directory of the package, warnings point at the first caller outside of it
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(__file__)) + os.sep
+
+
+def _warn_default_value() -> None:
+    """
+    Warns that the unchanged default value is used. The warning points at the
+    first caller outside of the package on Python 3.12+ (the solution concepts
+    reach the default value through different numbers of internal calls), at
+    the caller of the function setting the default value before.
+
+    Returns:
+        None
+
+    Raises:
+        RuntimeWarning: Always.
+    """
+    if sys.version_info >= (3, 12):
+        warnings.warn(
+            DEFAULT_VALUE_WARNING,
+            RuntimeWarning,
+            stacklevel=2,
+            skip_file_prefixes=(_PACKAGE_DIRECTORY,),
+        )
+    else:
+        warnings.warn(DEFAULT_VALUE_WARNING, RuntimeWarning, stacklevel=3)
+
+
+def _value_to_use(default_value: ValueInput | None, dtype: DTypeLike) -> Any:
+    """
+    Get the value set to the missing values.
+
+    Args:
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        dtype (DTypeLike): The dtype of the values.
+
+    Returns:
+        Any: The default value converted to the dtype.
+    """
+    if default_value is None:
+        return convert_value(DEFAULT_VALUE, dtype)
+    return convert_value(default_value, dtype)
 
 
 def set_default_value(
     values_array: np.ndarray[Any, np.dtype[Value]],
     default_value: ValueInput | None,
+    mask: np.ndarray | None = None,
 ) -> np.ndarray[Any, np.dtype[Value]]:
     """
     Set the default value to the missing values in the array for solution
-    concepts calculations.
+    concepts calculations (the default value is converted to the dtype of the
+    array, the missing values are set at once).
 
     Args:
         values_array (np.ndarray): The array of values to set the default value.
         default_value (ValueInput | None): The default value to set to the
             missing values (if None DEFAULT_VALUE from constants will be used).
+        mask (np.ndarray | None): The mask of missing values of the array (if
+            None it is computed).
 
     Returns:
         np.ndarray: The array with the default values set to the missing values.
@@ -28,18 +83,64 @@ def set_default_value(
     Raises:
         RuntimeWarning: If the default value is used and was not set by user.
     """
+    if mask is None:
+        mask = missing_mask(values_array)
+    if not mask.any():
+        return values_array
+
+    np.copyto(
+        values_array,
+        _value_to_use(default_value, values_array.dtype),
+        where=mask,
+    )
     if default_value is None:
-        value_to_use = DEFAULT_VALUE
-    else:
-        value_to_use = Value(default_value)
+        _warn_default_value()
 
-    used_default_value = False
-    for i in range(len(values_array)):
-        if np.isnan(values_array[i]):
-            values_array[i] = value_to_use
-            used_default_value = True
+    return values_array
 
-    if used_default_value and default_value is None:
-        warnings.warn(DEFAULT_VALUE_WARNING, RuntimeWarning, stacklevel=2)
 
-    return values_array
+def default_value_preparer(
+    game: Game | GamesBatch,
+    dtype: DTypeLike,
+    default_value: ValueInput | None,
+    values: np.ndarray | None = None,
+) -> Prepare | None:
+    """
+    Get the function preparing the chunks of values of a game for solution
+    concepts calculations (see iterate_subcubes). The chunks are converted to
+    the dtype and the missing values are set using the mask of missing values
+    of the game, so the values are not scanned again.
+
+    Args:
+        game (Game | GamesBatch): The game (or batch of games) whose values
+            are prepared.
+        dtype (DTypeLike): The dtype of the calculation.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        values (np.ndarray | None): The values of all coalitions already
+            retrieved by the caller (if None they are retrieved, for the mask
+            of missing values).
+
+    Returns:
+        Prepare | None: The function preparing the chunks or None if the chunks
+            can be used as they are (no missing values and the same dtype).
+
+    Raises:
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    mask, number_of_missing = game._missing_values(values)
+    if number_of_missing == 0:
+        if np.dtype(dtype) == game.dtype:
+            return None
+        return lambda chunk, _: np.asarray(chunk, dtype=dtype)
+
+    if default_value is None:
+        _warn_default_value()
+    value_to_use = _value_to_use(default_value, dtype)
+
+    def prepare(chunk: np.ndarray, chunk_slice: slice) -> np.ndarray:
+        prepared = np.array(chunk, dtype=dtype)
+        np.copyto(prepared, value_to_use, where=mask[..., chunk_slice])
+        return prepared
+
+    return prepare
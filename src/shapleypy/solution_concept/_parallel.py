@@ -0,0 +1,274 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from shapleypy._chunked import (
+    Prepare,
+    chunk_length,
+    chunk_slices,
+    number_of_blocks,
+)
+from shapleypy._dtypes import is_rational
+from shapleypy._typing import Player, ValueInput
+from shapleypy.constants import PARALLEL_N_JOBS_ERROR
+from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+from shapleypy.solution_concept._default_value import default_value_preparer
+
+# Function summing the contributions of given blocks (chunks) of the values
+# of a game for each player, called with the values, the players, the function
+# preparing the chunks (Prepare | None), the dtype of the calculation and the
+# keyword arguments chunk_size (int | None) and blocks (range | None for all
+# blocks)
+PartialSums = Callable[..., np.ndarray]
+
+
+class SharedValues(NamedTuple):
+    """
+    Description of the values of a game shared with worker processes (the
+    values are never pickled, the workers map them by the name).
+
+    Attributes:
+        name (str): The name of the shared memory block or the memory mapped
+            file.
+        in_file (bool): True if the values are memory mapped from the file.
+        dtype (np.dtype): The dtype of the values.
+        shape (tuple[int, ...]): The shape of the values.
+        offset (int): The offset of the values in the file.
+    """
+
+    name: str
+    in_file: bool
+    dtype: np.dtype
+    shape: tuple[int, ...]
+    offset: int = 0
+
+
+def number_of_tasks(n_jobs: int | None, executor: Executor | None) -> int:
+    """
+    Returns the number of tasks into which the computation is split.
+
+    Args:
+        n_jobs (int | None): The number of tasks (-1 for the number of
+            processors, None for one task or the number of processors if an
+            executor is given).
+        executor (Executor | None): The executor running the tasks.
+
+    Returns:
+        int: The number of tasks.
+
+    Raises:
+        ValueError: If n_jobs is not positive nor -1.
+    """
+    if n_jobs is None:
+        return 1 if executor is None else os.cpu_count() or 1
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(PARALLEL_N_JOBS_ERROR)
+    return n_jobs
+
+
+@contextmanager
+def _shared_values(
+    game: Game | GamesBatch,
+    values: np.ndarray,
+    dtype: np.dtype,
+    default_value: ValueInput | None,
+) -> Iterator[SharedValues]:
+    """
+    Shares the values of a game with worker processes. The values of games in
+    memory mapped files without missing values are shared by the file, other
+    values are copied once (chunk by chunk, converted to the dtype and with
+    the default value set to the missing values) to a shared memory block
+    which is removed at the end.
+
+    Args:
+        game (Game | GamesBatch): The game (or batch) whose values are shared.
+        values (np.ndarray): The values of all coalitions of the game.
+        dtype (np.dtype): The dtype of the calculation.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+
+    Yields:
+        SharedValues: The description of the shared values.
+
+    Raises:
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    if (
+        isinstance(values, np.memmap)
+        and values.filename is not None
+        and values.mode in ("r", "r+", "w+")
+        and game._missing_values(values)[1] == 0
+    ):
+        yield SharedValues(
+            values.filename, True, values.dtype, values.shape, values.offset
+        )
+        return
+
+    prepare = default_value_preparer(game, dtype, default_value, values)
+    memory = SharedMemory(create=True, size=values.size * dtype.itemsize)
+    try:
+        shared = np.ndarray(values.shape, dtype=dtype, buffer=memory.buf)
+        for chunk in chunk_slices(values):
+            shared[..., chunk] = (
+                values[..., chunk]
+                if prepare is None
+                else prepare(values[..., chunk], chunk)
+            )
+        del shared
+        yield SharedValues(memory.name, False, dtype, values.shape)
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def _partial_sums_of_shared(
+    partial_sums: PartialSums,
+    shared_values: SharedValues,
+    players: Sequence[Player],
+    dtype: np.dtype,
+    *,
+    chunk_size: int,
+    blocks: range,
+) -> np.ndarray:
+    """
+    Maps the shared values of a game and sums the contributions of the given
+    blocks of them (run by worker processes).
+
+    Args:
+        partial_sums (PartialSums): The function summing the contributions.
+        shared_values (SharedValues): The description of the shared values.
+        players (Sequence[Player]): The players.
+        dtype (np.dtype): The dtype of the calculation.
+        chunk_size (int): The length of chunks (blocks).
+        blocks (range): The blocks to process.
+
+    Returns:
+        np.ndarray: The sums of the contributions for each player.
+    """
+    prepare: Prepare | None = None
+    if shared_values.dtype != dtype:
+        prepare = lambda chunk, _: np.asarray(chunk, dtype=dtype)  # noqa: E731
+
+    if shared_values.in_file:
+        values = np.memmap(
+            shared_values.name,
+            dtype=shared_values.dtype,
+            mode="r",
+            offset=shared_values.offset,
+            shape=shared_values.shape,
+        )
+        return partial_sums(
+            values,
+            players,
+            prepare,
+            dtype,
+            chunk_size=chunk_size,
+            blocks=blocks,
+        )
+
+    memory = SharedMemory(name=shared_values.name)
+    try:
+        shared = np.ndarray(
+            shared_values.shape, dtype=shared_values.dtype, buffer=memory.buf
+        )
+        sums = partial_sums(
+            shared,
+            players,
+            prepare,
+            dtype,
+            chunk_size=chunk_size,
+            blocks=blocks,
+        )
+        del shared
+        return sums
+    finally:
+        memory.close()
+
+
+def sum_over_blocks(
+    game: Game | GamesBatch,
+    partial_sums: PartialSums,
+    players: Sequence[Player],
+    dtype: DTypeLike,
+    default_value: ValueInput | None,
+    *,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+) -> np.ndarray:
+    """
+    Sums the contributions of all blocks (chunks) of the values of a game for
+    each player, the blocks are split into contiguous ranges processed in
+    parallel by worker processes (or by the given executor) over the shared
+    values of the game and the partial sums are added up.
+
+    Games with exact rational values (python objects cannot be shared) and
+    computations split into one task are computed in this process.
+
+    Args:
+        game (Game | GamesBatch): The game (or the batch of games, the sums
+            have a row per game).
+        partial_sums (PartialSums): The function summing the contributions
+            (must be picklable, i.e. a module level function).
+        players (Sequence[Player]): The players.
+        dtype (DTypeLike): The dtype of the calculation.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        n_jobs (int | None): The number of tasks (-1 for the number of
+            processors, None for one task or the number of processors if an
+            executor is given).
+        executor (Executor | None): The executor running the tasks (if None a
+            process pool with n_jobs workers is used).
+
+    Returns:
+        np.ndarray: The sums of the contributions for each player.
+
+    Raises:
+        ValueError: If n_jobs is not positive nor -1.
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    dtype = np.dtype(dtype)
+    values = game._all_values()
+    tasks = number_of_tasks(n_jobs, executor)
+    if tasks == 1 or is_rational(dtype):
+        prepare = default_value_preparer(game, dtype, default_value, values)
+        return partial_sums(values, players, prepare, dtype)
+
+    # Chunks short enough to give each task at least one block (the chunk
+    # size counts the values of all rows, see chunk_length)
+    rows = values.size // values.shape[-1]
+    chunk_size = min(values.size // tasks, chunk_length(values) * rows)
+    blocks = np.array_split(
+        np.arange(number_of_blocks(values, chunk_size)), tasks
+    )
+    ranges = [range(b[0], b[-1] + 1) for b in blocks if len(b) > 0]
+
+    with _shared_values(game, values, dtype, default_value) as shared_values:
+        pool = executor or ProcessPoolExecutor(max_workers=len(ranges))
+        try:
+            futures = [
+                pool.submit(
+                    _partial_sums_of_shared,
+                    partial_sums,
+                    shared_values,
+                    players,
+                    dtype,
+                    chunk_size=chunk_size,
+                    blocks=blocks_range,
+                )
+                for blocks_range in ranges
+            ]
+            return np.sum([future.result() for future in futures], axis=0)
+        finally:
+            if executor is None:
+                pool.shutdown()
@@ -1,140 +1,327 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import Executor
+from typing import Any
 
 import numpy as np
 
+from shapleypy._dtypes import computation_dtype, result_dtype
 from shapleypy._typing import Player, Value, ValueInput
-from shapleypy.coalition import Coalition
+from shapleypy.coalition import player_memberships
+from shapleypy.constants import CHUNK_SIZE
 from shapleypy.game import Game
-from shapleypy.solution_concept._default_value import set_default_value
+from shapleypy.games_batch import GamesBatch
+from shapleypy.solution_concept.semivalue import (
+    BANZHAF,
+    _semivalues_of_players,
+)
+from shapleypy.sparse_game import SparseGame
+from shapleypy.weighted_voting_game import WeightedVotingGame
 
 
-def _banzhaf_value_of_player(
-    game: Game,
-    player: Player,
-    factor: int,
+def _banzhaf_changes(
+    number_of_players: int,
+    players: list[Player],
+    coalition_ids: np.ndarray,
+    differences: np.ndarray,
+) -> np.ndarray:
+    """
+    Sum the changes of the Banzhaf values of given players caused by adding
+    the differences to the values of the coalitions (multiplied by 2^(n-1)),
+    in time proportional to the number of coalitions.
+
+    By linearity, the change of v(T) by d changes the Banzhaf values of the
+    members of T by d / 2^(n-1) and of the other players by the opposite.
+
+    Args:
+        number_of_players (int): The number of players in the game.
+        players (list[Player]): The players whose changes are summed.
+        coalition_ids (np.ndarray): The IDs (bitmaps) of the coalitions.
+        differences (np.ndarray): The differences of the values of the
+            coalitions (in the dtype of the calculation).
+
+    Returns:
+        np.ndarray: The changes multiplied by 2^(n-1) (in the given order).
+    """
+    changes = np.zeros(len(players), dtype=differences.dtype)
+    for start in range(0, len(coalition_ids), CHUNK_SIZE):
+        chunk = slice(start, start + CHUNK_SIZE)
+        memberships = player_memberships(
+            coalition_ids[chunk], number_of_players
+        )
+        chunk_differences = differences[chunk][:, None]
+        changes += np.where(
+            memberships[:, players], chunk_differences, -chunk_differences
+        ).sum(axis=0)
+    return changes
+
+
+def _banzhaf_values_of_sparse_game(
+    game: SparseGame,
+    players: Iterable[Player],
     default_value: ValueInput | None,
-) -> Value:
+) -> np.ndarray[Any, np.dtype[Value]]:
     """
-    Compute the Banzhaf value of a player in a game (precomputed factor).
+    Compute the Banzhaf values of given players in a sparse game in time
+    proportional to the number of defined coalitions.
+
+    The game is the game with all nonempty coalitions of the default value c
+    plus the games nonzero just in a defined coalition T (with value v(T) - c).
+    By linearity, c contributes c / 2^(n-1) to every player and such game of T
+    contributes as the change of v(T) by v(T) - c (see _banzhaf_changes).
 
     Args:
-        game (Game): The game for which to compute the Banzhaf value.
-        player (Player): The player for which to compute the Banzhaf value.
-        factor (int): The factor to divide the Banzhaf value by (since it is n!
-            it takes time to compute so reusing it).
+        game (SparseGame): The game for which to compute the Banzhaf values.
+        players (Iterable[Player]): The players for which to compute the
+            Banzhaf values.
         default_value (ValueInput | None): The default value to set to the
             missing values (if None DEFAULT_VALUE from constants will be used).
 
     Returns:
-        Value: The Banzhaf value of the player.
+        np.ndarray: The Banzhaf values of the players (in the given order).
 
     Raises:
         RuntimeWarning: If the default value is used and was not set by user.
     """
-    coalitions_without_player = np.array(
-        list(
-            {
-                coalition - player
-                for coalition in Coalition.all_coalitions(
-                    game.number_of_players
-                )
-            }
-        )
-    )
-    coalitions_with_player = np.array(
-        [coalition + player for coalition in coalitions_without_player]
+    ids, values, value_of_others = game._defined_values_with_default(
+        default_value
     )
+    players = list(players)
 
-    values_of_coalitions_without_player = np.array(
-        [value for _, value in game.get_values(coalitions_without_player)]
+    # The empty coalition (always defined with zero) is the first one
+    payoffs = np.full(len(players), value_of_others, dtype=values.dtype)
+    payoffs += _banzhaf_changes(
+        game.number_of_players,
+        players,
+        ids[1:],
+        values[1:] - value_of_others,
     )
-    values_of_coalitions_with_player = np.array(
-        [value for _, value in game.get_values(coalitions_with_player)]
+    return (payoffs / 2 ** (game.number_of_players - 1)).astype(
+        result_dtype(game.dtype), copy=False
     )
 
-    values_of_coalitions_without_player = set_default_value(
-        values_of_coalitions_without_player, default_value
-    )
-    values_of_coalitions_with_player = set_default_value(
-        values_of_coalitions_with_player, default_value
-    )
 
-    marginal_contributions = (
-        values_of_coalitions_with_player - values_of_coalitions_without_player
+def _banzhaf_values_of_weighted_voting_game(
+    game: WeightedVotingGame, players: Iterable[Player]
+) -> np.ndarray[Any, np.dtype[Value]]:
+    """
+    Compute the Banzhaf indices of given players in a weighted voting game
+    exactly from their numbers of swings divided by 2^(n-1) (correctly
+    rounded).
+
+    Args:
+        game (WeightedVotingGame): The game for which to compute the indices.
+        players (Iterable[Player]): The players for which to compute the
+            indices.
+
+    Returns:
+        np.ndarray: The Banzhaf indices of the players (in the given order).
+    """
+    factor = 2 ** (game.number_of_players - 1)
+    return np.array(
+        [int(swings) / factor for swings in game.swings(players)], dtype=Value
     )
 
-    return np.sum(marginal_contributions) / factor
+
+def _banzhaf_values_from_dividends(
+    game: Game,
+    players: Iterable[Player],
+    coalition_ids: np.ndarray,
+    dividends: np.ndarray,
+) -> np.ndarray[Any, np.dtype[Value]]:
+    """
+    Compute the Banzhaf values of given players in a game from its Harsanyi
+    dividends in time proportional to the number of nonzero dividends.
+
+    The Banzhaf value of player i is the sum of m(S) / 2^(|S| - 1) over all
+    coalitions S containing i.
+
+    Args:
+        game (Game): The game for which to compute the Banzhaf values.
+        players (Iterable[Player]): The players for which to compute the
+            Banzhaf values.
+        coalition_ids (np.ndarray): The IDs (bitmaps) of nonempty coalitions
+            with nonzero dividends.
+        dividends (np.ndarray): The dividends of the coalitions.
+
+    Returns:
+        np.ndarray: The Banzhaf values of the players (in the given order).
+    """
+    dtype = computation_dtype(game.dtype)
+    players = list(players)
+
+    payoffs = np.zeros(len(players), dtype=dtype)
+    for start in range(0, len(coalition_ids), CHUNK_SIZE):
+        chunk = slice(start, start + CHUNK_SIZE)
+        memberships = player_memberships(
+            coalition_ids[chunk], game.number_of_players
+        )
+        # Python ints for rational games, so the shares are exact
+        factors = (1 << (memberships.sum(axis=1) - 1)).astype(dtype)
+        shares = dividends[chunk].astype(dtype) / factors
+        payoffs += np.where(memberships[:, players], shares[:, None], 0).sum(
+            axis=0
+        )
+    return payoffs.astype(result_dtype(game.dtype), copy=False)
+
+
+def _banzhaf_values_of_players(
+    game: Game | GamesBatch,
+    players: Iterable[Player],
+    default_value: ValueInput | None,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+) -> np.ndarray[Any, np.dtype[Value]]:
+    """
+    Compute the Banzhaf values of given players in a game directly from the
+    values array of the game.
+
+    The values are processed in chunks (see iterate_subcubes), for each player
+    the coalitions without the player and the same coalitions with the player
+    added are two views of the chunks, so no coalition objects are created and
+    games stored in memory mapped files are never loaded at once. Games with
+    exact rational values are computed exactly (result of gmpy2.mpq objects),
+    other games are computed in Value (float32 games give float32 result).
+    Weighted voting games are computed exactly from the swings of players
+    (see WeightedVotingGame), sparse games from their defined coalitions
+    only, games with attached Harsanyi dividends (see game_from_dividends)
+    from the dividends.
+    Other games are computed by the semivalue engine (see
+    _semivalues_of_players) and can be split into ranges of chunks computed
+    in parallel by worker processes mapping the shared values of the game.
+    Batches of games are computed at once (one row of values per game).
+
+    Args:
+        game (Game | GamesBatch): The game (or batch of games, the result
+            has a row per game) for which to compute the Banzhaf values.
+        players (Iterable[Player]): The players for which to compute the
+            Banzhaf values.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        n_jobs (int | None): The number of parallel tasks (-1 for the number
+            of processors, None for no parallelism unless executor is given).
+        executor (Executor | None): The executor running the parallel tasks
+            (if None a process pool with n_jobs workers is used).
+
+    Returns:
+        np.ndarray: The Banzhaf values of the players (in the given order).
+
+    Raises:
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    if isinstance(game, WeightedVotingGame):
+        return _banzhaf_values_of_weighted_voting_game(game, players)
+    if isinstance(game, SparseGame):
+        return _banzhaf_values_of_sparse_game(game, players, default_value)
+    if isinstance(game, Game):
+        known_dividends = game._known_dividends()
+        if known_dividends is not None:
+            return _banzhaf_values_from_dividends(
+                game, players, *known_dividends
+            )
+    return _semivalues_of_players(
+        game,
+        players,
+        [BANZHAF],
+        default_value,
+        n_jobs=n_jobs,
+        executor=executor,
+    )[0]
 
 
 def banzhaf_value_of_player(
-    game: Game, player: Player, default_value: ValueInput | None = None
+    game: Game | GamesBatch,
+    player: Player,
+    default_value: ValueInput | None = None,
 ) -> Value:
     """
     Compute the Banzhaf value of a player in a game.
 
     Args:
-        game (Game): The game for which to compute the Banzhaf value.
+        game (Game | GamesBatch): The game (or batch of games, the result
+            has a row per game) for which to compute the Banzhaf value.
         player (Player): The player for which to compute the Banzhaf value.
         default_value (ValueInput | None): The default value to set to the
             missing values (if None DEFAULT_VALUE from constants will be used).
 
     Returns:
-        Value: The Banzhaf value of the player.
+        Value: The Banzhaf value of the player (an array with a value per game
+            for a batch).
 
     Raises:
         RuntimeWarning: If the default value is used and was not set by user.
     """
-    factor = 2 ** (game.number_of_players - 1)
-    return _banzhaf_value_of_player(game, player, factor, default_value)
+    return np.take(
+        _banzhaf_values_of_players(game, [player], default_value), 0, axis=-1
+    )
 
 
 def banzhaf_value_of_game(
-    game: Game, default_value: ValueInput | None = None
-) -> Iterable[Value]:
+    game: Game | GamesBatch,
+    default_value: ValueInput | None = None,
+    *,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+) -> np.ndarray[Any, np.dtype[Value]]:
     """
     Compute the Banzhaf values of all players in a game.
 
     Args:
-        game (Game): The game for which to compute the Banzhaf values.
+        game (Game | GamesBatch): The game (or batch of games, the result
+            has a row per game) for which to compute the Banzhaf values.
         default_value (ValueInput | None): The default value to set to the
             missing values (if None DEFAULT_VALUE from constants will be used).
+        n_jobs (int | None): The number of parallel tasks (-1 for the number
+            of processors, None for no parallelism unless executor is given).
+        executor (Executor | None): The executor running the parallel tasks
+            (if None a process pool with n_jobs workers is used).
 
     Returns:
-        Iterable[Value]: The Banzhaf values of all players (payoff vector).
+        np.ndarray: The Banzhaf values of all players (payoff vector).
 
     Raises:
+        ValueError: If n_jobs is not positive nor -1.
         RuntimeWarning: If the default value is used and was not set by user.
     """
-    factor = 2 ** (game.number_of_players - 1)
-    for player in range(game.number_of_players):
-        yield _banzhaf_value_of_player(game, player, factor, default_value)
+    return _banzhaf_values_of_players(
+        game, range(game.number_of_players), default_value, n_jobs, executor
+    )
 
 
 def banzhaf(
-    game: Game,
+    game: Game | GamesBatch,
     player: Player | None = None,
     default_value: ValueInput | None = None,
+    *,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
 ) -> Value | Iterable[Value]:
     """
     Compute the Banzhaf value of a player in a game or the Banzhaf values of
     all players in a game.
 
     Args:
-        game (Game): The game for which to compute the Banzhaf value(s).
+        game (Game | GamesBatch): The game (or batch of games, the result
+            has a row per game) for which to compute the Banzhaf value(s).
         player (Player | None): The player for which to compute the Banzhaf
             value (if None Banzhaf values of all players will be computed).
         default_value (ValueInput | None): The default value to set to the
             missing values (if None DEFAULT_VALUE from constants will be used).
+        n_jobs (int | None): The number of parallel tasks for the values of
+            all players (see banzhaf_value_of_game).
+        executor (Executor | None): The executor running the parallel tasks.
 
     Returns:
         Value | Iterable[Value]: The Banzhaf value of the player or the Banzhaf
             values of all players in the game.
 
     Raises:
+        ValueError: If n_jobs is not positive nor -1.
         RuntimeWarning: If the default value is used and was not set by user.
     """
     if player is not None:
         return banzhaf_value_of_player(game, player, default_value)
-    return banzhaf_value_of_game(game, default_value)
+    return banzhaf_value_of_game(
+        game, default_value, n_jobs=n_jobs, executor=executor
+    )
@@ -15,6 +15,7 @@ from shapleypy._typing import Value, ValueInput
 from shapleypy.coalition import Coalition
 from shapleypy.game import Game
 from shapleypy.solution_concept._default_value import set_default_value
+from shapleypy.sparse_game import SparseGame
 
 
 def _get_payoff(
@@ -35,6 +36,73 @@ def _get_payoff(
     return np.sum(np.array(payoff_vector)[list(coalition.get_players)])
 
 
+def _as_integer_ratio(value: Value) -> tuple[int, int]:
+    """
+    Get the value as a fraction of integers (exactly, for games of any dtype).
+
+    Args:
+        value (Value): The value (float, integer or rational).
+
+    Returns:
+        tuple[int, int]: The numerator and the denominator of the value.
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value), 1
+    return value.as_integer_ratio()
+
+
+def _constraints(
+    game: Game, default_value: ValueInput | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the coalitions whose constraints define the core of a game and their
+    values (the missing values are set at once).
+
+    For a sparse game with the value c of the coalitions which are not defined
+    such that c <= x(S) for every nonempty S and every x with x_i >= v({i}),
+    the constraints of the coalitions which are not defined are implied by the
+    constraints of singletons, so just the defined coalitions, singletons and
+    the grand coalition are used. Otherwise all coalitions are used.
+
+    Args:
+        game (Game): The game for which to get the constraints.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The sorted IDs (bitmaps) of the
+            coalitions (the last one is the grand coalition) and their values.
+
+    Raises:
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    if isinstance(game, SparseGame):
+        ids, values, value_of_others = game._defined_values_with_default(
+            default_value
+        )
+        singletons = np.left_shift(1, np.arange(game.number_of_players))
+        positions = np.minimum(np.searchsorted(ids, singletons), len(ids) - 1)
+        values_of_singletons = np.where(
+            ids[positions] == singletons, values[positions], value_of_others
+        )
+        # The lowest payoff of a nonempty coalition given by singletons
+        negative = values_of_singletons[values_of_singletons < 0]
+        lowest_payoff = (
+            negative.sum() if len(negative) > 0 else values_of_singletons.min()
+        )
+        if value_of_others <= lowest_payoff:
+            ids = np.union1d(
+                np.union1d(ids, singletons), [2**game.number_of_players - 1]
+            )
+            return ids, set_default_value(game._evaluate(ids), default_value)
+
+    values = game._all_values()
+    mask, number_of_missing = game._missing_values(values)
+    if number_of_missing > 0:
+        values = set_default_value(np.array(values), default_value, mask)
+    return np.arange(len(values)), values
+
+
 def _get_polyhedron_of_game(
     game: Game, default_value: ValueInput | None = None
 ) -> ppl.Polyhedron:
@@ -53,14 +121,10 @@ def _get_polyhedron_of_game(
         RuntimeWarning: If the default value is used and was not set by user.
     """
     constrain_system = ppl.Constraint_System()
+    ids, values = _constraints(game, default_value)
 
     # Just preimputations
-    numerator, denominator = set_default_value(
-        np.array(
-            [game.get_value(Coalition.grand_coalition(game.number_of_players))]
-        ),
-        default_value,
-    )[0].as_integer_ratio()
+    numerator, denominator = _as_integer_ratio(values[-1])
     constrain_system.insert(
         ppl.Linear_Expression(
             dict.fromkeys(range(game.number_of_players), 1 * denominator),
@@ -69,13 +133,14 @@ def _get_polyhedron_of_game(
         == numerator
     )
 
-    for coalition in game.all_coalitions:
-        numerator, denominator = set_default_value(
-            np.array([game.get_value(coalition)]), default_value
-        )[0].as_integer_ratio()
+    for coalition_id, value in zip(ids.tolist(), values):
+        numerator, denominator = _as_integer_ratio(value)
         constrain_system.insert(
             ppl.Linear_Expression(
-                dict.fromkeys(coalition.get_players, 1 * denominator), 0
+                dict.fromkeys(
+                    Coalition(coalition_id).get_players, 1 * denominator
+                ),
+                0,
             )
             >= numerator
         )
@@ -125,17 +190,15 @@ def solution_in_core(
     Raises:
         RuntimeWarning: If the default value is used and was not set by user.
     """
+    ids, values = _constraints(game, default_value)
     return _get_payoff(
         Coalition.grand_coalition(game.number_of_players),
         np.array(payoff_vector),
     ) == game.get_value(
         Coalition.grand_coalition(game.number_of_players)
     ) and all(
-        _get_payoff(coalition, payoff_vector)
-        >= set_default_value(
-            np.array([game.get_value(coalition)]), default_value
-        )[0]
-        for coalition in game.all_coalitions
+        _get_payoff(Coalition(coalition_id), payoff_vector) >= value
+        for coalition_id, value in zip(ids.tolist(), values)
     )
 
 
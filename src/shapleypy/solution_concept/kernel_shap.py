@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from shapleypy._typing import Player, Value, ValueInput
+from shapleypy.constants import (
+    KERNEL_SHAP_MAXIMUM_NUMBER_OF_PLAYERS,
+    KERNEL_SHAP_NUMBER_OF_PLAYERS_ERROR,
+    SAMPLING_NUMBER_OF_SAMPLES_ERROR,
+)
+from shapleypy.game import Game
+from shapleypy.solution_concept.shapley_sampling import _evaluate_coalitions
+
+
+def _sample_kernel_coalitions(
+    number_of_players: int,
+    number_of_samples: int,
+    generator: np.random.Generator,
+    *,
+    paired: bool,
+) -> np.ndarray:
+    """
+    Sample nonempty proper coalitions from the Shapley kernel distribution,
+    the size s with probability proportional to (n - 1) / (s (n - s)) and the
+    coalition uniformly among the coalitions of the size.
+
+    Args:
+        number_of_players (int): The number of players (at least two).
+        number_of_samples (int): The number of coalitions (rounded up to even
+            if paired).
+        generator (np.random.Generator): Random generator to use.
+        paired (bool): If True, every coalition is followed by its complement
+            (antithetic pairs).
+
+    Returns:
+        np.ndarray: The boolean memberships of shape (number of coalitions,
+            number_of_players).
+    """
+    n = number_of_players
+    sizes = np.arange(1, n)
+    probabilities = (n - 1) / (sizes * (n - sizes))
+    count = -(-number_of_samples // 2) if paired else number_of_samples
+    sampled_sizes = generator.choice(
+        sizes, size=count, p=probabilities / probabilities.sum()
+    )
+    ranks = np.argsort(np.argsort(generator.random((count, n)), axis=1))
+    members = ranks < sampled_sizes[:, None]
+    if paired:
+        members = np.concatenate([members, ~members])
+    return members
+
+
+def _kernel_shap_values(
+    game: Game,
+    default_value: ValueInput | None,
+    number_of_samples: int,
+    generator: np.random.Generator,
+    *,
+    paired: bool,
+) -> np.ndarray[Any, np.dtype[Value]]:
+    """
+    Estimate the Shapley values of all players by the constrained weighted
+    least squares regression of the values of coalitions sampled from the
+    Shapley kernel (see kernel_shap).
+
+    Args:
+        game (Game): The game to estimate.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        number_of_samples (int): The number of sampled coalitions.
+        generator (np.random.Generator): Random generator to use.
+        paired (bool): If True, coalitions are sampled with their complements.
+
+    Returns:
+        np.ndarray: The estimated Shapley values of all players.
+
+    Raises:
+        ValueError: If the game has too many players or the number of samples
+            is not positive.
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    n = game.number_of_players
+    if n > KERNEL_SHAP_MAXIMUM_NUMBER_OF_PLAYERS:
+        raise ValueError(KERNEL_SHAP_NUMBER_OF_PLAYERS_ERROR)
+    if number_of_samples < 1:
+        raise ValueError(SAMPLING_NUMBER_OF_SAMPLES_ERROR)
+    bits = np.left_shift(1, np.arange(n, dtype=np.int64))
+    value_of_empty, value_of_grand = _evaluate_coalitions(
+        game, np.array([0, bits.sum()]), default_value
+    )
+    total = value_of_grand - value_of_empty
+    if n == 1:
+        return np.array([total], dtype=Value)
+
+    members = _sample_kernel_coalitions(
+        n, number_of_samples, generator, paired=paired
+    )
+    coalition_ids = np.where(members, bits, 0).sum(axis=1)
+    values = (
+        _evaluate_coalitions(game, coalition_ids, default_value)
+        - value_of_empty
+    )
+
+    # The sampling distribution is the kernel, so the weights are uniform
+    features = members.astype(Value)
+    a = features.T @ features / len(features)
+    b = features.T @ values / len(features)
+    solutions = np.linalg.lstsq(
+        a, np.column_stack([b, np.ones(n)]), rcond=None
+    )[0]
+    a_inv_b, a_inv_ones = solutions.T
+    # Lagrange multiplier of the efficiency constraint sum(phi) = v(N) - v(0)
+    multiplier = (a_inv_b.sum() - total) / a_inv_ones.sum()
+    return a_inv_b - multiplier * a_inv_ones
+
+
+def kernel_shap(
+    game: Game,
+    player: Player | None = None,
+    default_value: ValueInput | None = None,
+    *,
+    number_of_samples: int = 2048,
+    paired: bool = True,
+    generator: np.random.Generator | None = None,
+) -> Value | np.ndarray[Any, np.dtype[Value]]:
+    """
+    Estimate the Shapley value of a player in a game or the Shapley values of
+    all players in a game by KernelSHAP, the weighted least squares
+    regression of the values of sampled coalitions (the same call as shapley).
+
+    The coalitions are sampled from the Shapley kernel (size s with
+    probability proportional to (n - 1) / (s (n - s))), optionally in pairs
+    with their complements, and only their values are evaluated, so games of
+    up to 63 players given by an oracle (OracleGame, evaluated by its batch
+    oracle in batches) can be estimated. The estimate is the exact solution
+    of the regression with the efficiency constraint (the values sum to
+    v(N) - v(empty coalition)).
+
+    Args:
+        game (Game): The game (e.g. an OracleGame) to estimate.
+        player (Player | None): The player for which to estimate the Shapley
+            value (if None Shapley values of all players will be estimated).
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        number_of_samples (int): The number of sampled coalitions.
+        paired (bool): If True, coalitions are sampled with their complements
+            (paired sampling).
+        generator (np.random.Generator | None): Random generator to use (if
+            None a new generator is created).
+
+    Returns:
+        Value | np.ndarray: The estimated Shapley value of the player or the
+            estimated Shapley values of all players in the game (payoff
+            vector).
+
+    Raises:
+        ValueError: If the game has more than 63 players or the number of
+            samples is not positive.
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    if generator is None:
+        generator = np.random.default_rng()
+    values = _kernel_shap_values(
+        game, default_value, number_of_samples, generator, paired=paired
+    )
+    return values if player is None else values[player]
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from shapleypy._dtypes import computation_dtype, missing_mask, result_dtype
+from shapleypy._typing import Value, ValueInput
+from shapleypy.game import Game
+from shapleypy.solution_concept._default_value import _value_to_use
+from shapleypy.solution_concept.banzhaf_value import (
+    _banzhaf_changes,
+    _banzhaf_values_of_players,
+)
+from shapleypy.solution_concept.semivalue import SHAPLEY, semivalue_weights
+from shapleypy.solution_concept.shapley_value import (
+    _shapley_changes,
+    _shapley_values_of_players,
+)
+
+
+class MaintainedSolution:
+    """
+    Shapley and Banzhaf values of all players in a game kept up to date while
+    the values of coalitions are set by set_value and set_values of the game.
+
+    The values are computed once and then every value set changes them by the
+    closed form contribution of the change of the value (see _shapley_changes
+    and _banzhaf_changes) in O(n) operations. Values modified directly (e.g.
+    by normalizations) make the solution compute the values again when they
+    are retrieved.
+
+    Attributes:
+        game (Game): The game whose values are maintained.
+        default_value (ValueInput | None): The default value set to the
+            missing values (if None DEFAULT_VALUE from constants is used).
+
+    Methods:
+        shapley_values: Returns the current Shapley values.
+        banzhaf_values: Returns the current Banzhaf values.
+        detach: Stops updating the values.
+        _values_set: Updates the values by the values set in the game
+            (see ValuesObserver).
+    """
+
+    def __init__(
+        self, game: Game, default_value: ValueInput | None = None
+    ) -> None:
+        """
+        Initializes a new instance of the MaintainedSolution class (computes
+        the values and attaches the solution to the game).
+
+        Args:
+            game (Game): The game whose values are maintained.
+            default_value (ValueInput | None): The default value to set to the
+                missing values (if None DEFAULT_VALUE from constants will be
+                used).
+
+        Raises:
+            RuntimeWarning: If the default value is used and was not set by
+                user.
+        """
+        self.game = game
+        self.default_value = default_value
+        self._dtype = computation_dtype(game.dtype)
+        self._players = list(range(game.number_of_players))
+        self._compute()
+        game._attach_observer(self)
+
+    def _compute(self) -> None:
+        """
+        Computes the values from the values of the game.
+
+        Returns:
+            None
+        """
+        self._shapley = np.array(
+            _shapley_values_of_players(
+                self.game, self._players, self.default_value
+            ),
+            dtype=self._dtype,
+        )
+        self._banzhaf = np.array(
+            _banzhaf_values_of_players(
+                self.game, self._players, self.default_value
+            ),
+            dtype=self._dtype,
+        )
+        self._version = self.game._version
+
+    def _values_set(
+        self,
+        coalition_ids: np.ndarray,
+        old_values: np.ndarray,
+        new_values: np.ndarray,
+    ) -> None:
+        """
+        Updates the values by the values set in the game (skipped if the
+        values of the game were modified directly since the last computation).
+
+        Args:
+            coalition_ids (np.ndarray): The unique IDs (bitmaps) of the
+                coalitions whose values were set.
+            old_values (np.ndarray): The values before.
+            new_values (np.ndarray): The values set.
+
+        Returns:
+            None
+        """
+        if self._version != self.game._version:
+            return
+        differences = self._prepared(new_values) - self._prepared(old_values)
+        n = self.game.number_of_players
+        _, divisor = semivalue_weights(SHAPLEY, n, self._dtype)
+        self._shapley += (
+            _shapley_changes(n, self._players, coalition_ids, differences)
+            / divisor
+        )
+        self._banzhaf += _banzhaf_changes(
+            n, self._players, coalition_ids, differences
+        ) / 2 ** (n - 1)
+
+    def _prepared(self, values: np.ndarray) -> np.ndarray:
+        """
+        Converts the values to the dtype of the calculation and sets the
+        default value to the missing values.
+
+        Args:
+            values (np.ndarray): The values of coalitions of the game.
+
+        Returns:
+            np.ndarray: The prepared values.
+        """
+        prepared = np.array(values, dtype=self._dtype)
+        np.copyto(
+            prepared,
+            _value_to_use(self.default_value, self._dtype),
+            where=missing_mask(prepared),
+        )
+        return prepared
+
+    def _check_version(self) -> None:
+        """
+        Computes the values again if the values of the game were modified
+        directly since the last computation.
+
+        Returns:
+            None
+        """
+        if self._version != self.game._version:
+            self._compute()
+
+    @property
+    def shapley_values(self) -> np.ndarray[Any, np.dtype[Value]]:
+        """
+        Returns the current Shapley values of all players (payoff vector).
+
+        Returns:
+            np.ndarray: The Shapley values (a copy).
+        """
+        self._check_version()
+        return self._shapley.astype(result_dtype(self.game.dtype))
+
+    @property
+    def banzhaf_values(self) -> np.ndarray[Any, np.dtype[Value]]:
+        """
+        Returns the current Banzhaf values of all players.
+
+        Returns:
+            np.ndarray: The Banzhaf values (a copy).
+        """
+        self._check_version()
+        return self._banzhaf.astype(result_dtype(self.game.dtype))
+
+    def detach(self) -> None:
+        """
+        Stops updating the values (the solution is detached from the game).
+
+        Returns:
+            None
+        """
+        self.game._detach_observer(self)
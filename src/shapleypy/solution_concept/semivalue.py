@@ -0,0 +1,461 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor
+from functools import lru_cache, partial
+from math import exp, factorial, lgamma
+from typing import Any, NamedTuple, Union
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from shapleypy._chunked import Prepare, iterate_subcubes, subcube_axes
+from shapleypy._dtypes import computation_dtype, convert_values, result_dtype
+from shapleypy._typing import Player, Value, ValueInput
+from shapleypy.constants import (
+    SEMIVALUE_BETA_PARAMETERS_ERROR,
+    SEMIVALUE_WEIGHTS_LENGTH_ERROR,
+)
+from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+from shapleypy.solution_concept._parallel import sum_over_blocks
+
+# Function from the number of players, the dtype of the calculation and the
+# parameters of a semivalue to the weights of marginal contributions to the
+# coalitions of sizes 0, ..., n-1 multiplied by a common divisor and the
+# divisor (in the dtype), e.g. s!(n-s-1)! and n! for the Shapley value
+SemivalueWeights = Callable[..., tuple[np.ndarray, Any]]
+
+
+class Semivalue(NamedTuple):
+    """
+    Semivalue given by the weights of marginal contributions of a player to
+    coalitions by the size of the coalitions, the value of player i is the sum
+    of p(|S|) (v(S + i) - v(S)) over all coalitions S not containing i.
+
+    Attributes:
+        weights (SemivalueWeights): The function computing the weights p(s)
+            (multiplied by a common divisor) and the divisor.
+        parameters (tuple): The parameters passed to the function after the
+            number of players and the dtype (hashable, the weights are cached
+            by the semivalue, the number of players and the dtype).
+    """
+
+    weights: SemivalueWeights
+    parameters: tuple = ()
+
+
+# Semivalue or the weights p(s) of coalitions of sizes 0, ..., n-1 (custom)
+SemivalueInput = Union[Semivalue, ArrayLike]
+
+
+def _read_only(weights: np.ndarray, divisor: Any) -> tuple[np.ndarray, Any]:
+    """
+    Makes the (cached) weights read-only.
+
+    Args:
+        weights (np.ndarray): The weights.
+        divisor (Any): The divisor of the weights.
+
+    Returns:
+        tuple[np.ndarray, Any]: The same weights and divisor.
+    """
+    weights.flags.writeable = False
+    return weights, divisor
+
+
+def _scaled_weights(
+    weights: list[int], divisor: int, dtype: np.dtype
+) -> tuple[np.ndarray, Any]:
+    """
+    Converts weights given as exact integers with their common divisor to the
+    dtype. The object dtype (rational games) keeps the python ints, for the
+    other dtypes the weights and the divisor are divided by the power of two
+    which keeps the divisor below 2^64. The scaling is exact, so the results
+    are the same as of the exact integers (correctly rounded), but neither
+    the weights nor the divisor overflow (e.g. n! of more than 170 players).
+
+    Args:
+        weights (list[int]): The weights multiplied by the divisor.
+        divisor (int): The divisor.
+        dtype (np.dtype): The dtype of the calculation.
+
+    Returns:
+        tuple[np.ndarray, Any]: The weights and their divisor (in the dtype).
+    """
+    if dtype == np.dtype(object):
+        return np.array(weights, dtype=dtype), divisor
+    scale = 1 << max(0, divisor.bit_length() - 64)
+    return (
+        np.array([weight / scale for weight in weights], dtype=dtype),
+        np.array(divisor / scale, dtype=dtype)[()],
+    )
+
+
+def _shapley_weights(
+    number_of_players: int, dtype: np.dtype
+) -> tuple[np.ndarray[Any, np.dtype[Value]], Any]:
+    """
+    Get the weights for the Shapley value calculation, the weight of
+    coalitions of size s is s!(n-s-1)! / n!.
+
+    The weights s!(n-s-1)! and the divisor n! are exact integers (the sum of
+    weighted marginal contributions is divided at the end), for float dtypes
+    scaled by a power of two, so they do not overflow for games of more than
+    170 players.
+
+    Args:
+        number_of_players (int): The number of players in the game.
+        dtype (np.dtype): The dtype of the calculation.
+
+    Returns:
+        tuple[np.ndarray, Any]: The weights for the Shapley value calculation
+            (for each size of coalition) and their divisor (in the dtype).
+    """
+    n = number_of_players
+    return _scaled_weights(
+        [factorial(s) * factorial(n - s - 1) for s in range(n)],
+        factorial(n),
+        dtype,
+    )
+
+
+def _banzhaf_weights(
+    number_of_players: int, dtype: np.dtype
+) -> tuple[np.ndarray[Any, np.dtype[Value]], Any]:
+    """
+    Get the weights for the Banzhaf value calculation, all coalitions have
+    weight one and the sum of marginal contributions is divided by 2^(n-1).
+
+    Args:
+        number_of_players (int): The number of players in the game.
+        dtype (np.dtype): The dtype of the calculation.
+
+    Returns:
+        tuple[np.ndarray, Any]: The weights (ones) and 2^(n-1) (in the dtype).
+    """
+    weights = np.array([1] * number_of_players, dtype=dtype)
+    return weights, np.array(2 ** (number_of_players - 1), dtype=dtype)[()]
+
+
+def _beta_weights(
+    number_of_players: int, dtype: np.dtype, alpha: float, beta: float
+) -> tuple[np.ndarray[Any, np.dtype[Value]], Any]:
+    """
+    Get the weights for the Beta(alpha, beta) Shapley value calculation, the
+    weight of coalitions of size s is B(s + beta, n - s - 1 + alpha) /
+    B(alpha, beta), i.e. the size of the coalition preceding the player is
+    beta-binomial distributed (alpha = beta = 1 gives the Shapley value,
+    alpha > beta favours small coalitions).
+
+    Integer parameters give exact integer weights and a divisor (as for the
+    Shapley value, scaled for float dtypes), other parameters are computed
+    by the log-gamma function.
+
+    Args:
+        number_of_players (int): The number of players in the game.
+        dtype (np.dtype): The dtype of the calculation.
+        alpha (float): The first parameter of the beta distribution.
+        beta (float): The second parameter of the beta distribution.
+
+    Returns:
+        tuple[np.ndarray, Any]: The weights (for each size of coalition) and
+            their divisor (in the dtype).
+    """
+    n = number_of_players
+    if float(alpha).is_integer() and float(beta).is_integer():
+        a, b = int(alpha), int(beta)
+        # 1 / B(a, b) = (a + b - 1)! / ((a - 1)! (b - 1)!) is an integer
+        factor = factorial(a + b - 1) // (factorial(a - 1) * factorial(b - 1))
+        weights: list[Any] = [
+            factor * factorial(s + b - 1) * factorial(n - s + a - 2)
+            for s in range(n)
+        ]
+        return _scaled_weights(weights, factorial(n + a + b - 2), dtype)
+    log_beta = lgamma(alpha) + lgamma(beta) - lgamma(alpha + beta)
+    weights = [
+        exp(
+            lgamma(s + beta)
+            + lgamma(n - s - 1 + alpha)
+            - lgamma(n - 1 + alpha + beta)
+            - log_beta
+        )
+        for s in range(n)
+    ]
+    return (
+        convert_values(np.array(weights, dtype=object), dtype),
+        convert_values(np.array([1], dtype=object), dtype)[0],
+    )
+
+
+SHAPLEY = Semivalue(_shapley_weights)
+BANZHAF = Semivalue(_banzhaf_weights)
+
+
+def beta_shapley(alpha: float, beta: float) -> Semivalue:
+    """
+    Returns the Beta(alpha, beta) Shapley value (see _beta_weights).
+
+    Args:
+        alpha (float): The first parameter of the beta distribution.
+        beta (float): The second parameter of the beta distribution.
+
+    Returns:
+        Semivalue: The semivalue.
+
+    Raises:
+        ValueError: If a parameter is not positive.
+    """
+    if not (alpha > 0 and beta > 0):
+        raise ValueError(SEMIVALUE_BETA_PARAMETERS_ERROR)
+    return Semivalue(_beta_weights, (alpha, beta))
+
+
+@lru_cache(maxsize=64)
+def _cached_weights(
+    semivalue: Semivalue, number_of_players: int, dtype: np.dtype
+) -> tuple[np.ndarray, Any]:
+    """
+    Get the weights of a semivalue (computed once per semivalue, number of
+    players and dtype).
+
+    Args:
+        semivalue (Semivalue): The semivalue.
+        number_of_players (int): The number of players in the game.
+        dtype (np.dtype): The dtype of the calculation.
+
+    Returns:
+        tuple[np.ndarray, Any]: The weights (read-only) and their divisor.
+    """
+    return _read_only(
+        *semivalue.weights(number_of_players, dtype, *semivalue.parameters)
+    )
+
+
+def semivalue_weights(
+    semivalue: SemivalueInput, number_of_players: int, dtype: np.dtype
+) -> tuple[np.ndarray, Any]:
+    """
+    Get the weights of marginal contributions to coalitions of sizes
+    0, ..., n-1 of a semivalue multiplied by a common divisor and the divisor.
+
+    Args:
+        semivalue (SemivalueInput): The semivalue or the custom weights.
+        number_of_players (int): The number of players in the game.
+        dtype (np.dtype): The dtype of the calculation.
+
+    Returns:
+        tuple[np.ndarray, Any]: The weights (in the dtype, must not be
+            modified) and their divisor.
+
+    Raises:
+        ValueError: If the number of custom weights is not the number of
+            players.
+    """
+    if isinstance(semivalue, Semivalue):
+        return _cached_weights(semivalue, number_of_players, np.dtype(dtype))
+    weights = convert_values(semivalue, dtype)
+    if weights.shape != (number_of_players,):
+        raise ValueError(SEMIVALUE_WEIGHTS_LENGTH_ERROR)
+    return weights, convert_values([1], dtype)[0]
+
+
+def _semivalue_partial_sums(
+    values: np.ndarray,
+    players: Sequence[Player],
+    prepare: Prepare | None,
+    dtype: np.dtype,
+    *,
+    weights: np.ndarray,
+    chunk_size: int | None = None,
+    blocks: range | None = None,
+) -> np.ndarray:
+    """
+    Sum the weighted marginal contributions of given players over the given
+    blocks (chunks) of the values of a game for several semivalues at once
+    (each chunk is read once, not divided by the divisors of the weights).
+
+    Args:
+        values (np.ndarray): The values of all coalitions of the game (last
+            axis, other axes are kept, e.g. the games of a batch).
+        players (Sequence[Player]): The players.
+        prepare (Prepare | None): The function preparing the chunks (see
+            iterate_subcubes).
+        dtype (np.dtype): The dtype of the calculation.
+        weights (np.ndarray): The weights of the semivalues (a row per
+            semivalue, indexed by the size of coalitions).
+        chunk_size (int | None): The length of chunks (if None CHUNK_SIZE
+            from constants will be used).
+        blocks (range | None): The blocks to process (if None all blocks).
+
+    Returns:
+        np.ndarray: The sums of shape (*leading axes of the values, number of
+            semivalues, number of players).
+    """
+    player_sets = [(player,) for player in players]
+    payoffs = np.zeros(
+        (*values.shape[:-1], len(weights), len(player_sets)), dtype=dtype
+    )
+    for index, sizes, (without_player, with_player) in iterate_subcubes(
+        values, player_sets, prepare, chunk_size, blocks
+    ):
+        differences = with_player - without_player
+        for row, row_weights in enumerate(weights):
+            payoffs[..., row, index] += np.sum(
+                differences * row_weights[sizes], axis=subcube_axes(sizes)
+            )
+    return payoffs
+
+
+def _semivalues_of_players(
+    game: Game | GamesBatch,
+    players: Iterable[Player],
+    semivalues: Sequence[SemivalueInput],
+    default_value: ValueInput | None,
+    *,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+) -> np.ndarray[Any, np.dtype[Value]]:
+    """
+    Compute several semivalues of given players in a game directly from the
+    values array of the game in one pass over the values.
+
+    The values are processed in chunks (see iterate_subcubes), the marginal
+    contributions of each player are computed once and weighted by the
+    weights of all semivalues. Games with exact rational values are computed
+    exactly, other games in Value (float32 games give float32 result). The
+    chunks can be split into ranges computed in parallel (see
+    sum_over_blocks), batches of games are computed at once.
+
+    Args:
+        game (Game | GamesBatch): The game (or batch of games).
+        players (Iterable[Player]): The players for which to compute the
+            semivalues.
+        semivalues (Sequence[SemivalueInput]): The semivalues.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        n_jobs (int | None): The number of parallel tasks (-1 for the number
+            of processors, None for no parallelism unless executor is given).
+        executor (Executor | None): The executor running the parallel tasks
+            (if None a process pool with n_jobs workers is used).
+
+    Returns:
+        np.ndarray: The semivalues of the players of shape (number of
+            semivalues, *number of games of a batch, number of players).
+
+    Raises:
+        ValueError: If custom weights do not match the number of players or
+            n_jobs is not positive nor -1.
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    dtype = computation_dtype(game.dtype)
+    weights, divisors = zip(
+        *(
+            semivalue_weights(semivalue, game.number_of_players, dtype)
+            for semivalue in semivalues
+        )
+    )
+    payoffs = sum_over_blocks(
+        game,
+        partial(
+            _semivalue_partial_sums, weights=np.array(weights, dtype=dtype)
+        ),
+        list(players),
+        dtype,
+        default_value,
+        n_jobs=n_jobs,
+        executor=executor,
+    )
+    payoffs /= np.array(divisors, dtype=dtype)[:, None]
+    return np.moveaxis(payoffs, -2, 0).astype(
+        result_dtype(game.dtype), copy=False
+    )
+
+
+def semivalues_of_game(
+    game: Game | GamesBatch,
+    semivalues: Sequence[SemivalueInput],
+    default_value: ValueInput | None = None,
+    *,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+) -> np.ndarray[Any, np.dtype[Value]]:
+    """
+    Compute several semivalues (e.g. SHAPLEY, BANZHAF and beta_shapley(16, 1))
+    of all players in a game together with one read of the values.
+
+    Args:
+        game (Game | GamesBatch): The game (or batch of games).
+        semivalues (Sequence[SemivalueInput]): The semivalues (or custom
+            weights of coalitions of sizes 0, ..., n-1).
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        n_jobs (int | None): The number of parallel tasks (-1 for the number
+            of processors, None for no parallelism unless executor is given).
+        executor (Executor | None): The executor running the parallel tasks
+            (if None a process pool with n_jobs workers is used).
+
+    Returns:
+        np.ndarray: The semivalues of all players, a row (payoff vector) per
+            semivalue (a matrix with a row per game for a batch).
+
+    Raises:
+        ValueError: If custom weights do not match the number of players or
+            n_jobs is not positive nor -1.
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    return _semivalues_of_players(
+        game,
+        range(game.number_of_players),
+        semivalues,
+        default_value,
+        n_jobs=n_jobs,
+        executor=executor,
+    )
+
+
+def semivalue(
+    game: Game | GamesBatch,
+    semivalue: SemivalueInput,
+    player: Player | None = None,
+    default_value: ValueInput | None = None,
+    *,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+) -> Value | Iterable[Value]:
+    """
+    Compute a semivalue of a player in a game or of all players in a game.
+
+    Args:
+        game (Game | GamesBatch): The game (or batch of games, the result has
+            a row per game).
+        semivalue (SemivalueInput): The semivalue (or custom weights of
+            coalitions of sizes 0, ..., n-1).
+        player (Player | None): The player for which to compute the semivalue
+            (if None the semivalues of all players will be computed).
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+        n_jobs (int | None): The number of parallel tasks (-1 for the number
+            of processors, None for no parallelism unless executor is given).
+        executor (Executor | None): The executor running the parallel tasks
+            (if None a process pool with n_jobs workers is used).
+
+    Returns:
+        Value | Iterable[Value]: The semivalue of the player or the semivalues
+            of all players in the game (payoff vector).
+
+    Raises:
+        ValueError: If custom weights do not match the number of players or
+            n_jobs is not positive nor -1.
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    players = range(game.number_of_players) if player is None else [player]
+    values = _semivalues_of_players(
+        game,
+        players,
+        [semivalue],
+        default_value,
+        n_jobs=n_jobs,
+        executor=executor,
+    )[0]
+    return values if player is None else np.take(values, 0, axis=-1)
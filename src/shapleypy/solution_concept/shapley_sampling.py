@@ -0,0 +1,428 @@
+from __future__ import annotations
+
+import time
+from typing import Any, NamedTuple
+
+import numpy as np
+
+from shapleypy._typing import Value, ValueInput, ValueOracle
+from shapleypy.constants import (
+    SAMPLING_NUMBER_OF_PLAYERS_ERROR,
+    SAMPLING_NUMBER_OF_SAMPLES_ERROR,
+)
+from shapleypy.game import Game
+from shapleypy.oracle_game import OracleGame
+from shapleypy.solution_concept._default_value import set_default_value
+
+
+class SamplingResult(NamedTuple):
+    """
+    Result of a sampling estimator of a solution concept.
+
+    Attributes:
+        values (np.ndarray): The estimated values of all players (payoff
+            vector).
+        standard_errors (np.ndarray): The standard errors of the estimates of
+            all players.
+        number_of_samples (int): The number of samples used for the estimate.
+    """
+
+    values: np.ndarray[Any, np.dtype[Value]]
+    standard_errors: np.ndarray[Any, np.dtype[Value]]
+    number_of_samples: int
+
+
+def _evaluate_coalitions(
+    game: Game,
+    coalition_ids: np.ndarray[Any, np.dtype[np.int64]],
+    default_value: ValueInput | None,
+) -> np.ndarray[Any, np.dtype[Value]]:
+    """
+    Evaluate the values of coalitions given by their IDs (bitmaps).
+
+    Args:
+        game (Game): The game to evaluate.
+        coalition_ids (np.ndarray): The IDs of the coalitions (any shape).
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+
+    Returns:
+        np.ndarray: The values of the coalitions (same shape as the IDs).
+
+    Raises:
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    values = np.array(game._evaluate(coalition_ids), dtype=Value).ravel()
+    return set_default_value(values, default_value).reshape(coalition_ids.shape)
+
+
+def _sample_marginal_contributions(
+    game: Game,
+    number_of_players: int,
+    number_of_permutations: int,
+    value_of_empty_coalition: Value,
+    *,
+    generator: np.random.Generator,
+    default_value: ValueInput | None,
+) -> np.ndarray[Any, np.dtype[Value]]:
+    """
+    Sample random permutations of players and compute the marginal
+    contributions of all players in them.
+
+    The coalitions of the predecessors are built incrementally for all
+    permutations at once (cumulative union of the bits of the players in
+    permutation order).
+
+    Args:
+        game (Game): The game to sample.
+        number_of_players (int): The number of players.
+        number_of_permutations (int): The number of permutations to sample.
+        value_of_empty_coalition (Value): The value of the empty coalition.
+        generator (np.random.Generator): Random generator to use.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+
+    Returns:
+        np.ndarray: The marginal contributions of shape (number_of_permutations,
+            number_of_players) indexed by player.
+    """
+    permutations = generator.permuted(
+        np.tile(np.arange(number_of_players), (number_of_permutations, 1)),
+        axis=1,
+    )
+    coalition_ids = np.cumsum(np.left_shift(1, permutations), axis=1)
+    values = _evaluate_coalitions(game, coalition_ids, default_value)
+    marginal_contributions_in_order = np.diff(
+        values, axis=1, prepend=value_of_empty_coalition
+    )
+    marginal_contributions = np.empty_like(marginal_contributions_in_order)
+    np.put_along_axis(
+        marginal_contributions,
+        permutations,
+        marginal_contributions_in_order,
+        axis=1,
+    )
+    return marginal_contributions
+
+
+def permutation_sampling_shapley(
+    game: Game | ValueOracle,
+    number_of_players: int | None = None,
+    *,
+    generator: np.random.Generator | None = None,
+    max_permutations: int = 10_000,
+    target_error: float | None = None,
+    time_budget: float | None = None,
+    batch_size: int = 64,
+    default_value: ValueInput | None = None,
+) -> SamplingResult:
+    """
+    Estimate the Shapley values of all players by sampling random permutations
+    of players (Monte Carlo).
+
+    The permutations are sampled in batches. After each batch the estimate is
+    updated and the sampling stops once the largest standard error drops to
+    the target error, the time budget is spent or the maximum number of
+    permutations is reached (whichever happens first).
+
+    Args:
+        game (Game | ValueOracle): The game or the value oracle (function from
+            ID (bitmap) of a coalition to its value) to estimate.
+        number_of_players (int | None): The number of players (required for a
+            value oracle, ignored for a game).
+        generator (np.random.Generator | None): Random generator to use (if
+            None a new generator is created).
+        max_permutations (int): The maximum number of permutations to sample.
+        target_error (float | None): The standard error at which the sampling
+            stops (if None the error is not checked).
+        time_budget (float | None): The time (in seconds) after which the
+            sampling stops (if None the time is not checked).
+        batch_size (int): The number of permutations sampled between checks of
+            the stopping conditions.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+
+    Returns:
+        SamplingResult: The estimated Shapley values, their standard errors and
+            the number of sampled permutations.
+
+    Raises:
+        ValueError: If the number of players is missing for a value oracle or
+            the maximum number of permutations or batch size is not positive.
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    start = time.perf_counter()
+    if not isinstance(game, Game):
+        if number_of_players is None:
+            raise ValueError(SAMPLING_NUMBER_OF_PLAYERS_ERROR)
+        game = OracleGame(number_of_players, game)
+    number_of_players = game.number_of_players
+    if max_permutations < 1 or batch_size < 1:
+        raise ValueError(SAMPLING_NUMBER_OF_SAMPLES_ERROR)
+    if generator is None:
+        generator = np.random.default_rng()
+
+    value_of_empty_coalition = _evaluate_coalitions(
+        game, np.zeros(1, dtype=np.int64), default_value
+    )[0]
+
+    count = 0
+    mean = np.zeros(number_of_players, dtype=Value)
+    # Sum of squared differences from the mean (Welford / Chan et al.)
+    m2 = np.zeros(number_of_players, dtype=Value)
+    standard_errors = np.full(number_of_players, np.inf, dtype=Value)
+    while count < max_permutations:
+        size = min(batch_size, max_permutations - count)
+        samples = _sample_marginal_contributions(
+            game,
+            number_of_players,
+            size,
+            value_of_empty_coalition,
+            generator=generator,
+            default_value=default_value,
+        )
+
+        batch_mean = samples.mean(axis=0)
+        delta = batch_mean - mean
+        total = count + size
+        mean += delta * size / total
+        m2 += ((samples - batch_mean) ** 2).sum(axis=0)
+        m2 += delta**2 * count * size / total
+        count = total
+
+        if count > 1:
+            standard_errors = np.sqrt(m2 / (count - 1) / count)
+        if target_error is not None and np.all(standard_errors <= target_error):
+            break
+        if time_budget is not None and time.perf_counter() - start >= (
+            time_budget
+        ):
+            break
+
+    return SamplingResult(mean, standard_errors, count)
+
+
+def _sample_antithetic_pairs(
+    game: Game,
+    sizes: np.ndarray[Any, np.dtype[np.int64]],
+    generator: np.random.Generator,
+    default_value: ValueInput | None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray[Any, np.dtype[Value]]]:
+    """
+    Sample random coalitions S of given sizes and compute the antithetic pairs
+    of marginal contributions of all players j not in S, the contribution to
+    S and to its antithetic partner N - S - j (the complement of S in N - j).
+
+    The coalitions are drawn uniformly by ranking random keys of players (the
+    members have the lowest ranks), so S is a uniformly random coalition of
+    its size not containing j for every player j not in S. The sample of size
+    s costs 2 + 2 (n - s) evaluations (v(S), v(N - S), v(S + j) and
+    v(N - S - j)), all evaluated at once.
+
+    Args:
+        game (Game): The game to sample.
+        sizes (np.ndarray): The sizes of the coalitions S (at most n - 1).
+        generator (np.random.Generator): Random generator to use.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The index of the sample and
+            the player j of each pair and the sums v(S + j) - v(S) +
+            v(N - S) - v(N - S - j).
+    """
+    n = game.number_of_players
+    ranks = np.argsort(np.argsort(generator.random((len(sizes), n)), axis=1))
+    outside = ranks >= sizes[:, None]
+    bits = np.left_shift(1, np.arange(n, dtype=np.int64))
+    coalition_ids = np.where(outside, 0, bits).sum(axis=1)
+    complement_ids = np.where(outside, bits, 0).sum(axis=1)
+    samples, players = np.nonzero(outside)
+    values = _evaluate_coalitions(
+        game,
+        np.concatenate(
+            [
+                coalition_ids,
+                complement_ids,
+                coalition_ids[samples] | bits[players],
+                complement_ids[samples] & ~bits[players],
+            ]
+        ),
+        default_value,
+    )
+    value_of_s, value_of_complement, with_j, without_j = np.split(
+        values, np.cumsum([len(sizes), len(sizes), len(players)])
+    )
+    contributions = (
+        with_j - value_of_s[samples] + value_of_complement[samples] - without_j
+    )
+    return samples, players, contributions
+
+
+def _neyman_allocation(
+    weights: np.ndarray[Any, np.dtype[Value]],
+    counts: np.ndarray[Any, np.dtype[np.int64]],
+    number_of_samples: int,
+) -> np.ndarray[Any, np.dtype[np.int64]]:
+    """
+    Allocate new samples to strata, so the counts of all samples approach the
+    Neyman allocation (proportional to the weights). Strata with more samples
+    than their share get none, the remainder goes to the largest deficits.
+
+    Args:
+        weights (np.ndarray): The weights of the strata (non-negative, if all
+            are zero the strata share the samples equally).
+        counts (np.ndarray): The current numbers of samples of the strata.
+        number_of_samples (int): The number of new samples.
+
+    Returns:
+        np.ndarray: The numbers of new samples of the strata.
+    """
+    if weights.sum() == 0:
+        weights = np.ones_like(weights)
+    target = (counts.sum() + number_of_samples) * weights / weights.sum()
+    deficits = np.maximum(target - counts, 0)
+    shares = number_of_samples * deficits / deficits.sum()
+    allocation = np.floor(shares).astype(np.int64)
+    remainder = number_of_samples - allocation.sum()
+    allocation[np.argsort(allocation - shares)[:remainder]] += 1
+    return allocation
+
+
+def stratified_sampling_shapley(
+    game: Game | ValueOracle,
+    number_of_players: int | None = None,
+    *,
+    generator: np.random.Generator | None = None,
+    max_evaluations: int = 100_000,
+    target_error: float | None = None,
+    time_budget: float | None = None,
+    batch_size: int = 64,
+    default_value: ValueInput | None = None,
+) -> SamplingResult:
+    """
+    Estimate the Shapley values of all players by stratified sampling of
+    marginal contributions by player and size of coalitions with antithetic
+    pairs and variance driven (Neyman) allocation of evaluations.
+
+    The Shapley value of player j is the mean over sizes s of the expected
+    marginal contribution of j to a uniformly random coalition of size s not
+    containing j. A sampled coalition S gives every player j not in S an
+    antithetic pair of contributions to S and to N - S - j (sizes s and
+    n - 1 - s), so a stratum is a player and a pair of sizes. The sizes are
+    sampled in batches proportionally to the estimated standard deviations
+    of their strata per evaluation (strata of constant contributions, e.g.
+    of the empty coalition, get no more evaluations), every size is sampled
+    until all its strata have two pairs first. The sampling stops once the
+    largest standard error drops to the target error, the time budget is
+    spent or the next batch would exceed the evaluations (whichever happens
+    first).
+
+    Args:
+        game (Game | ValueOracle): The game or the value oracle (function from
+            ID (bitmap) of a coalition to its value) to estimate.
+        number_of_players (int | None): The number of players (required for a
+            value oracle, ignored for a game).
+        generator (np.random.Generator | None): Random generator to use (if
+            None a new generator is created).
+        max_evaluations (int): The maximum number of evaluated values
+            (repeated coalitions of oracle games are cached).
+        target_error (float | None): The standard error at which the sampling
+            stops (if None the error is not checked).
+        time_budget (float | None): The time (in seconds) after which the
+            sampling stops (if None the time is not checked).
+        batch_size (int): The number of coalitions sampled between checks of
+            the stopping conditions.
+        default_value (ValueInput | None): The default value to set to the
+            missing values (if None DEFAULT_VALUE from constants will be used).
+
+    Returns:
+        SamplingResult: The estimated Shapley values, their standard errors
+            (infinite until all strata of the player have two pairs) and the
+            number of sampled coalitions.
+
+    Raises:
+        ValueError: If the number of players is missing for a value oracle or
+            the maximum number of evaluations or batch size is not positive.
+        RuntimeWarning: If the default value is used and was not set by user.
+    """
+    start = time.perf_counter()
+    if not isinstance(game, Game):
+        if number_of_players is None:
+            raise ValueError(SAMPLING_NUMBER_OF_PLAYERS_ERROR)
+        game = OracleGame(number_of_players, game)
+    n = game.number_of_players
+    if max_evaluations < 1 or batch_size < 1:
+        raise ValueError(SAMPLING_NUMBER_OF_SAMPLES_ERROR)
+    if generator is None:
+        generator = np.random.default_rng()
+
+    # Sizes s <= n - 1 - s, the middle size is its own partner (both halves
+    # of the pair estimate its stratum)
+    sizes = np.arange((n + 1) // 2)
+    coefficients = np.where(2 * sizes == n - 1, 0.5, 1.0)
+    costs = 2 + 2 * (n - sizes)
+    size_counts = np.zeros(len(sizes), dtype=np.int64)
+    # Statistics of strata (player, size) of the pairs (Chan et al.)
+    counts = np.zeros((n, len(sizes)), dtype=np.int64)
+    means = np.zeros((n, len(sizes)), dtype=Value)
+    m2 = np.zeros((n, len(sizes)), dtype=Value)
+    evaluations = 0
+    values = np.zeros(n, dtype=Value)
+    standard_errors = np.full(n, np.inf, dtype=Value)
+    while True:
+        undersampled = np.any(counts < 2, axis=0)  # noqa: PLR2004
+        if undersampled.any():
+            allocation = np.where(undersampled, 2, 0)
+        else:
+            # Neyman allocation of sizes per evaluation, a sample of size s
+            # gives pairs to n - s players
+            variances = coefficients**2 * (m2 / (counts - 1)).sum(axis=0)
+            allocation = _neyman_allocation(
+                np.sqrt(variances * n / (n - sizes) / costs),
+                size_counts,
+                batch_size,
+            )
+        # Largest batch within the evaluations (expensive sizes first)
+        while evaluations + allocation @ costs > max_evaluations:
+            allocation[np.flatnonzero(allocation)[0]] -= 1
+        if not allocation.any():
+            break
+        sample_sizes = np.repeat(sizes, allocation)
+        samples, players, contributions = _sample_antithetic_pairs(
+            game, sample_sizes, generator, default_value
+        )
+        evaluations += int(allocation @ costs)
+        size_counts += allocation
+
+        # Merge the statistics of the batch per stratum
+        strata = players * len(sizes) + sample_sizes[samples]
+        batch_counts = np.bincount(strata, minlength=counts.size)
+        batch_means = np.bincount(
+            strata, weights=contributions, minlength=counts.size
+        ) / np.maximum(batch_counts, 1)
+        batch_m2 = np.bincount(
+            strata,
+            weights=(contributions - batch_means[strata]) ** 2,
+            minlength=counts.size,
+        )
+        old_counts = counts.ravel()
+        total = old_counts + batch_counts
+        delta = batch_means - means.ravel()
+        ratio = batch_counts / np.maximum(total, 1)
+        means += (delta * ratio).reshape(means.shape)
+        m2 += (batch_m2 + delta**2 * old_counts * ratio).reshape(m2.shape)
+        counts = total.reshape(counts.shape)
+
+        values = (coefficients * means).sum(axis=1) / n
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variances = np.where(counts > 1, m2 / (counts - 1) / counts, np.inf)
+        standard_errors = np.sqrt((coefficients**2 * variances).sum(axis=1)) / n
+        if target_error is not None and np.all(standard_errors <= target_error):
+            break
+        if time_budget is not None and time.perf_counter() - start >= (
+            time_budget
+        ):
+            break
+
+    return SamplingResult(values, standard_errors, int(size_counts.sum()))
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from typing import cast, overload
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+from shapleypy._dtypes import computation_dtype, convert_value, is_missing
+from shapleypy._typing import (
+    GameValueInput,
+    Player,
+    Players,
+    Value,
+    ValueInput,
+)
+from shapleypy.coalition import Coalition, CoalitionArray
+from shapleypy.game import Game, _as_coalition, _last_values
+from shapleypy.solution_concept._default_value import set_default_value
+
+
+class SparseGame(Game):
+    """
+    Represents a game in which only some coalitions have their own values, all
+    other coalitions have the default value of the game.
+
+    The IDs (bitmaps) of the defined coalitions are stored in a sorted array
+    with a parallel array of their values, so the memory (and the time of
+    Shapley and Banzhaf values and of the core) is proportional to the number
+    of defined coalitions instead of 2^n. The empty coalition is always
+    defined with value zero.
+
+    Attributes:
+        number_of_players (int): The number of players in the game.
+        default_value (ValueInput): The value of the coalitions which are not
+            defined (np.nan means missing as in Game, the default value of the
+            solution concepts is used for them then).
+
+    Methods:
+        set_value: Sets the value of a coalition.
+        set_values: Sets the values of multiple coalitions.
+        get_value: Retrieves the value of a coalition.
+        defined_coalitions: Returns the IDs and values of defined coalitions.
+    """
+
+    def __init__(
+        self,
+        number_of_players: int,
+        default_value: ValueInput = np.nan,
+        dtype: DTypeLike = Value,
+    ) -> None:
+        """
+        Initializes a new instance of the SparseGame class.
+
+        Args:
+            number_of_players (int): The number of players in the game.
+            default_value (ValueInput): The value of the coalitions which are
+                not defined (np.nan means missing as in Game).
+            dtype (DTypeLike): The dtype of the values (see Game). Integer
+                games have no missing values, the default value is zero then.
+        """
+        if np.issubdtype(dtype, np.integer) and is_missing(default_value):
+            default_value = 0
+        self.number_of_players: int = number_of_players
+        self._ids = np.zeros(1, dtype=np.uint32)
+        self._sparse_values = np.zeros(1, dtype=dtype)
+        self._sparse_values[0] = convert_value(0, dtype)
+        self.default_value = convert_value(default_value, dtype)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """
+        Returns the dtype of the values of coalitions.
+
+        Returns:
+            np.dtype: The dtype of the values.
+        """
+        return self._sparse_values.dtype
+
+    def defined_coalitions(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the IDs (bitmaps) and values of the defined coalitions.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The sorted IDs of the defined
+                coalitions (including the empty one) and their values (must
+                not be modified).
+        """
+        return self._ids, self._sparse_values
+
+    def set_value(
+        self, coalition: Coalition | Players | Player, value: GameValueInput
+    ) -> None:
+        """
+        Sets the value of a coalition (the coalition becomes defined).
+
+        Args:
+            coalition (Coalition | Players | Player): The coalition or player(s)
+                for which to set the value.
+            value (GameValueInput): The value to set (converted to the dtype of
+                the game).
+
+        Raises:
+            TypeError: If the coalition input is not of the correct type
+                (listed above).
+            IndexError: If the coalition contains players not in the game.
+
+        Returns:
+            None
+        """
+        self.set_values([(_as_coalition(coalition), value)])
+
+    @overload
+    def set_values(
+        self, values: Iterable[tuple[Coalition | Players, GameValueInput]]
+    ) -> None: ...
+
+    @overload
+    def set_values(
+        self,
+        values: Sequence[GameValueInput] | np.ndarray,
+        coalitions: CoalitionArray,
+    ) -> None: ...
+
+    def set_values(
+        self,
+        values: (
+            Iterable[tuple[Coalition | Players, GameValueInput]]
+            | Sequence[GameValueInput]
+            | np.ndarray
+        ),
+        coalitions: CoalitionArray | None = None,
+    ) -> None:
+        """
+        Sets the values of multiple coalitions (merged into the sorted arrays
+        at once, the last value of a repeated coalition is used).
+
+        Args:
+            values (Iterable[tuple[Coalition | Players, GameValueInput]] |
+                Sequence[GameValueInput] | np.ndarray): The coalitions and
+                values to set, or just the values if the coalitions are given
+                as CoalitionArray.
+            coalitions (CoalitionArray | None): The coalitions whose values
+                are set (values[i] is the value of coalitions[i]).
+
+        Raises:
+            TypeError: If the coalition input is not of the correct type.
+            ValueError: If the number of values differs from the number of
+                coalitions.
+            IndexError: If the coalition contains players not in the game.
+
+        Returns:
+            None
+        """
+        if coalitions is not None:
+            super().set_values(
+                cast("Sequence[GameValueInput] | np.ndarray", values),
+                coalitions,
+            )
+            return
+        new_ids = []
+        new_values = []
+        for coalition, value in cast(
+            "Iterable[tuple[Coalition | Players, GameValueInput]]", values
+        ):
+            new_ids.append(_as_coalition(coalition).id)
+            new_values.append(convert_value(value, self.dtype))
+        if not new_ids:
+            return
+
+        self.set_values_by_ids(
+            np.array(new_ids, dtype=np.uint32),
+            np.array(new_values, dtype=self.dtype),
+        )
+
+    def _set_values_of_ids(
+        self, coalition_ids: np.ndarray, values: np.ndarray
+    ) -> None:
+        """
+        Merges the coalitions given by their IDs (bitmaps) and their values into
+        the defined coalitions. The values of defined coalitions are replaced
+        in place and the new coalitions are inserted at their positions found
+        by binary search, so setting a few values does not sort all the defined
+        coalitions again.
+
+        Args:
+            coalition_ids (np.ndarray): The IDs of the coalitions (1-D).
+            values (np.ndarray): The values (in the dtype of the game).
+
+        Returns:
+            None
+        """
+        coalition_ids, values = _last_values(coalition_ids, values)
+        if self._observers:
+            old_values = self._evaluate(coalition_ids)
+        positions = np.searchsorted(self._ids, coalition_ids)
+        defined = np.zeros(len(coalition_ids), dtype=bool)
+        inside = positions < len(self._ids)
+        defined[inside] = self._ids[positions[inside]] == coalition_ids[inside]
+        self._sparse_values[positions[defined]] = values[defined]
+        if not np.all(defined):
+            new = ~defined
+            self._ids = np.insert(self._ids, positions[new], coalition_ids[new])
+            self._sparse_values = np.insert(
+                self._sparse_values, positions[new], values[new]
+            )
+        self._drop_caches()
+        if self._observers:
+            self._notify_observers(coalition_ids, old_values, values)
+
+    def get_value(self, coalition: Coalition | Players | Player) -> Value:
+        """
+        Retrieves the value of a coalition.
+
+        Args:
+            coalition (Coalition | Players | Player): The coalition or player(s)
+                for which to retrieve the value.
+
+        Raises:
+            TypeError: If the coalition input is not of the correct type.
+            IndexError: If the coalition contains players not in the game.
+
+        Returns:
+            Value: The value of the coalition (default value if the coalition is
+                not defined).
+        """
+        coalition_id = int(_as_coalition(coalition).id)
+        if coalition_id >> self.number_of_players:
+            raise IndexError(coalition_id)
+        return self._evaluate(np.array([coalition_id]))[0]
+
+    def _evaluate(self, coalition_ids: np.ndarray) -> np.ndarray:
+        """
+        Retrieves the values of coalitions given by their IDs (bitmaps) by
+        binary search in the defined coalitions.
+
+        Args:
+            coalition_ids (np.ndarray): The IDs of the coalitions (any shape).
+
+        Returns:
+            np.ndarray: The values of the coalitions (same shape as the IDs).
+        """
+        positions = np.searchsorted(self._ids, coalition_ids)
+        positions = np.minimum(positions, len(self._ids) - 1)
+        defined = self._ids[positions] == coalition_ids
+        values = np.full(coalition_ids.shape, self.default_value, self.dtype)
+        values[defined] = self._sparse_values[positions[defined]]
+        return values
+
+    def _all_values(self) -> np.ndarray:
+        """
+        Retrieves the values of all coalitions of the game (the dense array is
+        created, so it is better to use defined_coalitions if possible).
+
+        Returns:
+            np.ndarray: The values of all coalitions indexed by the IDs
+                (bitmaps) of the coalitions.
+        """
+        values = np.full(
+            2**self.number_of_players, self.default_value, dtype=self.dtype
+        )
+        values[self._ids] = self._sparse_values
+        return values
+
+    def _defined_values_with_default(
+        self, default_value: ValueInput | None
+    ) -> tuple[np.ndarray, np.ndarray, Value]:
+        """
+        Returns the IDs and values of the defined coalitions and the value of
+        the other coalitions for solution concepts calculations (missing values
+        are replaced by the default value of the solution concept).
+
+        Args:
+            default_value (ValueInput | None): The default value to set to the
+                missing values (if None DEFAULT_VALUE from constants will be
+                used).
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, Value]: The IDs of the defined
+                coalitions, their values (in the dtype of computation) and the
+                value of the coalitions which are not defined.
+
+        Raises:
+            RuntimeWarning: If the default value is used and was not set by
+                user.
+        """
+        values = np.array(
+            self._sparse_values, dtype=computation_dtype(self.dtype)
+        )
+        if len(self._ids) == 2**self.number_of_players:
+            # All coalitions are defined, the default value is not used
+            return (
+                self._ids,
+                set_default_value(values, default_value),
+                convert_value(0, values.dtype),
+            )
+        values = set_default_value(
+            np.append(values, self.default_value), default_value
+        )
+        return self._ids, values[:-1], values[-1]
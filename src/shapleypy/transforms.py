@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from tempfile import TemporaryFile
+
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
+
+from shapleypy._chunked import (
+    chunk_length,
+    chunk_slices,
+    number_of_players_of,
+)
+from shapleypy._dtypes import convert_value, is_rational
+from shapleypy._typing import Value
+from shapleypy.constants import GAME_MEMMAP_DTYPE_ERROR
+from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+
+
+def _transform_chunk(block: np.ndarray, operation: np.ufunc) -> np.ndarray:
+    """
+    Replaces the values of S + i by operation(v(S + i), v(S)) for every player
+    i below the length of the chunk (in place), the first part of _transform.
+
+    Args:
+        block (np.ndarray): The chunk of values (last axis, the length is a
+            power of two and the chunk is aligned to it).
+        operation (np.ufunc): The binary operation (np.add or np.subtract).
+
+    Returns:
+        np.ndarray: The transformed chunk (the same array).
+    """
+    for player in range(block.shape[-1].bit_length() - 1):
+        halves = block.reshape((*block.shape[:-1], -1, 2, 1 << player))
+        operation(halves[..., 1, :], halves[..., 0, :], out=halves[..., 1, :])
+    return block
+
+
+def _transform_across_chunks(
+    values: np.ndarray, operation: np.ufunc, chunk_size: int | None
+) -> np.ndarray:
+    """
+    Replaces the values of S + i by operation(v(S + i), v(S)) for every player
+    i above the length of chunks (in place, whole chunks are paired), the
+    second part of _transform.
+
+    Args:
+        values (np.ndarray): The values of all coalitions (last axis).
+        operation (np.ufunc): The binary operation (np.add or np.subtract).
+        chunk_size (int | None): The requested length of chunks (if None
+            CHUNK_SIZE from constants will be used).
+
+    Returns:
+        np.ndarray: The transformed values (the same array).
+    """
+    length = chunk_length(values, chunk_size)
+    chunk_bits = length.bit_length() - 1
+    for player in range(chunk_bits, number_of_players_of(values)):
+        for start in range(0, values.shape[-1], length):
+            if start >> player & 1:
+                continue
+            partner = start | 1 << player
+            with_player = values[..., partner : partner + length]
+            operation(
+                with_player,
+                values[..., start : start + length],
+                out=with_player,
+            )
+    return values
+
+
+def _transform(
+    values: np.ndarray,
+    operation: np.ufunc,
+    chunk_size: int | None,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Replaces the values of S + i by operation(v(S + i), v(S)) for every player
+    i and every coalition S not containing i, player by player (in place or
+    into out).
+
+    The players below the chunk length are processed chunk by chunk (each
+    chunk is read and written once), the higher players pair whole chunks, so
+    games stored in memory mapped files are never loaded at once.
+
+    Args:
+        values (np.ndarray): The values of all coalitions (last axis).
+        operation (np.ufunc): The binary operation (np.add or np.subtract).
+        chunk_size (int | None): The requested length of chunks (if None
+            CHUNK_SIZE from constants will be used).
+        out (np.ndarray | None): The array of the shape of values the result
+            is written to (if None the values are transformed in place).
+
+    Returns:
+        np.ndarray: The transformed values (out or the values array).
+    """
+    if out is None:
+        out = values
+    for chunk in chunk_slices(values, chunk_size):
+        out[..., chunk] = _transform_chunk(
+            np.array(values[..., chunk], dtype=out.dtype), operation
+        )
+    return _transform_across_chunks(out, operation, chunk_size)
+
+
+def zeta_transform(
+    values: np.ndarray, chunk_size: int | None = None
+) -> np.ndarray:
+    """
+    Computes the zeta transform of the values in place, the value of S becomes
+    the sum of the values of all subcoalitions of S (e.g. the game from its
+    Harsanyi dividends) in O(n * 2^n) operations.
+
+    Args:
+        values (np.ndarray): The values of all coalitions indexed by the IDs
+            (bitmaps) of coalitions (last axis, other axes are transformed
+            independently).
+        chunk_size (int | None): The requested length of chunks (if None
+            CHUNK_SIZE from constants will be used).
+
+    Returns:
+        np.ndarray: The transformed values (the same array).
+    """
+    return _transform(values, np.add, chunk_size)
+
+
+def mobius_transform(
+    values: np.ndarray, chunk_size: int | None = None
+) -> np.ndarray:
+    """
+    Computes the Möbius transform of the values in place (inverse of the zeta
+    transform), the value of S becomes the Harsanyi dividend of S, i.e. the
+    sum of (-1)^(|S| - |T|) v(T) over all subcoalitions T of S, in
+    O(n * 2^n) operations.
+
+    Args:
+        values (np.ndarray): The values of all coalitions indexed by the IDs
+            (bitmaps) of coalitions (last axis, other axes are transformed
+            independently).
+        chunk_size (int | None): The requested length of chunks (if None
+            CHUNK_SIZE from constants will be used).
+
+    Returns:
+        np.ndarray: The transformed values (the same array).
+    """
+    return _transform(values, np.subtract, chunk_size)
+
+
+def harsanyi_dividends(
+    game: Game | GamesBatch, filename: str | None = None
+) -> np.ndarray:
+    """
+    Computes the Harsanyi dividends (Möbius transform) of all coalitions of the
+    game (the game is not modified). The values are transformed chunk by chunk
+    into the new array, so the values of games stored in files are not loaded
+    at once and their dividends are stored in a file too.
+
+    Args:
+        game (Game | GamesBatch): The game (or batch of games) to compute the
+            dividends of.
+        filename (str | None): The file in which the dividends are stored (if
+            None they are stored in memory, or in a temporary file if the
+            values of the game are stored in a file).
+
+    Returns:
+        np.ndarray: The dividends of all coalitions indexed by the IDs
+            (bitmaps) of the coalitions (last axis, a row per game of a batch,
+            missing values make the dividends of all their supercoalitions
+            missing).
+
+    Raises:
+        ValueError: If the dividends of a game with exact rational values are
+            to be stored in a file.
+    """
+    values = game._all_values()
+    if filename is None and not isinstance(values, np.memmap):
+        dividends = np.empty(values.shape, dtype=values.dtype)
+    else:
+        if is_rational(values.dtype):
+            raise ValueError(GAME_MEMMAP_DTYPE_ERROR)
+        dividends = np.memmap(
+            TemporaryFile() if filename is None else filename,
+            dtype=values.dtype,
+            mode="w+",
+            shape=values.shape,
+        )
+    return _transform(values, np.subtract, None, out=dividends)
+
+
+def game_from_dividends(
+    number_of_players: int,
+    coalition_ids: ArrayLike,
+    dividends: ArrayLike,
+    dtype: DTypeLike = Value,
+) -> Game:
+    """
+    Creates the game with given Harsanyi dividends (zeta transform of the
+    dividends, all other dividends are zero). The dividends stay attached to
+    the game until it is modified, so Shapley and Banzhaf values are computed
+    from them in time proportional to their number (e.g. O(n^k) coalitions of
+    k-additive games) instead of from the 2^n values.
+
+    Args:
+        number_of_players (int): The number of players in the game.
+        coalition_ids (ArrayLike): The IDs (bitmaps) of the coalitions with
+            nonzero dividends (the dividend of the empty coalition is not
+            used, the last dividend of a repeated coalition is used).
+        dividends (ArrayLike): The dividends of the coalitions.
+        dtype (DTypeLike): The dtype of the values of the game (see Game).
+
+    Returns:
+        Game: The created game.
+
+    Raises:
+        ValueError: If the number of dividends differs from the number of
+            coalitions.
+        IndexError: If a coalition contains players not in the game.
+    """
+    game = Game(number_of_players, dtype=dtype)
+    game._values.fill(convert_value(0, game.dtype))
+    game.set_values_by_ids(coalition_ids, dividends)
+    # The dividend of the empty coalition is not used (v of it is zero)
+    game._values[0] = convert_value(0, game.dtype)
+    ids = np.unique(np.asarray(coalition_ids, dtype=np.uint32))
+    ids = ids[ids > 0]
+    table = np.array(game._values[ids])
+
+    zeta_transform(game._values)
+    game._values_changed()
+    game._set_dividends(ids, table)
+    return game
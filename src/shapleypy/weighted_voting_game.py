@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+from shapleypy._typing import Player, Value
+from shapleypy.constants import (
+    ORACLE_GAME_CACHE_CAPACITY,
+    WEIGHTED_VOTING_GAME_QUOTA_ERROR,
+    WEIGHTED_VOTING_GAME_WEIGHTS_ERROR,
+)
+from shapleypy.oracle_game import OracleGame
+
+
+def _is_natural(value: object) -> bool:
+    """
+    Checks that a value is a non-negative integer (python or numpy).
+
+    Args:
+        value (object): The value.
+
+    Returns:
+        bool: True if the value is a non-negative integer.
+    """
+    return (
+        isinstance(value, (int, np.integer))
+        and not isinstance(value, bool)
+        and bool(value >= 0)
+    )
+
+
+class WeightedVotingGame(OracleGame):
+    """
+    Represents a weighted voting game [quota; w_1, ..., w_n], a coalition wins
+    (value 1) if the sum of the weights of its members reaches the quota,
+    otherwise it loses (value 0).
+
+    The values are computed on demand (see OracleGame), so games of hundreds
+    of players can be represented. The Shapley-Shubik and Banzhaf indices
+    (shapley and banzhaf) are computed exactly by counting the swings of
+    players by the dynamic programming over the sizes and weights of losing
+    coalitions in O(n^2 * quota) operations, not from the values.
+
+    Attributes:
+        number_of_players (int): The number of players in the game.
+        quota (int): The weight a coalition needs to win.
+        weights (tuple[int, ...]): The weights of the players.
+
+    Methods:
+        swings: Returns the numbers of coalitions in which players swing.
+    """
+
+    def __init__(
+        self,
+        quota: int,
+        weights: Sequence[int],
+        cache_capacity: int | None = ORACLE_GAME_CACHE_CAPACITY,
+    ) -> None:
+        """
+        Initializes a new instance of the WeightedVotingGame class.
+
+        Args:
+            quota (int): The weight a coalition needs to win (positive).
+            weights (Sequence[int]): The non-negative integer weights of the
+                players.
+            cache_capacity (int | None): The maximum number of cached values
+                (None for unbounded cache).
+
+        Raises:
+            ValueError: If the quota is not a positive integer or a weight is
+                not a non-negative integer (or no weight is given).
+        """
+        if not _is_natural(quota) or quota == 0:
+            raise ValueError(WEIGHTED_VOTING_GAME_QUOTA_ERROR)
+        if len(weights) == 0 or not all(map(_is_natural, weights)):
+            raise ValueError(WEIGHTED_VOTING_GAME_WEIGHTS_ERROR)
+        self.quota: int = int(quota)
+        self.weights: tuple[int, ...] = tuple(int(w) for w in weights)
+        super().__init__(
+            len(self.weights), self._value_of_bitmap, cache_capacity
+        )
+
+    def _value_of_bitmap(self, coalition_id: int) -> Value:
+        """
+        Computes the value of a coalition (oracle of the game).
+
+        Args:
+            coalition_id (int): The ID (bitmap) of the coalition.
+
+        Returns:
+            Value: 1 if the coalition wins, 0 otherwise.
+        """
+        weight = sum(
+            w
+            for player, w in enumerate(self.weights)
+            if coalition_id >> player & 1
+        )
+        return Value(weight >= self.quota)
+
+    def _losing_counts(self, *, by_size: bool) -> np.ndarray:
+        """
+        Counts the losing coalitions of all players by their weights (and
+        sizes), exactly in python ints.
+
+        Args:
+            by_size (bool): If True, the coalitions are counted by their sizes
+                too.
+
+        Returns:
+            np.ndarray: The object array of counts of coalitions of weight w
+                (last axis, w < quota) and size s (first axis of length n + 1
+                if by_size, otherwise one row of all sizes).
+        """
+        rows = self.number_of_players + 1 if by_size else 1
+        counts = np.zeros((rows, self.quota), dtype=object)
+        counts[0, 0] = 1
+        for weight in self.weights:
+            if weight >= self.quota:
+                continue
+            # Add the player to all coalitions (the counts before are added)
+            if by_size:
+                counts[1:, weight:] += counts[:-1, : self.quota - weight]
+            else:
+                counts[0, weight:] += counts[0, : self.quota - weight].copy()
+        return counts
+
+    def swings(
+        self, players: Iterable[Player], *, by_size: bool = False
+    ) -> np.ndarray:
+        """
+        Returns the numbers of losing coalitions S not containing a player i
+        such that S + i wins, i.e. w(S) < quota <= w(S) + w_i (exact python
+        ints).
+
+        The losing coalitions of all players are counted once, the counts of
+        coalitions without a player are obtained by removing the player from
+        the counts (once per distinct weight of the players).
+
+        Args:
+            players (Iterable[Player]): The players.
+            by_size (bool): If True, the swings are counted by the sizes of
+                coalitions S.
+
+        Returns:
+            np.ndarray: The object array of the swings of the players (first
+                axis), counted by the sizes 0, ..., n-1 (last axis) if
+                by_size.
+        """
+        players = list(players)
+        counts = self._losing_counts(by_size=by_size)
+        swings_of_weight: dict[int, np.ndarray] = {}
+        for weight in {self.weights[player] for player in players}:
+            without = counts.copy()
+            if weight == 0:
+                without[...] = 0
+            elif weight < self.quota and by_size:
+                # Remove the player from the counts (smaller sizes first)
+                for row in range(1, len(without)):
+                    without[row, weight:] -= without[
+                        row - 1, : self.quota - weight
+                    ]
+            elif weight < self.quota:
+                # Remove the player from the counts (smaller weights first)
+                for start in range(weight, self.quota, weight):
+                    stop = min(start + weight, self.quota)
+                    without[0, start:stop] -= without[
+                        0, start - weight : stop - weight
+                    ]
+            swings_of_weight[weight] = without[
+                : self.number_of_players, max(0, self.quota - weight) :
+            ].sum(axis=1)
+        if not by_size:
+            return np.array(
+                [swings_of_weight[self.weights[p]][0] for p in players],
+                dtype=object,
+            )
+        return np.array(
+            [swings_of_weight[self.weights[p]] for p in players], dtype=object
+        ).reshape(len(players), self.number_of_players)
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the WeightedVotingGame object.
+
+        Returns:
+            str: The string representation of the WeightedVotingGame object.
+        """
+        return (
+            f"{type(self).__name__}(quota={self.quota}, weights={self.weights})"
+        )
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from gmpy2 import mpq
+
+from shapleypy.analysis import OUTPUTS, analyze
+from shapleypy.classes_checkers import (
+    check_convexity,
+    check_monotonicity,
+    check_positivity,
+    check_weakly_superadditivity,
+)
+from shapleypy.constants import RATIONAL_DTYPE
+from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+from shapleypy.generators import (
+    k_game_generator,
+    positive_game_generator,
+    random_game_generator,
+)
+from shapleypy.solution_concept.banzhaf_value import banzhaf
+from shapleypy.solution_concept.core import solution_in_core
+from shapleypy.solution_concept.shapley_value import shapley
+from shapleypy.transforms import harsanyi_dividends
+
+FLAGS = {
+    "monotone": check_monotonicity,
+    "weakly_superadditive": check_weakly_superadditivity,
+    "convex": check_convexity,
+    "positive": check_positivity,
+}
+
+
+@pytest.fixture
+def games() -> list[Game]:
+    generator = np.random.default_rng(0)
+    return [
+        random_game_generator(5, generator),
+        positive_game_generator(5, generator),
+        k_game_generator(5, generator, k=2),
+        Game.from_array(np.arange(32) ** 2),
+    ]
+
+
+def assert_analysis(game: Game, results: dict) -> None:
+    assert results["shapley"] == pytest.approx(shapley(game))
+    assert results["banzhaf"] == pytest.approx(banzhaf(game))
+    assert results["dividends"] == pytest.approx(harsanyi_dividends(game))
+    for flag, check in FLAGS.items():
+        assert results[flag] == check(game)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 4])
+def test_analyze_game(
+    games: list[Game], chunk_size: int | None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if chunk_size is not None:
+        monkeypatch.setattr("shapleypy._chunked.CHUNK_SIZE", chunk_size)
+    for game in games:
+        vectors = np.array([shapley(game), np.zeros(5), [0, 0, 0, 0, 1]])
+        vectors[1, -1] = game.get_value(range(5))
+        results = analyze(game, OUTPUTS, vectors)
+        assert set(results) == set(OUTPUTS)
+        assert_analysis(game, results)
+        assert results["core"].tolist() == [
+            solution_in_core(game, vector) for vector in vectors
+        ]
+
+
+def test_analyze_batch(games: list[Game]) -> None:
+    batch = GamesBatch.from_games(games)
+    results = analyze(batch, ["shapley", "convex", "positive"])
+    assert set(results) == {"shapley", "convex", "positive"}
+    for index, game in enumerate(games):
+        assert results["shapley"][index] == pytest.approx(shapley(game))
+        assert results["convex"][index] == check_convexity(game)
+        assert results["positive"][index] == check_positivity(game)
+
+    results = analyze(batch, ["core"], [[0, 0, 0, 0, 0]])
+    assert results["core"].shape == (4, 1)
+
+
+def test_analyze_with_missing_values_and_rationals() -> None:
+    game = Game(2)
+    game.set_value([0, 1], 3.0)
+    with pytest.warns(RuntimeWarning):
+        analyze(game, ["shapley"])
+    results = analyze(game, ["shapley", "core", "monotone"], [1, 2], 1.0)
+    assert list(results["shapley"]) == [1.5, 1.5]
+    assert results["core"].tolist() == [True]
+    assert results["monotone"]
+
+    rational_game = Game.from_array([0, 1, 1, 3], dtype=RATIONAL_DTYPE)
+    results = analyze(rational_game, ["shapley", "dividends", "core"], [1, 2])
+    assert list(results["shapley"]) == [mpq(3, 2), mpq(3, 2)]
+    assert list(results["dividends"]) == [0, 1, 1, 1]
+    assert results["core"].tolist() == [True]
+
+    with pytest.raises(ValueError):
+        analyze(rational_game, ["nucleolus"])
+    with pytest.raises(ValueError):
+        analyze(rational_game, ["core"])
+
+
+@pytest.mark.parametrize("chunk_size", [None, 2])
+def test_analyze_flags_of_partially_defined_game(
+    chunk_size: int | None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    if chunk_size is not None:
+        monkeypatch.setattr("shapleypy._chunked.CHUNK_SIZE", chunk_size)
+    game = positive_game_generator(4, np.random.default_rng(0))
+    for coalition in ([0], [1, 2], [0, 1, 3]):
+        game.set_value(coalition, np.nan)
+    # The flags are checked on the values as they are (as the checkers do),
+    # the default value is used just by the solution concepts
+    results = analyze(game, OUTPUTS, [np.zeros(4)], default_value=10.0)
+    assert results["shapley"] == pytest.approx(shapley(game, None, 10.0))
+    assert results["dividends"] == pytest.approx(
+        harsanyi_dividends(game), nan_ok=True
+    )
+    for flag, check in FLAGS.items():
+        assert results[flag] == check(game)
+    assert results["monotone"]
+    # With the default value set the game would not be monotone
+    filled = Game.from_array(np.nan_to_num(game._values, nan=10.0))
+    assert not check_monotonicity(filled)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
+from gmpy2 import mpq
 
 from shapleypy.coalition import Coalition
-from shapleypy.constants import DEFAULT_VALUE
+from shapleypy.constants import DEFAULT_VALUE, RATIONAL_DTYPE
 from shapleypy.game import Game
+from shapleypy.generators import random_game_generator
 from shapleypy.solution_concept.banzhaf_value import (
     banzhaf,
     banzhaf_value_of_game,
@@ -125,3 +130,59 @@ def test_banzhaf_function(
     game = Game(3)
     game.set_values(basic_values_for_game_of_three_with_missing_values)
     assert list(banzhaf(game, default_value=5.0)) == [1.75, 1.75, 4.25]  # type: ignore
+
+
+def test_banzhaf_value_of_game_of_additive_game() -> None:
+    # In additive game everyone gets exactly the value of their singleton
+    game = Game(6)
+    game.set_values(
+        (coalition, float(sum(coalition.get_players)))
+        for coalition in game.all_coalitions
+    )
+    values = banzhaf_value_of_game(game)
+    assert values.shape == (6,)
+    assert list(values) == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+    assert banzhaf_value_of_player(game, 5) == 5.0
+
+
+def test_banzhaf_value_of_game_stored_in_file_in_chunks(  # type: ignore
+    monkeypatch, tmpdir
+) -> None:
+    game = random_game_generator(7, np.random.default_rng(0))
+    expected = banzhaf_value_of_game(game)
+    stored_game = Game(7, filename=str(tmpdir.join("game.bin")))
+    stored_game.set_values(game.get_values())
+    monkeypatch.setattr("shapleypy._chunked.CHUNK_SIZE", 4)
+    assert banzhaf_value_of_game(stored_game) == pytest.approx(expected)
+    assert banzhaf_value_of_player(stored_game, 6) == pytest.approx(expected[6])
+
+
+def test_banzhaf_value_of_game_with_rational_values() -> None:
+    game = Game(4, dtype=RATIONAL_DTYPE)
+    game.set_values(
+        (coalition, mpq(len(coalition) ** 2, 3))
+        for coalition in game.all_coalitions
+    )
+    # Marginal contribution to S is (2|S| + 1) / 3, average |S| is 3 / 2
+    assert list(banzhaf_value_of_game(game)) == [mpq(4, 3)] * 4
+
+
+def test_banzhaf_value_of_game_in_parallel(tmpdir) -> None:  # type: ignore
+    game = random_game_generator(7, np.random.default_rng(0))
+    game._values[[3, 70, 127]] = np.nan
+    game._values_changed()
+    expected = banzhaf_value_of_game(game, 2.0)
+    assert banzhaf_value_of_game(game, 2.0, n_jobs=2) == pytest.approx(expected)
+    with ThreadPoolExecutor(3) as executor:
+        assert banzhaf(game, default_value=2.0, executor=executor) == (
+            pytest.approx(expected)
+        )
+    stored_game = Game(7, filename=str(tmpdir.join("game.bin")))
+    stored_game.set_values(
+        random_game_generator(7, np.random.default_rng(1)).get_values()
+    )
+    assert banzhaf_value_of_game(stored_game, n_jobs=3) == pytest.approx(
+        banzhaf_value_of_game(stored_game)
+    )
+    with pytest.raises(ValueError):
+        banzhaf_value_of_game(game, 2.0, n_jobs=0)
@@ -146,3 +146,41 @@ def test_check_k_additivity(
     game.set_values(positive_game_of_three)
     assert check_k_additivity(game, 2)
     assert not check_k_additivity(game, 1)
+
+
+def test_checkers_in_chunks(  # type: ignore
+    monkeypatch,
+    positive_game_of_three: list[tuple[Coalition, float]],
+    monotone_game_of_three: list[tuple[Coalition, float]],
+) -> None:
+    monkeypatch.setattr("shapleypy._chunked.CHUNK_SIZE", 2)
+    game = Game(3)
+    game.set_values(positive_game_of_three)
+    assert check_monotonicity(game)
+    assert check_weakly_superadditivity(game)
+    assert check_convexity(game)
+    game.set_values(monotone_game_of_three)
+    assert check_monotonicity(game)
+    assert not check_weakly_superadditivity(game)
+    assert not check_convexity(game)
+    game.set_value(Coalition.from_players([0, 2]), 10.0)
+    assert not check_monotonicity(game)
+
+
+def test_dividend_checkers_in_chunks(  # type: ignore
+    monkeypatch,
+    tmpdir,
+    positive_game_of_three: list[tuple[Coalition, float]],
+    k_game_of_three: list[tuple[Coalition, float]],
+) -> None:
+    monkeypatch.setattr("shapleypy._chunked.CHUNK_SIZE", 2)
+    game = Game(3, filename=str(tmpdir.join("game.bin")))
+    game.set_values(positive_game_of_three)
+    assert check_positivity(game)
+    assert check_k_additivity(game, 2)
+    assert not check_k_additivity(game, 1)
+    game.set_value(Coalition.from_players([0, 1, 2]), 8.0)
+    assert not check_positivity(game)
+    game.set_values(k_game_of_three)
+    assert check_k_game(game, 2)
+    assert not check_k_game(game, 1)
@@ -1,6 +1,14 @@
+import copy
+
+import numpy as np
 import pytest
 
-from shapleypy.coalition import Coalition
+from shapleypy.coalition import (
+    EMPTY_COALITION,
+    Coalition,
+    CoalitionArray,
+    player_memberships,
+)
 
 
 @pytest.fixture
@@ -139,3 +147,140 @@ def test_symmetric_difference() -> None:
     assert Coalition(0b1010) / Coalition(0b0010) == Coalition(0b1000)
     with pytest.raises(TypeError):
         Coalition(0b1010) / "s"
+
+
+def test_all_subcoalitions_include_empty() -> None:
+    assert list(Coalition(0b1010).all_subcoalitions(include_empty=True)) == [
+        Coalition(0b0000),
+        Coalition(0b0010),
+        Coalition(0b1000),
+        Coalition(0b1010),
+    ]
+    assert list(Coalition(0).all_subcoalitions()) == []
+
+
+def test_all_subcoalitions_of_high_player() -> None:
+    # Only the submasks are visited, not all IDs up to 2^31
+    assert list(Coalition.from_players([31]).all_subcoalitions()) == [
+        Coalition.from_players([31])
+    ]
+    assert list(Coalition.from_players([0, 31]).all_subcoalition_ids()) == [
+        1,
+        2**31,
+        2**31 + 1,
+    ]
+
+
+def test_all_subcoalition_ids() -> None:
+    coalition = Coalition(0b101101)
+    ids = coalition.all_subcoalition_ids()
+    assert ids.dtype == np.uint32
+    assert list(ids) == [S.id for S in coalition.all_subcoalitions()]
+    assert list(coalition.all_subcoalition_ids(include_empty=True)) == [
+        0,
+        *ids,
+    ]
+
+
+def test_all_coalitions_of_size(
+    all_coalitions_of_4_players: list[Coalition],
+) -> None:
+    for size in range(5):
+        assert list(Coalition.all_coalitions_of_size(4, size)) == [
+            S
+            for S in [EMPTY_COALITION, *all_coalitions_of_4_players]
+            if len(S) == size
+        ]
+    assert list(Coalition.all_coalitions_of_size(4, 5)) == []
+    assert list(Coalition.all_coalitions_of_size(4, 2, at_most=True)) == [
+        *Coalition.all_coalitions_of_size(4, 1),
+        *Coalition.all_coalitions_of_size(4, 2),
+    ]
+    with pytest.raises(ValueError):
+        list(Coalition.all_coalitions_of_size(33, 1))
+
+
+def test_all_coalition_ids_of_size() -> None:
+    for size in range(7):
+        ids = Coalition.all_coalition_ids_of_size(6, size)
+        assert ids.dtype == np.uint32
+        assert list(ids) == [
+            S.id for S in Coalition.all_coalitions_of_size(6, size)
+        ]
+        assert list(
+            Coalition.all_coalition_ids_of_size(6, size, at_most=True)
+        ) == [
+            S.id
+            for S in Coalition.all_coalitions_of_size(6, size, at_most=True)
+        ]
+    # Just the coalitions of the size are created
+    assert len(Coalition.all_coalition_ids_of_size(30, 2)) == 435
+    assert len(Coalition.all_coalition_ids_of_size(32, 2, at_most=True)) == 528
+
+
+def test_player_memberships() -> None:
+    memberships = player_memberships(np.array([0, 5, 6], dtype=np.uint32), 3)
+    assert memberships.tolist() == [
+        [False, False, False],
+        [True, False, True],
+        [False, True, True],
+    ]
+
+
+def test_coalition_array_set_operations() -> None:
+    coalitions = CoalitionArray([0b1010, 0b0110, 0b0001])
+    assert (coalitions + Coalition(0b0100)).ids.tolist() == [14, 6, 5]
+    assert (coalitions - [1, 2]).ids.tolist() == [8, 0, 1]
+    assert (coalitions * 3).ids.tolist() == [8, 0, 0]
+    other = CoalitionArray([0b0011, 0b0110, 0b1000])
+    assert (coalitions / other).ids.tolist() == [9, 0, 9]
+    assert (coalitions * other).ids.dtype == np.uint32
+    with pytest.raises(TypeError):
+        coalitions + "s"
+
+
+def test_coalition_array_contains_sizes_and_memberships() -> None:
+    coalitions = CoalitionArray.from_coalitions(
+        [Coalition(0b1010), [1, 2], [31]]
+    )
+    assert coalitions.contains(1).tolist() == [True, True, False]
+    assert coalitions.contains([1, 3]).tolist() == [True, False, False]
+    assert coalitions.contains(
+        CoalitionArray([0b1000, 0b0110, 0b0001])
+    ).tolist() == [True, True, False]
+    assert coalitions.sizes().tolist() == [2, 2, 1]
+    assert coalitions.memberships(4)[:2].tolist() == [
+        [False, True, False, True],
+        [False, True, True, False],
+    ]
+
+
+def test_coalition_array_sequence(
+    all_coalitions_of_4_players: list[Coalition],
+) -> None:
+    coalitions = CoalitionArray.all_coalitions(4)
+    assert len(coalitions) == 15
+    assert list(coalitions) == all_coalitions_of_4_players
+    assert coalitions[2] == all_coalitions_of_4_players[2]
+    assert list(coalitions[coalitions.sizes() == 3]) == [
+        S for S in all_coalitions_of_4_players if len(S) == 3
+    ]
+    ids = np.array([3, 5], dtype=np.uint32)
+    assert CoalitionArray(ids).ids is ids
+
+
+def test_compact_coalition() -> None:
+    coalition = Coalition(np.uint32(0b1011))
+    assert type(coalition.id) is int
+    assert not hasattr(coalition, "__dict__")
+    assert len(coalition) == 3
+    assert len(Coalition.from_players([0, 17, 31])) == 3
+    assert list(Coalition.from_players([31, 0, 17]).get_players) == [0, 17, 31]
+
+
+def test_coalition_interning() -> None:
+    assert Coalition(0b1011) is Coalition(0b1011)
+    assert Coalition.from_players([0, 1]) is Coalition(0b11)
+    assert copy.deepcopy(Coalition(5)) is Coalition(5)
+    large = Coalition(2**31)
+    assert copy.deepcopy(large) == large
@@ -4,6 +4,7 @@ import numpy as np
 import pytest
 
 from shapleypy.coalition import Coalition
+from shapleypy.constants import RATIONAL_DTYPE
 from shapleypy.game import Game
 
 core = pytest.importorskip(
@@ -104,3 +105,10 @@ def test_contain_integer_point(
         ]
     )
     assert core.contains_integer_point(game)
+
+
+@pytest.mark.parametrize("dtype", [np.int64, np.float32, RATIONAL_DTYPE])
+def test_core_with_dtype(dtype) -> None:  # type: ignore
+    game = Game(2, dtype=dtype)
+    game.set_values([([0], 1), ([1], 1), ([0, 1], 3)])
+    assert sorted(core.get_vertices(game)) == [(1.0, 2.0), (2.0, 1.0)]
@@ -1,7 +1,10 @@
 import numpy as np
 import pytest
+from gmpy2 import mpq
 
-from shapleypy.coalition import Coalition
+from shapleypy._typing import GameValueInput
+from shapleypy.coalition import Coalition, CoalitionArray
+from shapleypy.constants import RATIONAL_DTYPE
 from shapleypy.game import Game
 
 
@@ -41,6 +44,17 @@ def test_init() -> None:
     assert all(np.isnan(x) for x in game._values[1:])
 
 
+def test_init_memmap(tmpdir) -> None:  # type: ignore
+    file = tmpdir.join("game.bin")
+    game = Game(3, filename=str(file))
+    assert isinstance(game._values, np.memmap)
+    assert game._values[0] == 0.0
+    assert all(np.isnan(x) for x in game._values[1:])
+    game.set_value([1, 2], 1.0)
+    assert game.get_value([1, 2]) == 1.0
+    assert file.size() == 8 * 8
+
+
 def test_str() -> None:
     game = Game(3)
     assert (
@@ -218,6 +232,66 @@ def test_get_values_out_of_bounds() -> None:
         list(game.get_values([[0, 1, 2, 3], [0, 2], [1, 2], [0, 1, 2]]))
 
 
+def test_get_and_set_values_of_coalition_array() -> None:
+    game = Game(3)
+    coalitions = CoalitionArray([1, 2, 3, 7])
+    game.set_values(np.array([1.0, 2.0, 4.0, 8.0]), coalitions)
+    assert game.get_values(coalitions).tolist() == [1.0, 2.0, 4.0, 8.0]
+    assert game.get_value([0, 1]) == 4.0
+    assert np.isnan(game.get_values(CoalitionArray([4]))[0])
+    # The mask of missing values follows the values set at once
+    assert game._missing_values()[1] == 3
+
+    rational_game = Game(2, dtype=RATIONAL_DTYPE)
+    rational_game.set_values(["1/3", 2, 0.5], CoalitionArray([1, 2, 3]))
+    assert rational_game.get_value([0]) == mpq(1, 3)
+    assert rational_game.get_value([0, 1]) == mpq(1, 2)
+
+    with pytest.raises(IndexError):
+        game.get_values(CoalitionArray([8]))
+    with pytest.raises(IndexError):
+        game.set_values([1.0], CoalitionArray([9]))
+    with pytest.raises(ValueError):
+        game.set_values([1.0, 2.0], CoalitionArray([1]))
+
+
+def test_get_and_set_values_by_ids() -> None:
+    game = Game(3)
+    ids = np.array([7, 1, 6], dtype=np.uint32)
+    values: list[GameValueInput] = [3.0, 1.0, "1/2"]
+    game.set_values_by_ids(ids, values)
+    assert game.get_values_by_ids(ids).tolist() == [3.0, 1.0, 0.5]
+    assert game.get_values_by_ids([[0, 7], [1, 6]]).tolist() == [
+        [0.0, 3.0],
+        [1.0, 0.5],
+    ]
+    assert game._missing_values()[1] == 4
+    with pytest.raises(IndexError):
+        game.get_values_by_ids([8])
+    with pytest.raises(IndexError):
+        game.set_values_by_ids([8], [1.0])
+    with pytest.raises(ValueError):
+        game.set_values_by_ids([1, 2], [1.0])
+
+
+def test_from_array() -> None:
+    values = np.array([0.0, 1.0, 2.0, np.nan])
+    game = Game.from_array(values)
+    assert game.number_of_players == 2
+    assert game.get_value([1]) == 2.0
+    assert np.isnan(game.get_value([0, 1]))
+    # The values are copied
+    values[1] = 5.0
+    assert game.get_value([0]) == 1.0
+    rational_values: list[GameValueInput] = [0, "1/3", 1, 2]
+    rational_game = Game.from_array(rational_values, dtype=RATIONAL_DTYPE)
+    assert rational_game.get_value([0]) == mpq(1, 3)
+    assert Game.from_array([0, 1], dtype=np.int64).dtype == np.int64
+    for wrong_values in ([0.0], [0.0, 1.0, 2.0], [[0.0, 1.0]]):
+        with pytest.raises(ValueError):
+            Game.from_array(wrong_values)
+
+
 def test_eq(
     basic_values_for_game_of_three_coalition_form: list[
         tuple[Coalition, float]
@@ -235,3 +309,65 @@ def test_eq(
     game1 = Game(3)
     game2 = Game(4)
     assert game1 != game2
+
+
+def test_init_with_dtype() -> None:
+    game = Game(3, dtype=np.float32)
+    assert game.dtype == np.float32
+    assert np.isnan(game.get_value([0]))
+    game.set_value([0], 1.5)
+    assert game.get_value([0]) == np.float32(1.5)
+    game = Game(3, dtype=np.int64)
+    # Integer games have no missing values
+    assert list(game._values) == [0] * 8
+    game.set_value([0, 1], 3)
+    assert game.get_value([0, 1]) == 3
+
+
+@pytest.mark.parametrize("value", [np.nan, 1.7])
+def test_integer_dtype_rejects_other_values(value: float) -> None:
+    game = Game(2, dtype=np.int64)
+    with pytest.raises(ValueError):
+        game.set_value([0], value)
+    with pytest.raises(ValueError):
+        game.set_values_by_ids(np.array([1]), [value])
+    with pytest.raises(ValueError):
+        Game.from_array([0, value, 1, 2], dtype=np.int64)
+    assert list(game._values) == [0] * 4
+
+
+def test_init_with_rational_dtype(tmpdir) -> None:  # type: ignore
+    game = Game(3, dtype=RATIONAL_DTYPE)
+    assert game.get_value([]) == 0
+    assert np.isnan(game.get_value([0]))
+    game.set_value([0], "1/3")
+    game.set_value([1], 0.5)
+    assert game.get_value([0]) == mpq(1, 3)
+    assert game.get_value([0]) + game.get_value([1]) == mpq(5, 6)
+    other_game = Game(3, dtype=RATIONAL_DTYPE)
+    other_game.set_values([([0], mpq(1, 3)), ([1], mpq(1, 2))])
+    assert game == other_game
+    with pytest.raises(ValueError):
+        Game(3, filename=str(tmpdir.join("game.bin")), dtype=RATIONAL_DTYPE)
+
+
+def test_missing_values() -> None:
+    game = Game(3)
+    mask, number_of_missing = game._missing_values()
+    assert list(mask) == [False] + [True] * 7
+    assert number_of_missing == 7
+    # The mask is kept up to date by set_value
+    game.set_value([0], 1.0)
+    game.set_value([0, 1], np.nan)
+    game.set_values([([1], 2.0), ([1], 3.0)])
+    mask, number_of_missing = game._missing_values()
+    assert list(mask) == [False, False, False] + [True] * 5
+    assert number_of_missing == 5
+    # Direct modifications are announced by _values_changed
+    game._values[:] = 1.0
+    game._values_changed()
+    assert game._missing_values()[1] == 0
+    assert Game(3, dtype=np.int64)._missing_values()[1] == 0
+    game = Game(3, dtype=RATIONAL_DTYPE)
+    game.set_value([0], "1/2")
+    assert list(game._missing_values()[0]) == [False, False] + [True] * 6
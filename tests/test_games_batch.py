@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from gmpy2 import mpq
+
+from shapleypy.classes_checkers import (
+    check_convexity,
+    check_k_additivity,
+    check_k_game,
+    check_monotonicity,
+    check_positivity,
+    check_superadditivity,
+    check_weakly_superadditivity,
+    determine_class,
+)
+from shapleypy.constants import RATIONAL_DTYPE
+from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+from shapleypy.generators import (
+    k_additive_game_generator,
+    k_game_generator,
+    positive_game_generator,
+    random_game_generator,
+)
+from shapleypy.normalization import (
+    standart_normalization,
+    zero_one_normalization,
+)
+from shapleypy.solution_concept.banzhaf_value import (
+    banzhaf,
+    banzhaf_value_of_player,
+)
+from shapleypy.solution_concept.shapley_value import (
+    shapley,
+    shapley_value_of_game,
+    shapley_value_of_player,
+)
+
+
+@pytest.fixture
+def games() -> list[Game]:
+    generator = np.random.default_rng(0)
+    return [
+        random_game_generator(5, generator),
+        positive_game_generator(5, generator),
+        k_game_generator(5, generator, k=2),
+        k_additive_game_generator(5, generator, k=2),
+        Game.from_array(np.arange(32) ** 2),
+    ]
+
+
+def test_create_batch(games: list[Game]) -> None:
+    batch = GamesBatch.from_games(games)
+    assert len(batch) == batch.number_of_games == 5
+    assert batch.number_of_players == 5
+    assert all(game == original for game, original in zip(batch, games))
+    batch[0].set_value([0], 100.0)
+    assert batch[0] == games[0]
+    assert batch.get_values_by_ids([1, 3]).shape == (5, 2)
+
+    empty = GamesBatch(2, 2)
+    assert np.isnan(empty.get_values_by_ids([1, 2, 3])).all()
+    assert list(empty.get_values_by_ids([0])) == [0.0, 0.0]
+    empty.set_values_by_ids([1, 2], [1.0, 2.0])
+    empty.set_values_by_ids([3], [[3.0], [4.0]])
+    assert empty.get_values_by_ids([1, 2, 3]).tolist() == [
+        [1.0, 2.0, 3.0],
+        [1.0, 2.0, 4.0],
+    ]
+    with pytest.raises(ValueError):
+        empty.set_values_by_ids([1, 2], [1.0])
+    with pytest.raises(IndexError):
+        empty.get_values_by_ids([4])
+
+    with pytest.raises(ValueError):
+        GamesBatch.from_games([games[0], Game(3)])
+    with pytest.raises(ValueError):
+        GamesBatch.from_games([])
+    with pytest.raises(ValueError):
+        GamesBatch.from_array(np.zeros(4))
+    with pytest.raises(ValueError):
+        GamesBatch.from_array(np.zeros((2, 6)))
+
+
+def test_shapley_and_banzhaf_values_of_batch(games: list[Game]) -> None:
+    batch = GamesBatch.from_games(games)
+    values = shapley(batch)
+    assert isinstance(values, np.ndarray)
+    assert np.shape(values) == (5, 5)
+    assert values == pytest.approx(np.array([shapley(game) for game in games]))
+    assert banzhaf(batch) == pytest.approx(
+        np.array([banzhaf(game) for game in games])
+    )
+    assert shapley_value_of_player(batch, 3) == pytest.approx(values[:, 3])
+    assert banzhaf_value_of_player(batch, 3) == pytest.approx(
+        [banzhaf_value_of_player(game, 3) for game in games]
+    )
+    assert shapley_value_of_game(batch, n_jobs=2) == pytest.approx(values)
+
+
+def test_shapley_value_of_batch_with_missing_values() -> None:
+    batch = GamesBatch(3, 3)
+    batch.set_values_by_ids([7], [[3.0], [6.0], [9.0]])
+    with pytest.warns(RuntimeWarning):
+        shapley_value_of_game(batch)
+    assert shapley_value_of_game(batch, 0.0).tolist() == [
+        [1.0, 1.0, 1.0],
+        [2.0, 2.0, 2.0],
+        [3.0, 3.0, 3.0],
+    ]
+
+    rational_batch = GamesBatch.from_array(
+        [[0, 1, 1, 3], [0, 1, 2, 2]], dtype=RATIONAL_DTYPE
+    )
+    assert shapley_value_of_game(rational_batch).tolist() == [
+        [mpq(3, 2), mpq(3, 2)],
+        [mpq(1, 2), mpq(3, 2)],
+    ]
+
+
+def test_normalization_of_batch(games: list[Game]) -> None:
+    batch = GamesBatch.from_games(games)
+    standart_normalization(batch)
+    for game, normalized in zip(games, batch):
+        standart_normalization(game)
+        assert normalized._all_values() == pytest.approx(game._all_values())
+
+    batch = GamesBatch.from_games(games)
+    zero_one_normalization(batch)
+    for game, normalized in zip(games, batch):
+        zero_one_normalization(game)
+        assert normalized._all_values() == pytest.approx(game._all_values())
+
+
+def test_checkers_of_batch(games: list[Game]) -> None:
+    batch = GamesBatch.from_games(games)
+    for check in [
+        check_monotonicity,
+        check_weakly_superadditivity,
+        check_superadditivity,
+        check_convexity,
+        check_positivity,
+        check_k_game,
+    ]:
+        results = check(batch)
+        assert isinstance(results, np.ndarray)
+        assert results.tolist() == [check(game) for game in games]
+    results = check_k_game(batch, 2)
+    assert isinstance(results, np.ndarray)
+    assert results.tolist() == [check_k_game(game, 2) for game in games]
+    # k-games are k-additive too
+    results = check_k_additivity(batch, 2)
+    assert isinstance(results, np.ndarray)
+    assert results.tolist() == [
+        False,
+        False,
+        True,
+        True,
+        True,
+    ]
+    classes = determine_class(batch)
+    assert isinstance(classes, np.ndarray)
+    assert classes.tolist() == [determine_class(game) for game in games]
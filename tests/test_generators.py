@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from shapleypy.classes_checkers import (
@@ -7,6 +8,7 @@ from shapleypy.classes_checkers import (
     check_k_game,
     check_positivity,
 )
+from shapleypy.constants import RATIONAL_DTYPE
 from shapleypy.generators import (
     ReturnType,
     k_additive_game_generator,
@@ -34,6 +36,7 @@ def test_random_game_generator() -> None:
 
 def test_positive_game_generator() -> None:
     game = positive_game_generator(5)
+    assert game._values[0] == 0.0
     assert all(not value.is_integer() for value in game._values[1:])
     assert check_positivity(game)
     game = positive_game_generator(
@@ -48,8 +51,29 @@ def test_positive_game_generator() -> None:
 def test_k_game_generator() -> None:
     game = k_game_generator(5, k=3)
     assert check_k_game(game, 3)
+    # The dividends of the coalitions of size k are attached
+    ids, _ = game._known_dividends()  # type: ignore
+    assert len(ids) == 10
 
 
 def test_k_additive_game_generator() -> None:
     game = k_additive_game_generator(5, k=3)
     assert check_k_additivity(game, 3)
+    ids, _ = game._known_dividends()  # type: ignore
+    assert len(ids) == 25
+
+
+def test_generators_with_dtype() -> None:
+    game = random_game_generator(5, dtype=np.float32)
+    assert game.dtype == np.float32
+    game = positive_game_generator(
+        5,
+        return_type=ReturnType.INTEGER,
+        upper_bound=10,
+        dtype=np.int64,
+    )
+    assert game.dtype == np.int64
+    assert check_positivity(game)
+    game = k_additive_game_generator(5, k=2, dtype=RATIONAL_DTYPE)
+    assert game.dtype == RATIONAL_DTYPE
+    assert check_k_additivity(game, 2)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from shapleypy.game import Game
+from shapleypy.generators import random_game_generator
+from shapleypy.oracle_game import OracleGame
+from shapleypy.solution_concept.kernel_shap import kernel_shap
+from shapleypy.solution_concept.shapley_value import shapley
+
+
+def test_kernel_shap_of_game() -> None:
+    game = random_game_generator(6, np.random.default_rng(42))
+    values = kernel_shap(
+        game, number_of_samples=20_000, generator=np.random.default_rng(0)
+    )
+    assert np.shape(values) == (6,)
+    assert values == pytest.approx(shapley(game), abs=0.1)
+    # The efficiency constraint holds exactly
+    assert np.sum(values) == pytest.approx(game.get_value(range(6)))
+    values = kernel_shap(
+        game, number_of_samples=100, generator=np.random.default_rng(1)
+    )
+    assert isinstance(values, np.ndarray)
+    assert kernel_shap(
+        game, 2, number_of_samples=100, generator=np.random.default_rng(1)
+    ) == pytest.approx(values[2])
+
+
+def test_kernel_shap_of_batch_oracle() -> None:
+    # Linear game of 50 players is estimated exactly
+    weights = np.arange(50, dtype=np.float64)
+
+    def batch_oracle(coalition_ids: np.ndarray) -> np.ndarray:
+        bits = coalition_ids[:, None] >> np.arange(50, dtype=np.uint64) & 1
+        return bits.astype(np.float64) @ weights
+
+    game = OracleGame(50, batch_oracle=batch_oracle)
+    for paired in [True, False]:
+        values = kernel_shap(
+            game,
+            number_of_samples=500,
+            paired=paired,
+            generator=np.random.default_rng(0),
+        )
+        assert values == pytest.approx(weights, abs=1e-9)
+
+
+def test_kernel_shap_edge_cases() -> None:
+    game = Game.from_array([0.0, 2.0])
+    assert list(kernel_shap(game)) == [2.0]  # type: ignore
+    with pytest.warns(RuntimeWarning):
+        kernel_shap(Game(2), number_of_samples=10)
+    with pytest.raises(ValueError):
+        kernel_shap(game, number_of_samples=0)
+    with pytest.raises(ValueError):
+        kernel_shap(OracleGame(64, float))
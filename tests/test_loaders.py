@@ -3,6 +3,7 @@ import pytest
 
 from shapleypy.game import Game
 from shapleypy.loaders import load_game_from_csv, load_game_from_json
+from shapleypy.sparse_game import SparseGame
 
 
 @pytest.fixture
@@ -96,3 +97,17 @@ def test_csv_same_separators() -> None:
 
 
 # endregion
+
+
+def test_sparse_input(partial_game_of_three: Game) -> None:
+    for loaded_game in [
+        load_game_from_json(
+            "tests/input_data/json/partial_values.json", sparse=True
+        ),
+        load_game_from_csv(
+            "tests/input_data/csv/partial_values.csv", sparse=True
+        ),
+    ]:
+        assert isinstance(loaded_game, SparseGame)
+        assert list(loaded_game.defined_coalitions()[0]) == [0, 1, 2, 6, 7]
+        assert loaded_game == partial_game_of_three
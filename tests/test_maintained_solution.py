@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from gmpy2 import mpq
+
+from shapleypy.coalition import CoalitionArray
+from shapleypy.constants import RATIONAL_DTYPE
+from shapleypy.game import Game
+from shapleypy.generators import random_game_generator
+from shapleypy.normalization import standart_normalization
+from shapleypy.solution_concept.banzhaf_value import banzhaf_value_of_game
+from shapleypy.solution_concept.maintained_solution import MaintainedSolution
+from shapleypy.solution_concept.shapley_value import shapley_value_of_game
+from shapleypy.sparse_game import SparseGame
+
+
+def assert_maintained(solution: MaintainedSolution) -> None:
+    default_value = solution.default_value
+    assert solution.shapley_values == pytest.approx(
+        shapley_value_of_game(solution.game, default_value)
+    )
+    assert solution.banzhaf_values == pytest.approx(
+        banzhaf_value_of_game(solution.game, default_value)
+    )
+
+
+def test_maintained_solution_of_game() -> None:
+    game = random_game_generator(5, np.random.default_rng(0))
+    solution = MaintainedSolution(game)
+    assert_maintained(solution)
+    game.set_value([0, 3], 10.0)
+    game.set_value([], 1.0)
+    game.set_value(range(5), -2.0)
+    assert_maintained(solution)
+    game.set_values([([1], 3.0), ([1, 2], 4.0), ([1], 5.0)])
+    assert_maintained(solution)
+    game.set_values([7.0, 8.0, 9.0], CoalitionArray([6, 6, 9]))
+    assert_maintained(solution)
+
+    # Values modified directly are computed again
+    standart_normalization(game)
+    game.set_value([2], 0.5)
+    assert_maintained(solution)
+
+    solution.detach()
+    expected = solution.shapley_values
+    game.set_value([2], 100.0)
+    assert list(solution.shapley_values) == list(expected)
+
+
+def test_maintained_solution_with_missing_values() -> None:
+    game = Game(3)
+    game.set_value([0, 1, 2], 3.0)
+    solution = MaintainedSolution(game, default_value=1.0)
+    assert_maintained(solution)
+    game.set_value([0], 2.0)
+    game.set_value([0, 1, 2], np.nan)
+    assert_maintained(solution)
+
+    with pytest.warns(RuntimeWarning):
+        MaintainedSolution(Game(3))
+
+
+def test_maintained_solution_of_sparse_and_rational_games() -> None:
+    game = SparseGame(6, default_value=1.0)
+    solution = MaintainedSolution(game)
+    game.set_values([([0, 1], 3.0), ([2], 4.0), ([0, 1], 2.0)])
+    assert_maintained(solution)
+
+    rational_game = Game(3, dtype=RATIONAL_DTYPE)
+    rational_game.set_values(
+        (coalition, mpq(len(coalition), 3))
+        for coalition in rational_game.all_coalitions
+    )
+    solution = MaintainedSolution(rational_game)
+    rational_game.set_value([0, 1, 2], "2/7")
+    assert list(solution.shapley_values) == list(
+        shapley_value_of_game(rational_game)
+    )
+    assert sum(solution.shapley_values) == mpq(2, 7)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
+from gmpy2 import mpq
 
 from shapleypy.coalition import Coalition
+from shapleypy.constants import RATIONAL_DTYPE
 from shapleypy.game import Game
 from shapleypy.normalization import (
     standart_normalization,
     zero_one_normalization,
 )
+from shapleypy.oracle_game import OracleGame
+from shapleypy.sparse_game import SparseGame
 
 
 @pytest.fixture
@@ -54,3 +59,72 @@ def test_zero_one_normalization(
             list(game._values[1:]), [0.0, 0.0, 2 / 6, 0.0, 2 / 6, 2 / 6, 1.0]
         )
     )
+
+
+def test_zero_one_normalization_in_chunks(  # type: ignore
+    monkeypatch,
+    basic_values_for_game_of_three_coalition_form: list[
+        tuple[Coalition, float]
+    ],
+) -> None:
+    monkeypatch.setattr("shapleypy._chunked.CHUNK_SIZE", 2)
+    game = Game(3)
+    game.set_values(basic_values_for_game_of_three_coalition_form)
+    zero_one_normalization(game)
+    assert list(game._values[1:]) == pytest.approx(
+        [0.0, 0.0, 2 / 6, 0.0, 2 / 6, 2 / 6, 1.0]
+    )
+
+
+def test_normalization_with_dtype(
+    basic_values_for_game_of_three_coalition_form: list[
+        tuple[Coalition, float]
+    ],
+) -> None:
+    game = Game(3, dtype=RATIONAL_DTYPE)
+    game.set_values(basic_values_for_game_of_three_coalition_form)
+    zero_one_normalization(game)
+    assert list(game._values[1:]) == [
+        0,
+        0,
+        mpq(1, 3),
+        0,
+        mpq(1, 3),
+        mpq(1, 3),
+        1,
+    ]
+    game = Game(3, dtype=np.int64)
+    with pytest.raises(TypeError):
+        standart_normalization(game)
+
+
+def test_normalization_of_sparse_game(
+    basic_values_for_game_of_three_coalition_form: list[
+        tuple[Coalition, float]
+    ],
+) -> None:
+    game = SparseGame(3, default_value=3.0)
+    game.set_values(basic_values_for_game_of_three_coalition_form[-3:])
+    standart_normalization(game)
+    assert list(game._all_values()) == [0.0] + [1 / 3] * 4 + [4 / 9] * 2 + [1.0]
+    assert len(game.defined_coalitions()[0]) == 4
+
+    game = SparseGame(3)
+    game.set_values(basic_values_for_game_of_three_coalition_form)
+    zero_one_normalization(game)
+    assert list(game._all_values()[1:]) == pytest.approx(
+        [0.0, 0.0, 2 / 6, 0.0, 2 / 6, 2 / 6, 1.0]
+    )
+    # The undefined coalitions would get values 3 - |S|
+    game = SparseGame(3, default_value=3.0)
+    game.set_values(basic_values_for_game_of_three_coalition_form[-1:])
+    with pytest.raises(ValueError):
+        zero_one_normalization(game)
+
+
+def test_normalization_of_oracle_game() -> None:
+    game = OracleGame(3, float)
+    with pytest.raises(TypeError):
+        standart_normalization(game)
+    with pytest.raises(TypeError):
+        zero_one_normalization(game)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from shapleypy.classes_checkers import check_convexity, check_monotonicity
+from shapleypy.coalition import Coalition, CoalitionArray
+from shapleypy.game import Game
+from shapleypy.oracle_game import OracleGame
+from shapleypy.solution_concept.banzhaf_value import banzhaf
+from shapleypy.solution_concept.shapley_sampling import (
+    permutation_sampling_shapley,
+)
+from shapleypy.solution_concept.shapley_value import shapley
+
+
+def squared_size(coalition_id: int) -> float:
+    return float(bin(coalition_id).count("1") ** 2)
+
+
+def test_get_value() -> None:
+    game = OracleGame(3, squared_size)
+    assert game.get_value([0, 2]) == 4.0
+    assert game.get_value(Coalition.from_players([0, 1, 2])) == 9.0
+    assert game.get_value(1) == 1.0
+    assert game.get_value([]) == 0.0
+    with pytest.raises(IndexError):
+        game.get_value([0, 3])
+    with pytest.raises(TypeError):
+        game.get_value("s")  # type: ignore
+
+
+def test_set_value() -> None:
+    game = OracleGame(3, squared_size)
+    with pytest.raises(TypeError):
+        game.set_value([0, 1], 1.0)
+    with pytest.raises(TypeError):
+        game.set_values([1.0], CoalitionArray([3]))
+    assert game.get_values(CoalitionArray([3, 7])).tolist() == [4.0, 9.0]
+
+
+def test_cache() -> None:
+    calls = []
+
+    def oracle(coalition_id: int) -> float:
+        calls.append(coalition_id)
+        return squared_size(coalition_id)
+
+    game = OracleGame(3, oracle, cache_capacity=2)
+    game.get_value([0])
+    game.get_value([1])
+    game.get_value([0])
+    assert calls == [1, 2]
+    assert game.cache_info() == (1, 2, 0, 2, 2)
+    # [1] is the least recently used, so it is evicted
+    game.get_value([2])
+    game.get_value([0])
+    game.get_value([1])
+    assert calls == [1, 2, 4, 2]
+    assert game.cache_info() == (2, 4, 2, 2, 2)
+    game.cache_clear()
+    assert game.cache_info() == (0, 0, 0, 2, 0)
+
+
+def test_cache_disabled() -> None:
+    game = OracleGame(3, squared_size, cache_capacity=0)
+    game.get_value([0])
+    game.get_value([0])
+    assert game.cache_info() == (0, 2, 0, 0, 0)
+
+
+def test_eq_and_str() -> None:
+    game = Game(2)
+    game.set_values([([0], 1.0), ([1], 1.0), ([0, 1], 4.0)])
+    oracle_game = OracleGame(2, squared_size)
+    assert oracle_game == game
+    assert str(oracle_game).startswith("OracleGame(number_of_players=2,")
+
+
+def test_solution_concepts_and_checkers() -> None:
+    game = OracleGame(4, squared_size)
+    assert list(shapley(game)) == pytest.approx([4.0] * 4)  # type: ignore
+    assert banzhaf(game, 0) == pytest.approx(4.0)
+    assert check_monotonicity(game)
+    assert check_convexity(game)
+    result = permutation_sampling_shapley(
+        game, generator=np.random.default_rng(0), max_permutations=10
+    )
+    assert np.sum(result.values) == pytest.approx(16.0)
+    # All 16 coalitions are computed just once
+    assert game.cache_info().misses == 16
+
+
+def test_batch_oracle() -> None:
+    batches = []
+
+    def batch_oracle(coalition_ids: np.ndarray) -> np.ndarray:
+        batches.append(coalition_ids.copy())
+        return np.array([squared_size(int(id)) for id in coalition_ids])
+
+    game = OracleGame(4, batch_oracle=batch_oracle, batch_size=5)
+    assert list(shapley(game)) == pytest.approx([4.0] * 4)  # type: ignore
+    assert [len(batch) for batch in batches] == [5, 5, 5, 1]
+    assert all(batch.dtype == np.uint32 for batch in batches)
+    # Everything is cached now, so the oracle is not called again
+    assert banzhaf(game, 0) == pytest.approx(4.0)
+    assert game.get_value([0, 1]) == 4.0
+    assert len(batches) == 4
+    assert game.cache_info().misses == 16
+
+
+def test_batch_oracle_deduplicates_missing_values() -> None:
+    batches = []
+
+    def batch_oracle(coalition_ids: np.ndarray) -> np.ndarray:
+        batches.append(list(coalition_ids))
+        return coalition_ids.astype(float)
+
+    game = OracleGame(3, batch_oracle=batch_oracle)
+    values = game._evaluate(np.array([[3, 1], [3, 5]]))
+    assert values.tolist() == [[3.0, 1.0], [3.0, 5.0]]
+    assert batches == [[1, 3, 5]]
+
+
+def test_missing_oracle() -> None:
+    with pytest.raises(ValueError):
+        OracleGame(3)
+    with pytest.raises(ValueError):
+        OracleGame(3, squared_size, batch_size=0)
+
+
+def test_all_values_larger_than_cache() -> None:
+    batches = []
+
+    def batch_oracle(coalition_ids: np.ndarray) -> np.ndarray:
+        batches.append(len(coalition_ids))
+        return np.array([squared_size(int(id)) for id in coalition_ids])
+
+    game = OracleGame(4, batch_oracle=batch_oracle, cache_capacity=8)
+    game.get_value([0, 1])
+    values = game._all_values()
+    assert values.tolist() == [squared_size(id) for id in range(16)]
+    # The values are computed in batches without evicting the cache
+    assert batches == [1, 16]
+    assert game.cache_info() == (0, 17, 0, 8, 1)
+
+
+def test_solution_concepts_larger_than_cache() -> None:
+    game = OracleGame(5, squared_size, cache_capacity=8)
+    assert list(shapley(game)) == pytest.approx([5.0] * 5)  # type: ignore
+    # The values of all coalitions are computed once (not again for the mask
+    # of missing values)
+    assert game.cache_info().misses == 32
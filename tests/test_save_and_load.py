@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+
+import numpy as np
 import pytest
+from gmpy2 import mpq
 
 from shapleypy.coalition import Coalition
+from shapleypy.constants import RATIONAL_DTYPE
 from shapleypy.game import Game
 from shapleypy.loaders import (
     load_game_from_csv,
     load_game_from_json,
+    load_game_from_memmap,
 )
 from shapleypy.savers import (
     save_game_to_csv,
     save_game_to_json,
+    save_game_to_memmap,
 )
 
 
@@ -71,3 +78,63 @@ def test_save_and_load_game_to_csv_empty(tmpdir) -> None:  # type: ignore
     save_game_to_csv(game, str(file))
     loaded_game = load_game_from_csv(str(file))
     assert game == loaded_game
+
+
+def test_save_and_load_game_to_memmap_with_values(  # type: ignore
+    basic_values_for_game_of_three_coalition_form: list[
+        tuple[Coalition, float]
+    ],
+    tmpdir,
+) -> None:
+    game = Game(3)
+    game.set_values(basic_values_for_game_of_three_coalition_form)
+    file = tmpdir.join("game.bin")
+    save_game_to_memmap(game, str(file))
+    loaded_game = load_game_from_memmap(str(file))
+    assert game == loaded_game
+    # Modifications of the loaded game are written to the file
+    loaded_game.set_value([0], 10.0)
+    assert load_game_from_memmap(str(file), mode="r").get_value([0]) == 10.0
+
+
+def test_load_game_from_memmap_wrong_size(tmpdir) -> None:  # type: ignore
+    file = tmpdir.join("game.bin")
+    file.write_binary(bytes(3 * 8))
+    with pytest.raises(ValueError):
+        load_game_from_memmap(str(file))
+    # The value of the empty coalition only would be a game of no players
+    file.write_binary(bytes(8))
+    with pytest.raises(ValueError):
+        load_game_from_memmap(str(file))
+
+
+def test_save_and_load_game_with_rational_values(tmpdir) -> None:  # type: ignore
+    game = Game(3, dtype=RATIONAL_DTYPE)
+    game.set_values([([0], "1/3"), ([1], 0.1), ([0, 1, 2], 2)])
+    formats: list[tuple[Callable[[Game, str], None], Callable[..., Game], str]]
+    formats = [
+        (save_game_to_json, load_game_from_json, "game.json"),
+        (save_game_to_csv, load_game_from_csv, "game.csv"),
+    ]
+    for save, load, name in formats:
+        file = str(tmpdir.join(name))
+        save(game, file)
+        loaded_game = load(file, dtype=RATIONAL_DTYPE)
+        assert loaded_game.dtype == RATIONAL_DTYPE
+        assert loaded_game == game
+        assert loaded_game.get_value([0]) == mpq(1, 3)
+    with pytest.raises(ValueError):
+        save_game_to_memmap(game, str(tmpdir.join("game.bin")))
+
+
+def test_save_and_load_game_with_dtype(tmpdir) -> None:  # type: ignore
+    game = Game(3, dtype=np.float32)
+    game.set_values([([0], 0.5), ([0, 1], 1.25)])
+    file = str(tmpdir.join("game.json"))
+    save_game_to_json(game, file)
+    assert load_game_from_json(file, dtype=np.float32) == game
+    file = str(tmpdir.join("game.bin"))
+    save_game_to_memmap(game, file)
+    loaded_game = load_game_from_memmap(file, dtype=np.float32)
+    assert loaded_game.dtype == np.float32
+    assert loaded_game == game
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from math import comb
+
+import numpy as np
+import pytest
+from gmpy2 import mpq
+
+from shapleypy.constants import RATIONAL_DTYPE
+from shapleypy.game import Game
+from shapleypy.games_batch import GamesBatch
+from shapleypy.generators import random_game_generator
+from shapleypy.solution_concept.banzhaf_value import banzhaf_value_of_game
+from shapleypy.solution_concept.semivalue import (
+    BANZHAF,
+    SHAPLEY,
+    beta_shapley,
+    semivalue,
+    semivalue_weights,
+    semivalues_of_game,
+)
+from shapleypy.solution_concept.shapley_value import shapley_value_of_game
+
+
+@pytest.fixture
+def game() -> Game:
+    return random_game_generator(6, np.random.default_rng(0))
+
+
+def test_semivalues_of_game(game: Game) -> None:
+    values = semivalues_of_game(game, [SHAPLEY, BANZHAF, beta_shapley(1, 1)])
+    assert values.shape == (3, 6)
+    assert list(values[0]) == list(shapley_value_of_game(game))
+    assert list(values[1]) == list(banzhaf_value_of_game(game))
+    assert values[2] == pytest.approx(values[0])
+    assert semivalue(game, BANZHAF, 2) == values[1][2]
+
+    # Custom weights of the Banzhaf value
+    assert semivalue(game, [1 / 32] * 6) == pytest.approx(values[1])
+    with pytest.raises(ValueError):
+        semivalue(game, [1.0] * 5)
+
+
+@pytest.mark.parametrize(
+    ("alpha", "beta"), [(1, 1), (16, 1), (4, 1), (1, 4), (0.5, 2.5)]
+)
+def test_beta_shapley_weights(alpha: float, beta: float) -> None:
+    n = 7
+    weights, divisor = semivalue_weights(
+        beta_shapley(alpha, beta), n, np.dtype(np.float64)
+    )
+    # The sizes of coalitions are beta-binomial distributed
+    probabilities = [comb(n - 1, s) * weights[s] / divisor for s in range(n)]
+    assert sum(probabilities) == pytest.approx(1.0)
+    assert sum(s * p for s, p in enumerate(probabilities)) == pytest.approx(
+        (n - 1) * beta / (alpha + beta)
+    )
+
+    with pytest.raises(ValueError):
+        beta_shapley(0, 1)
+
+
+@pytest.mark.parametrize("alpha", [1, 4])
+def test_weights_of_many_players(alpha: float) -> None:
+    n = 200
+    weights, divisor = semivalue_weights(
+        beta_shapley(alpha, 1), n, np.dtype(np.float64)
+    )
+    assert np.all(np.isfinite(weights)) and np.isfinite(divisor)
+    total = sum(comb(n - 1, s) * float(weights[s]) for s in range(n))
+    assert total / divisor == pytest.approx(1.0)
+    # The exact weights of rational games are not scaled
+    exact_weights, exact_divisor = semivalue_weights(SHAPLEY, n, RATIONAL_DTYPE)
+    assert exact_weights[0] * n == exact_divisor
+
+
+def test_beta_shapley_efficiency(game: Game) -> None:
+    values = semivalue(game, beta_shapley(1, 1))
+    assert sum(values) == pytest.approx(  # type: ignore
+        game.get_value(range(6))
+    )
+    values = semivalue(game, beta_shapley(0.5, 0.5), n_jobs=2)
+    assert values == pytest.approx(semivalue(game, beta_shapley(0.5, 0.5)))
+
+
+def test_semivalues_of_batch_and_rational_game(game: Game) -> None:
+    other = random_game_generator(6, np.random.default_rng(1))
+    batch = GamesBatch.from_games([game, other])
+    values = semivalues_of_game(batch, [SHAPLEY, beta_shapley(16, 1)])
+    assert values.shape == (2, 2, 6)
+    assert values[1][1] == pytest.approx(semivalue(other, beta_shapley(16, 1)))
+
+    rational_game = Game.from_array([0, 1, 1, 3], dtype=RATIONAL_DTYPE)
+    # Beta(2, 1): weight 2/3 of the empty coalition and 1/3 of the other
+    assert list(semivalue(rational_game, beta_shapley(2, 1))) == [  # type: ignore
+        mpq(4, 3),
+        mpq(4, 3),
+    ]
+    rational_game.set_value([0], 0)
+    assert list(semivalue(rational_game, beta_shapley(2, 1))) == [  # type: ignore
+        mpq(2, 3),
+        mpq(5, 3),
+    ]
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from shapleypy.generators import random_game_generator
+from shapleypy.solution_concept.shapley_sampling import (
+    permutation_sampling_shapley,
+    stratified_sampling_shapley,
+)
+from shapleypy.solution_concept.shapley_value import shapley_value_of_game
+
+
+def test_permutation_sampling_shapley_of_game() -> None:
+    game = random_game_generator(6, np.random.default_rng(42))
+    result = permutation_sampling_shapley(
+        game, generator=np.random.default_rng(0), max_permutations=4000
+    )
+    assert result.number_of_samples == 4000
+    assert result.values.shape == (6,)
+    assert result.standard_errors.shape == (6,)
+    assert np.all(
+        np.abs(result.values - shapley_value_of_game(game))
+        <= 5 * result.standard_errors
+    )
+
+
+def test_permutation_sampling_shapley_is_efficient() -> None:
+    # Every permutation splits exactly v(N) - v(empty)
+    game = random_game_generator(5, np.random.default_rng(1))
+    result = permutation_sampling_shapley(
+        game, generator=np.random.default_rng(0), max_permutations=10
+    )
+    assert np.sum(result.values) == pytest.approx(game._values[-1])
+
+
+def test_permutation_sampling_shapley_of_oracle() -> None:
+    # Additive game has zero variance, so one batch is enough
+    def oracle(coalition_id: int) -> float:
+        return float(sum(i for i in range(8) if coalition_id & (1 << i)))
+
+    result = permutation_sampling_shapley(
+        oracle,
+        number_of_players=8,
+        generator=np.random.default_rng(0),
+        target_error=1e-12,
+        batch_size=16,
+    )
+    assert result.number_of_samples == 16
+    assert result.values == pytest.approx(range(8))
+    assert np.all(result.standard_errors == 0)
+
+
+def test_permutation_sampling_shapley_time_budget() -> None:
+    game = random_game_generator(5, np.random.default_rng(1))
+    result = permutation_sampling_shapley(
+        game, max_permutations=10**9, time_budget=0.0, batch_size=8
+    )
+    assert result.number_of_samples == 8
+
+
+def test_permutation_sampling_shapley_errors() -> None:
+    with pytest.raises(ValueError):
+        permutation_sampling_shapley(lambda _: 0.0)
+    with pytest.raises(ValueError):
+        permutation_sampling_shapley(
+            lambda _: 0.0, number_of_players=3, max_permutations=0
+        )
+
+
+def test_stratified_sampling_shapley_of_game() -> None:
+    game = random_game_generator(8, np.random.default_rng(42))
+    result = stratified_sampling_shapley(
+        game, generator=np.random.default_rng(0), max_evaluations=20_000
+    )
+    assert result.values.shape == (8,)
+    assert result.standard_errors.shape == (8,)
+    assert np.all(
+        np.abs(result.values - shapley_value_of_game(game))
+        <= 5 * result.standard_errors
+    )
+    # Coalitions of sizes 0, ..., 3 cost at most 18 evaluations
+    assert 20_000 - 18 < result.number_of_samples * 18
+
+
+def test_stratified_sampling_shapley_of_oracle() -> None:
+    # Additive game has zero variance, so the first batch is enough
+    def oracle(coalition_id: int) -> float:
+        return float(sum(i for i in range(7) if coalition_id & (1 << i)))
+
+    result = stratified_sampling_shapley(
+        oracle,
+        number_of_players=7,
+        generator=np.random.default_rng(0),
+        target_error=1e-12,
+    )
+    assert result.values == pytest.approx(range(7))
+    assert np.all(result.standard_errors == 0)
+
+    with pytest.raises(ValueError):
+        stratified_sampling_shapley(oracle)
+    with pytest.raises(ValueError):
+        stratified_sampling_shapley(oracle, 7, batch_size=0)
+
+
+def test_stratified_sampling_shapley_budget() -> None:
+    game = random_game_generator(5, np.random.default_rng(1))
+    result = stratified_sampling_shapley(
+        game, max_evaluations=10**9, time_budget=0.0
+    )
+    assert np.all(np.isfinite(result.values))
+    # Too few evaluations to sample every stratum twice
+    result = stratified_sampling_shapley(game, max_evaluations=12)
+    assert result.number_of_samples == 1
+    assert np.any(np.isinf(result.standard_errors))
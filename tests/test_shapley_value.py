@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
+from gmpy2 import mpq
 
 from shapleypy.coalition import Coalition
-from shapleypy.constants import DEFAULT_VALUE
+from shapleypy.constants import DEFAULT_VALUE, RATIONAL_DTYPE
 from shapleypy.game import Game
+from shapleypy.generators import random_game_generator
 from shapleypy.solution_concept.shapley_value import (
     shapley,
     shapley_value_of_game,
     shapley_value_of_player,
 )
+from shapleypy.sparse_game import SparseGame
 
 
 @pytest.fixture
@@ -78,8 +85,12 @@ def test_shapley_value_of_game_with_default_value_warning(
     """
     game = Game(3)
     game.set_values(basic_values_for_game_of_three_with_missing_values)
-    with pytest.warns(RuntimeWarning):
+    with pytest.warns(RuntimeWarning) as record:
         list(shapley_value_of_game(game))
+    # The warning points at the call of the solution concept (the frames of
+    # the package are skipped on Python 3.12+)
+    if sys.version_info >= (3, 12):
+        assert record[0].filename == __file__
 
 
 def test_shapley_value_of_game_with_default_value_without_warning(
@@ -121,3 +132,105 @@ def test_shapley_function(
     game = Game(3)
     game.set_values(basic_values_for_game_of_three_with_missing_values)
     assert list(shapley(game, default_value=5.0)) == [1.5, 1.5, 4.0]  # type: ignore
+
+
+def test_shapley_value_of_game_is_efficient_and_symmetric() -> None:
+    # v(S) = |S|^2 for 6 players, so everyone gets v(N) / n
+    game = Game(6)
+    game.set_values(
+        (coalition, len(coalition) ** 2) for coalition in game.all_coalitions
+    )
+    values = shapley_value_of_game(game)
+    assert values.shape == (6,)
+    assert values == pytest.approx([6.0] * 6)
+    assert shapley_value_of_player(game, 5) == pytest.approx(6.0)
+
+
+def test_shapley_value_of_game_stored_in_file_in_chunks(  # type: ignore
+    monkeypatch, tmpdir
+) -> None:
+    game = random_game_generator(7, np.random.default_rng(0))
+    expected = shapley_value_of_game(game)
+    stored_game = Game(7, filename=str(tmpdir.join("game.bin")))
+    stored_game.set_values(game.get_values())
+    monkeypatch.setattr("shapleypy._chunked.CHUNK_SIZE", 4)
+    assert shapley_value_of_game(stored_game) == pytest.approx(expected)
+    assert shapley_value_of_player(stored_game, 6) == pytest.approx(expected[6])
+
+
+def test_shapley_value_of_game_with_dtype() -> None:
+    game = random_game_generator(5, np.random.default_rng(0))
+    expected = shapley_value_of_game(game)
+    float_game = Game(5, dtype=np.float32)
+    float_game.set_values(game.get_values())
+    values = shapley_value_of_game(float_game)
+    assert values.dtype == np.float32
+    assert values == pytest.approx(expected, rel=1e-5)
+    integer_game = Game(2, dtype=np.int64)
+    integer_game.set_values([([0], 1), ([1], 2), ([0, 1], 6)])
+    assert list(shapley_value_of_game(integer_game)) == [2.5, 3.5]
+
+
+def test_shapley_value_of_game_with_rational_values() -> None:
+    game = Game(5, dtype=RATIONAL_DTYPE)
+    game.set_values(
+        (coalition, mpq(int(coalition.id), 7))
+        for coalition in game.all_coalitions
+    )
+    values = shapley_value_of_game(game)
+    # Exactly efficient (no rounding errors)
+    assert sum(values) == game.get_value(Coalition.grand_coalition(5))
+    assert list(values) == [mpq(2**i, 7) for i in range(5)]
+
+
+def test_shapley_value_of_game_after_modification(
+    basic_values_for_game_of_three_with_missing_values: list[
+        tuple[Coalition, float]
+    ],
+    basic_values_for_game_of_three: list[tuple[Coalition, float]],
+) -> None:
+    # The cached mask of missing values must follow the modifications
+    game = Game(3)
+    game.set_values(basic_values_for_game_of_three_with_missing_values)
+    shapley_value_of_game(game, default_value=5.0)
+    game.set_values(basic_values_for_game_of_three)
+    expected_game = Game(3)
+    expected_game.set_values(basic_values_for_game_of_three)
+    assert list(shapley_value_of_game(game)) == list(
+        shapley_value_of_game(expected_game)
+    )
+    game._values[1:] = np.nan
+    game._values_changed()
+    assert list(shapley_value_of_game(game, default_value=1.0)) == [1 / 3] * 3
+
+
+def test_shapley_value_of_large_game() -> None:
+    # The factorials of 30 players overflow int64, the weights stay floats
+    game = SparseGame(30, default_value=0.0)
+    game.set_values([(range(30), 3.0), ([0], 1.0)])
+    values = shapley_value_of_game(game)
+    assert values.dtype == np.float64
+    assert np.isclose(values[0], 4.0 / 30)
+    assert np.allclose(values[1:], 3.0 / 30 - 1.0 / (30 * 29))
+    assert np.isclose(values.sum(), 3.0)
+
+
+def test_shapley_value_of_game_in_parallel(tmpdir) -> None:  # type: ignore
+    game = random_game_generator(7, np.random.default_rng(0))
+    game._values[[3, 70, 127]] = np.nan
+    game._values_changed()
+    expected = shapley_value_of_game(game, 2.0)
+    assert shapley_value_of_game(game, 2.0, n_jobs=2) == pytest.approx(expected)
+    with ThreadPoolExecutor(3) as executor:
+        assert shapley(game, default_value=2.0, executor=executor) == (
+            pytest.approx(expected)
+        )
+    stored_game = Game(7, filename=str(tmpdir.join("game.bin")))
+    stored_game.set_values(
+        random_game_generator(7, np.random.default_rng(1)).get_values()
+    )
+    assert shapley_value_of_game(stored_game, n_jobs=3) == pytest.approx(
+        shapley_value_of_game(stored_game)
+    )
+    with pytest.raises(ValueError):
+        shapley_value_of_game(game, 2.0, n_jobs=0)
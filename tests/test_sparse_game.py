@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+from gmpy2 import mpq
+
+from shapleypy.coalition import Coalition, CoalitionArray
+from shapleypy.constants import RATIONAL_DTYPE
+from shapleypy.game import Game
+from shapleypy.solution_concept.banzhaf_value import banzhaf_value_of_game
+from shapleypy.solution_concept.shapley_value import (
+    shapley_value_of_game,
+    shapley_value_of_player,
+)
+from shapleypy.sparse_game import SparseGame
+
+
+def random_sparse_game(
+    number_of_players: int,
+    number_of_coalitions: int,
+    default_value: float,
+    generator: np.random.Generator,
+) -> SparseGame:
+    game = SparseGame(number_of_players, default_value)
+    ids = generator.choice(
+        np.arange(1, 2**number_of_players),
+        size=number_of_coalitions,
+        replace=False,
+    )
+    game.set_values(
+        (Coalition(int(id)), float(generator.random())) for id in ids
+    )
+    return game
+
+
+def dense_game(game: SparseGame) -> Game:
+    return Game._from_values_array(game._all_values())
+
+
+def test_set_and_get_value() -> None:
+    game = SparseGame(3)
+    assert game.get_value([]) == 0.0
+    assert np.isnan(game.get_value([0]))
+    game.set_value([0, 2], 1.0)
+    game.set_values([([1], 2.0), ([0, 2], 3.0), ([1], 4.0)])
+    assert game.get_value([0, 2]) == 3.0
+    assert game.get_value(1) == 4.0
+    ids, values = game.defined_coalitions()
+    assert list(ids) == [0, 2, 5]
+    assert list(values) == [0.0, 4.0, 3.0]
+    with pytest.raises(IndexError):
+        game.get_value([0, 3])
+    with pytest.raises(IndexError):
+        game.set_value([3], 1.0)
+    with pytest.raises(TypeError):
+        game.set_value("s", 1.0)  # type: ignore
+
+
+def test_set_and_get_values_of_coalition_array() -> None:
+    game = SparseGame(3, default_value=1.0)
+    game.set_values([3.0, 2.0, 5.0], CoalitionArray([5, 2, 5]))
+    ids, values = game.defined_coalitions()
+    assert list(ids) == [0, 2, 5]
+    assert list(values) == [0.0, 2.0, 5.0]
+    assert game.get_values(CoalitionArray([5, 6, 0])).tolist() == [
+        5.0,
+        1.0,
+        0.0,
+    ]
+    with pytest.raises(IndexError):
+        game.get_values(CoalitionArray([8]))
+    with pytest.raises(IndexError):
+        game.set_values([1.0], CoalitionArray([8]))
+
+
+def test_set_values_one_by_one() -> None:
+    rng = np.random.default_rng(0)
+    game = SparseGame(6)
+    dense = Game(6)
+    for coalition_id in rng.integers(0, 64, size=200):
+        value = float(rng.integers(0, 10))
+        game.set_value(Coalition(int(coalition_id)), value)
+        dense.set_value(Coalition(int(coalition_id)), value)
+    ids, values = game.defined_coalitions()
+    assert np.all(np.diff(ids.astype(np.int64)) > 0)
+    assert values.tolist() == dense._all_values()[ids].tolist()
+    game.set_values(np.array([1.0, 2.0, 3.0]), CoalitionArray([63, 1, 63]))
+    assert game.get_value(Coalition(63)) == 3.0
+    assert game.get_value([0]) == 2.0
+
+
+def test_default_value() -> None:
+    game = SparseGame(2, default_value=5.0)
+    game.set_value([0], 1.0)
+    assert list(game._all_values()) == [0.0, 1.0, 5.0, 5.0]
+    assert list(game._evaluate(np.array([[3, 1], [0, 2]])).ravel()) == [
+        5.0,
+        1.0,
+        0.0,
+        5.0,
+    ]
+    assert game == Game._from_values_array(np.array([0.0, 1.0, 5.0, 5.0]))
+    # Integer games have no missing values
+    assert SparseGame(2, dtype=np.int64).get_value([0, 1]) == 0
+
+
+@pytest.mark.parametrize("default_value", [0.0, 2.5, np.nan])
+def test_shapley_and_banzhaf_values(default_value: float) -> None:
+    generator = np.random.default_rng(0)
+    for number_of_players, number_of_coalitions in [(1, 1), (4, 5), (7, 40)]:
+        game = random_sparse_game(
+            number_of_players, number_of_coalitions, default_value, generator
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            assert shapley_value_of_game(game) == pytest.approx(
+                shapley_value_of_game(dense_game(game))
+            )
+            assert banzhaf_value_of_game(game, 1.0) == pytest.approx(
+                banzhaf_value_of_game(dense_game(game), 1.0)
+            )
+        assert shapley_value_of_player(
+            game, 0, default_value=1.0
+        ) == pytest.approx(shapley_value_of_player(dense_game(game), 0, 1.0))
+
+
+def test_shapley_values_of_many_players() -> None:
+    assert not shapley_value_of_game(SparseGame(200), default_value=0.0).any()
+    values = shapley_value_of_game(SparseGame(200, default_value=1.0))
+    assert values == pytest.approx(np.full(200, 1 / 200))
+
+
+def test_shapley_value_with_default_value_warning() -> None:
+    game = SparseGame(3)
+    game.set_value([0, 1, 2], 3.0)
+    with pytest.warns(RuntimeWarning):
+        shapley_value_of_game(game)
+    game = SparseGame(3, default_value=0.0)
+    game.set_value([0, 1, 2], 3.0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert list(shapley_value_of_game(game)) == [1.0, 1.0, 1.0]
+
+
+def test_shapley_value_with_rational_values() -> None:
+    game = SparseGame(4, default_value=mpq(1, 3), dtype=RATIONAL_DTYPE)
+    game.set_values([([0], "1/7"), ([0, 1, 2, 3], 2)])
+    values = shapley_value_of_game(game)
+    assert sum(values) == 2
+    assert list(values) == list(shapley_value_of_game(dense_game(game)))
+
+
+def test_core() -> None:
+    core = pytest.importorskip(
+        "shapleypy.solution_concept.core", reason="core is not available"
+    )
+    generator = np.random.default_rng(1)
+    for default_value in [-1.0, 0.0, 1.0]:
+        game = SparseGame(4, default_value)
+        game.set_values(
+            (Coalition(int(id)), float(generator.integers(-1, 4)))
+            for id in generator.choice(np.arange(1, 16), 6, replace=False)
+        )
+        assert sorted(core.get_vertices(game)) == sorted(
+            core.get_vertices(dense_game(game))
+        )
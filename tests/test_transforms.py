@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from gmpy2 import mpq
+
+from shapleypy._typing import GameValueInput
+from shapleypy.coalition import Coalition
+from shapleypy.constants import RATIONAL_DTYPE
+from shapleypy.game import Game
+from shapleypy.generators import random_game_generator
+from shapleypy.solution_concept.banzhaf_value import banzhaf_value_of_game
+from shapleypy.solution_concept.shapley_value import shapley_value_of_game
+from shapleypy.transforms import (
+    game_from_dividends,
+    harsanyi_dividends,
+    mobius_transform,
+    zeta_transform,
+)
+
+
+def brute_force_dividends(values: np.ndarray) -> np.ndarray:
+    dividends = np.zeros_like(values)
+    for s in range(len(values)):
+        for t in range(s + 1):
+            if s & t == t:
+                sign = (-1) ** (bin(s).count("1") - bin(t).count("1"))
+                dividends[s] += sign * values[t]
+    return dividends
+
+
+@pytest.mark.parametrize("chunk_size", [None, 1, 4, 16])
+def test_mobius_and_zeta_transform(chunk_size: int | None) -> None:
+    values = np.random.default_rng(0).random(2**6)
+    dividends = mobius_transform(values.copy(), chunk_size)
+    assert dividends == pytest.approx(brute_force_dividends(values))
+    assert zeta_transform(dividends, chunk_size) == pytest.approx(values)
+
+
+def test_transform_in_place_of_leading_axes() -> None:
+    values = np.random.default_rng(1).random((3, 2**5))
+    expected = np.array([brute_force_dividends(row) for row in values])
+    result = mobius_transform(values, chunk_size=4)
+    assert result is values
+    assert values == pytest.approx(expected)
+
+
+def test_transform_of_rational_values() -> None:
+    values = np.array([mpq(i, 3) for i in range(2**4)], dtype=object)
+    dividends = mobius_transform(values.copy(), chunk_size=2)
+    assert list(dividends) == list(brute_force_dividends(values))
+    assert list(zeta_transform(dividends)) == list(values)
+
+
+def test_transform_of_game_stored_in_file(tmpdir) -> None:  # type: ignore
+    game = random_game_generator(5, np.random.default_rng(2))
+    stored_game = Game(5, filename=str(tmpdir.join("game.bin")))
+    stored_game.set_values(game.get_values())
+    mobius_transform(stored_game._values, chunk_size=4)
+    assert stored_game._values == pytest.approx(harsanyi_dividends(game))
+
+
+def test_harsanyi_dividends() -> None:
+    game = Game(2)
+    game.set_values([([0], 1.0), ([1], 2.0), ([0, 1], 5.0)])
+    assert list(harsanyi_dividends(game)) == [0.0, 1.0, 2.0, 2.0]
+    # The game is not modified
+    assert game.get_value(Coalition.grand_coalition(2)) == 5.0
+
+
+def test_harsanyi_dividends_of_game_stored_in_file(  # type: ignore
+    monkeypatch, tmpdir
+) -> None:
+    monkeypatch.setattr("shapleypy._chunked.CHUNK_SIZE", 4)
+    game = random_game_generator(5, np.random.default_rng(3))
+    stored_game = Game(5, filename=str(tmpdir.join("game.bin")))
+    stored_game.set_values(game.get_values())
+    expected = brute_force_dividends(game._all_values())
+    dividends = harsanyi_dividends(stored_game)
+    assert isinstance(dividends, np.memmap)
+    assert dividends == pytest.approx(expected)
+    file = str(tmpdir.join("dividends.bin"))
+    assert harsanyi_dividends(game, file) == pytest.approx(expected)
+    assert np.fromfile(file) == pytest.approx(expected)
+    # The values of the game are not modified
+    assert stored_game == game
+    with pytest.raises(ValueError):
+        harsanyi_dividends(Game(2, dtype=RATIONAL_DTYPE), file)
+
+
+def test_game_from_dividends() -> None:
+    ids = np.array([0, 3, 5, 7, 3], dtype=np.uint32)
+    game = game_from_dividends(3, ids, [9.0, 1.0, 2.0, 4.0, 3.0])
+    # The empty coalition has no dividend, the last dividend of 3 is used
+    expected = np.zeros(8)
+    expected[[3, 5, 7]] = [3.0, 2.0, 4.0]
+    assert np.allclose(harsanyi_dividends(game), expected)
+    known_ids, known_dividends = game._known_dividends()  # type: ignore
+    assert known_ids.tolist() == [3, 5, 7]
+    assert known_dividends.tolist() == [3.0, 2.0, 4.0]
+
+    plain_game = Game.from_array(game._all_values())
+    for solution_concept in (shapley_value_of_game, banzhaf_value_of_game):
+        assert np.allclose(solution_concept(game), solution_concept(plain_game))
+
+    # Modified games are computed from their values
+    game.set_value([0], 1.0)
+    assert game._known_dividends() is None
+    assert shapley_value_of_game(game).sum() == game.get_value([0, 1, 2])
+
+
+def test_game_from_rational_dividends() -> None:
+    dividends: list[GameValueInput] = ["1/3", "1/2", 1]
+    game = game_from_dividends(3, [1, 6, 7], dividends, dtype=RATIONAL_DTYPE)
+    assert list(shapley_value_of_game(game)) == [
+        mpq(2, 3),
+        mpq(7, 12),
+        mpq(7, 12),
+    ]
+    assert list(banzhaf_value_of_game(game)) == [
+        mpq(7, 12),
+        mpq(1, 2),
+        mpq(1, 2),
+    ]
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from shapleypy.game import Game
+from shapleypy.solution_concept.banzhaf_value import (
+    banzhaf,
+    banzhaf_value_of_player,
+)
+from shapleypy.solution_concept.shapley_value import (
+    shapley,
+    shapley_value_of_game,
+)
+from shapleypy.weighted_voting_game import WeightedVotingGame
+
+
+def test_values() -> None:
+    game = WeightedVotingGame(5, [3, 2, 2, 0])
+    assert game.get_value([0, 1]) == 1.0
+    assert game.get_value([1, 2, 3]) == 0.0
+    assert game.get_value([]) == 0.0
+    assert repr(game) == "WeightedVotingGame(quota=5, weights=(3, 2, 2, 0))"
+    # Swings of player 0: {1}, {2}, {1, 2}, {1, 3}, {2, 3}, {1, 2, 3}
+    assert game.swings([0, 3]).tolist() == [6, 0]
+    assert game.swings([0], by_size=True).tolist() == [[0, 2, 3, 1]]
+
+    for quota, weights in [(0, [1]), (1.5, [1]), (2, []), (2, [1, -1])]:
+        with pytest.raises(ValueError):
+            WeightedVotingGame(quota, weights)  # type: ignore
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_indices_match_dense_game(seed: int) -> None:
+    generator = np.random.default_rng(seed)
+    weights = generator.integers(0, 10, size=8).tolist()
+    quota = int(generator.integers(1, sum(weights) + 2))
+    game = WeightedVotingGame(quota, weights)
+    dense = Game.from_array(game._all_values())
+    assert shapley(game) == pytest.approx(shapley(dense))
+    assert banzhaf(game) == pytest.approx(banzhaf(dense))
+    assert banzhaf_value_of_player(game, 3) == pytest.approx(
+        banzhaf_value_of_player(dense, 3)
+    )
+
+
+def test_indices_of_many_players() -> None:
+    # Symmetric players share the index
+    game = WeightedVotingGame(51, [1] * 100)
+    assert shapley(game) == pytest.approx(np.full(100, 0.01))
+    game = WeightedVotingGame(200, [50, 50] + [1] * 198)
+    values = shapley_value_of_game(game)
+    assert sum(values) == pytest.approx(1.0)
+    assert values[0] == values[1] > values[2]
+    assert shapley(game, 2) == values[2]
+    assert banzhaf(game)[0] > banzhaf(game)[2] > 0  # type: ignore